@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+COPYRIGHT STATEMENT:
+
+ChromaQuant – A quantification software for complex gas chromatographic data
+
+Copyright (c) 2026, by Julia Hancock
+              Affiliation: Dr. Julie Elaine Rorrer
+              URL: https://www.rorrerlab.com/
+
+License: BSD 3-Clause License
+
+---
+
+BENCHMARK FOR PEAK MEMORY WHILE MATCHING
+
+Measures the peak resident set size added by one match() call on a
+combined batch table with one million rows, filtered down to a single
+sample before matching. Each measurement runs in a fresh process, and on
+Linux the peak RSS is reset after the input DataFrames are built so that
+it reflects only the match() call.
+
+Usage:
+    python benchmarks/bench_match_memory.py [number_of_rows]
+
+"""
+
+import gc
+import os
+import resource
+import subprocess
+import sys
+import time
+
+
+# Function to get the peak RSS of the current process in kilobytes
+def get_peak_rss() -> int:
+
+    # Try to read the high water mark from /proc (Linux)
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1])
+
+    # If /proc is unavailable, fall back to getrusage
+    except OSError:
+        pass
+
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+# Function to reset the peak RSS of the current process, where possible
+def reset_peak_rss():
+
+    # Collect any garbage left from building the inputs
+    gc.collect()
+
+    # Try to reset the high water mark (Linux 4.0+)
+    try:
+        with open('/proc/self/clear_refs', 'w') as f:
+            f.write('5')
+
+    # Otherwise, the peak includes building the inputs
+    except OSError:
+        pass
+
+    return None
+
+
+# Function to run one measurement in the current process
+def measure(number_of_rows: int):
+
+    import numpy as np
+    import pandas as pd
+    import chromaquant as cq
+
+    # Create a random number generator
+    rng = np.random.default_rng(0)
+
+    # Number of rows in each sample
+    rows_per_sample = 1000
+
+    # Create a combined batch table of integration results
+    first_DF = pd.DataFrame({
+        'Sample': np.arange(number_of_rows) // rows_per_sample,
+        'Signal Name': 'FID1A',
+        'RT': np.round(rng.uniform(1, 60, number_of_rows), 2),
+        'Area': rng.uniform(0, 1e4, number_of_rows),
+        'Height': rng.uniform(0, 1e3, number_of_rows)})
+
+    # Create a components table to match against
+    second_DF = pd.DataFrame({
+        'Component RT': np.round(np.linspace(1, 60, 200), 2),
+        'Compound Name': [f'Compound {i}' for i in range(200)],
+        'Match Factor': rng.uniform(50, 100, 200)})
+
+    # Create a match configuration filtering to one sample
+    match_config = cq.MatchConfig(local_filter_row={'Sample': 0,
+                                                    'Signal Name': 'FID1A'})
+    match_config.add_match_condition(cq.MatchConfig.IS_EQUAL,
+                                     ['RT', 'Component RT'],
+                                     {'error': 0.05})
+    match_config.import_include_col = ['Compound Name', 'Match Factor']
+
+    # Reset and get the peak RSS before matching, in kilobytes
+    reset_peak_rss()
+    peak_before = get_peak_rss()
+
+    # Match the DataFrames
+    start = time.perf_counter()
+    cq.match.match(first_DF, second_DF, match_config)
+    elapsed = time.perf_counter() - start
+
+    # Get the peak RSS after matching, in kilobytes
+    peak_after = get_peak_rss()
+
+    # Get the size of the first DataFrame in megabytes
+    frame_size = first_DF.memory_usage(deep=True).sum() / 2**20
+
+    print(f'rows: {number_of_rows}, '
+          f'first DataFrame: {frame_size:.1f} MB, '
+          f'peak RSS added by match: {(peak_after - peak_before) / 1024:.1f} '
+          f'MB, time: {elapsed:.2f} s')
+
+    return None
+
+
+if __name__ == '__main__':
+
+    # Get the number of rows
+    number_of_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+
+    # If this is the child process, run the measurement
+    if len(sys.argv) > 2 and sys.argv[2] == '--child':
+        measure(number_of_rows)
+
+    # Otherwise, run the measurement in a fresh process
+    # NOTE: A fixed glibc mmap threshold returns freed arrays to the system,
+    # so memory freed while building the inputs is not silently reused
+    else:
+        subprocess.run([sys.executable, __file__, str(number_of_rows),
+                        '--child'],
+                       env=os.environ | {'MALLOC_MMAP_THRESHOLD_': '131072'},
+                       check=True)
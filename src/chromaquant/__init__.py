@@ -1,12 +1,74 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
+"""
 
-from .results import Results
-from .theme import Theme
-from .chart import Chart
-from .formula import Formula
-from .match import MatchConfig
-from .data import Table
-from .data import Value
-from .data import Breakdown
-from .utils import Categories
+ChromaQuant exposes its classes as lazy module attributes, so importing
+the package is fast and the dependencies of every class (e.g., pandas for
+Tables, xlsxwriter for reporting) are only imported when it is first used.
+
+"""
+
+import importlib
+from typing import Any, TYPE_CHECKING
+if TYPE_CHECKING:
+    from .results import Results
+    from .theme import Theme
+    from .chart import Chart
+    from .formula import Formula
+    from .match import MatchConfig
+    from .data import Table
+    from .data import Value
+    from .data import Breakdown
+    from .data import ValueBlock
+    from .utils import Categories
+
+""" CONSTANTS """
+
+# Define the submodule of every lazily imported class
+_LAZY_ATTRIBUTES = {'Results': 'results',
+                    'Theme': 'theme',
+                    'Chart': 'chart',
+                    'Formula': 'formula',
+                    'MatchConfig': 'match',
+                    'Table': 'data',
+                    'Value': 'data',
+                    'Breakdown': 'data',
+                    'ValueBlock': 'data',
+                    'Categories': 'utils'}
+
+# Define the lazily imported submodules
+_LAZY_SUBMODULES = ('chart', 'data', 'formula', 'match', 'results', 'theme',
+                    'utils')
+
+# Define the public classes
+__all__ = list(_LAZY_ATTRIBUTES)
+
+""" FUNCTIONS """
+
+
+# Function to import a class or submodule when first used
+def __getattr__(name: str) -> Any:
+
+    # If the name is a class, import it from its submodule
+    if name in _LAZY_ATTRIBUTES:
+        value = getattr(importlib.import_module(
+            f'.{_LAZY_ATTRIBUTES[name]}', __name__), name)
+
+    # If the name is a submodule, import it
+    elif name in _LAZY_SUBMODULES:
+        value = importlib.import_module(f'.{name}', __name__)
+
+    # Otherwise, raise an error
+    else:
+        raise AttributeError(f'module {__name__!r} has no attribute '
+                             f'{name!r}')
+
+    # Save the value, so it is only imported once
+    globals()[name] = value
+
+    return value
+
+
+# Function to list the package's attributes, including lazy ones
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY_ATTRIBUTES, *_LAZY_SUBMODULES})
@@ -13,3 +13,4 @@ and more.
 from .table import Table
 from .value import Value
 from .breakdown import Breakdown
+from .value_block import ValueBlock
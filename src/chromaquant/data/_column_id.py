@@ -33,6 +33,9 @@ error_logging = setup_error_logging(logger)
 # Define the _ColumnID class
 class _ColumnID:
 
+    # Define the attributes of every column ID
+    __slots__ = ('_multicell_dataset', '_column_name')
+
     # Init method
     def __init__(self,
                  multicell_dataset: Table | Breakdown | None = None,
@@ -241,7 +241,7 @@ class Breakdown(DataSet):
         self._sheet = value
         self._update_breakdown()
         if self._mediator is not None:
-            self._mediator.update_datasets()
+            self._mediator.update_datasets(self)
 
     # Deleter
     @sheet.deleter
@@ -272,7 +272,7 @@ class Breakdown(DataSet):
             raise ValueError(f'Passed start cell is not valid: {e}')
         self._update_breakdown()
         if self._mediator is not None:
-            self._mediator.update_datasets()
+            self._mediator.update_datasets(self)
 
     # Deleter
     @start_cell.deleter
@@ -323,8 +323,8 @@ class Breakdown(DataSet):
 
         criteria : dict[str, str]
             A dictionary containing one or two key-value pairs where the keys
-            are ranges in the DataFrame to aggregate and the values are cell
-            references used in the conditional statement.
+            are names of Table columns to aggregate by and the values are
+            cell references used in the conditional statement.
 
         summarize_column : str, optional
             Name of the column to summarize. Optional for COUNTIFS but required
@@ -333,7 +333,11 @@ class Breakdown(DataSet):
         Returns
         -------
         formula: str
-            The resulting conditional aggregate formula.
+            The resulting conditional aggregate formula. If the Table is
+            split across shards, the conditional aggregates of every shard
+            are combined: summed for SUMIFS and COUNTIFS, divided as sums
+            by counts for AVERAGEIFS, and compared with MIN or MAX over the
+            shards with matches for MINIFS and MAXIFS.
 
         Raises
         ------
@@ -343,35 +347,89 @@ class Breakdown(DataSet):
 
         """
 
-        # Create a blank formula template
-        formula_template = ''
+        # If the conditional aggregate is not COUNTIFS and summarize column
+        # is empty, raise an error
+        if self.conditional_aggregate != 'COUNTIFS' and \
+           summarize_column == '':
+            raise ValueError(('Argument summarize_column cannot be blank for'
+                              'conditional aggregates besides COUNTIFS'))
 
-        # If the conditional aggregate is COUNTIFS...
-        if self.conditional_aggregate == 'COUNTIFS':
+        # Otherwise, pass
+        else:
+            pass
 
-            # Create a COUNTIFS-specific inner formula template
-            formula_template = ''
+        # Function to get the inner formula of every shard
+        def get_shard_templates(with_summarize_column: bool) -> list[str]:
 
-        # Otherwise, if summarize column is not empty...
-        elif summarize_column != '':
-            # Create an inner formula template
-            formula_template = f"{table.reference[summarize_column]['range']}"
+            # Initialize a list of inner formulas
+            templates = []
 
-        # Otherwise, raise an error
-        else:
-            raise ValueError(('Argument summarize_column cannot be blank for'
-                              'conditional aggregates besides COUNTIFS'))
+            # For every shard of the criteria columns...
+            for i in range(len(table.reference[next(iter(criteria))]
+                               ['shards'])):
 
-        # For every key-value pair in criteria...
-        for cell_or_range in criteria:
+                # Create a blank list of formula arguments
+                formula_arguments = []
 
-            # Add criteria range to formula_template
-            formula_template += f', {cell_or_range}'
-            # Add criteria to formula_template
-            formula_template += f', {criteria[cell_or_range]}'
+                # If the aggregate summarizes a column...
+                if with_summarize_column:
+                    # Add the range to summarize
+                    formula_arguments.append(
+                        table.reference[summarize_column]['shards'][i]
+                        ['range'])
 
-        # Get the final formula by wrapping in the passed conditional aggregate
-        formula = f'={self.conditional_aggregate}({formula_template})'
+                # Otherwise, pass
+                else:
+                    pass
+
+                # For every key-value pair in criteria...
+                for column, cell in criteria.items():
+
+                    # Add criteria range to formula arguments
+                    formula_arguments.append(
+                        table.reference[column]['shards'][i]['range'])
+                    # Add criteria to formula arguments
+                    formula_arguments.append(cell)
+
+                # Join the arguments into an inner formula template
+                templates.append(', '.join(formula_arguments))
+
+            return templates
+
+        # Get the inner formula of every shard
+        shard_templates = \
+            get_shard_templates(self.conditional_aggregate != 'COUNTIFS')
+
+        # If the Table has one shard, wrap it in the conditional aggregate
+        if len(shard_templates) == 1:
+            formula = f'={self.conditional_aggregate}({shard_templates[0]})'
+
+        # Otherwise, if the aggregates of every shard can be summed...
+        elif self.conditional_aggregate in ['SUMIFS', 'COUNTIFS']:
+            formula = '=' + '+'.join(f'{self.conditional_aggregate}'
+                                     f'({template})'
+                                     for template in shard_templates)
+
+        # Otherwise, if averaging, divide the sum by the count
+        elif self.conditional_aggregate == 'AVERAGEIFS':
+            formula = \
+                ('=(' + '+'.join(f'SUMIFS({template})'
+                                 for template in shard_templates) +
+                 ')/(' + '+'.join(f'COUNTIFS({template})'
+                                  for template in
+                                  get_shard_templates(False)) + ')')
+
+        # Otherwise, compare the aggregates of every shard with matches
+        # NOTE: Shards without matches are left out as blank text, since
+        # their aggregate is zero
+        else:
+            formula = \
+                (f'={self.conditional_aggregate[:3]}(_xlfn.VSTACK(' +
+                 ', '.join(f'IF(COUNTIFS({count_template}), '
+                           f'{self.conditional_aggregate}({template}), "")'
+                           for template, count_template in
+                           zip(shard_templates,
+                               get_shard_templates(False))) + '))')
 
         return formula
 
@@ -451,7 +509,7 @@ class Breakdown(DataSet):
             header_cell = f'{start_col}${start_row}'
 
             # Define the criteria dictionary
-            criteria = {table.reference[group_by_column]['range']: header_cell}
+            criteria = {group_by_column: header_cell}
 
             # Get a formula string
             formula_string = \
@@ -618,10 +676,8 @@ class Breakdown(DataSet):
                 row_header_cell = f'${row_start_col}{row_start_row}'
 
                 # Define the criteria dictionary
-                criteria = {table.reference[group_by_col_1]['range']:
-                            column_header_cell,
-                            table.reference[group_by_col_2]['range']:
-                            row_header_cell}
+                criteria = {group_by_col_1: column_header_cell,
+                            group_by_col_2: row_header_cell}
 
                 # Get a formula string
                 formula_string = \
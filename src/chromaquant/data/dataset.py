@@ -20,6 +20,7 @@ if TYPE_CHECKING:
 import uuid
 from ..logging_and_handling import setup_logger, setup_error_logging
 from ..theme import Theme
+from ..theme.theme import get_default_theme
 
 """ LOGGING AND HANDLING """
 
@@ -77,6 +78,14 @@ class DataSet:
 
     """
 
+    # Define the attributes of every DataSet
+    # NOTE: slots drop the per-instance dictionary, so DataSets holding
+    # one value (see Value) stay small; child classes may still add a
+    # dictionary by not defining slots
+    __slots__ = ('_version', 'type', '_start_cell', '_sheet', '_header',
+                 '_reference', 'start_column', 'start_row', '_data', 'id',
+                 '_mediator', '_theme')
+
     # Initialize
     def __init__(self,
                  data: Any = float('nan'),
@@ -86,12 +95,16 @@ class DataSet:
                  header: str = '',
                  results: Results | None = None):
 
+        # Initialize a version counter, incremented whenever the data, sheet,
+        # start cell or header is set so cached references can be reused
+        self._version = 0
+
         # Initialize instance attributes
         self.type = type
         self._start_cell = start_cell if start_cell != '' else '$A$1'
         self._sheet = sheet if sheet != '' else 'Sheet1'
         self._header = header
-        self._reference: dict[str, Any] = {}
+        self._reference: dict[str, Any] | None = None
         self.start_column, self.start_row = \
             self.get_cell_indices(self._start_cell)
 
@@ -105,8 +118,8 @@ class DataSet:
         self._mediator = None
         self.mediator = results
 
-        # Create default theme
-        self._theme = Theme()
+        # Use the shared default theme until the theme is got or set
+        self._theme: Theme | None = None
 
     # Define the object representation by including its data
     def __repr__(self):
@@ -120,7 +133,7 @@ class DataSet:
         Get the current reference object for the DataSet. Unable to set
         or delete this value as it is managed internally.
         """
-        return self._reference
+        return self._reference if self._reference is not None else {}
 
     # Data properties
     # Getter
@@ -136,11 +149,13 @@ class DataSet:
     @data.setter
     def data(self, value: Any) -> None:
         self._data = value
+        self._version += 1
 
     # Deleter
     @data.deleter
     def data(self) -> None:
         del self._data
+        self._version += 1
 
     # Sheet properties
     # Getter
@@ -157,13 +172,15 @@ class DataSet:
         if value == '':
             raise ValueError('Worksheet cannot be an empty string.')
         self._sheet = value
+        self._version += 1
         if self._mediator is not None:
-            self._mediator.update_datasets()
+            self._mediator.update_datasets(self)
 
     # Deleter
     @sheet.deleter
     def sheet(self):
         self._sheet = 'Sheet1'
+        self._version += 1
 
     # Start cell properties
     # Getter
@@ -184,8 +201,9 @@ class DataSet:
             self._start_cell = value
         except Exception as e:
             raise ValueError(f'Passed start cell is not valid: {e}')
+        self._version += 1
         if self._mediator is not None:
-            self._mediator.update_datasets()
+            self._mediator.update_datasets(self)
 
     # Deleter
     @start_cell.deleter
@@ -194,6 +212,7 @@ class DataSet:
         self._start_cell = '$A$1'
         # Get the cell's absolute indices
         self.start_column, self.start_row = self.get_cell_indices('$A$1')
+        self._version += 1
 
     # Header properties
     # Getter
@@ -208,15 +227,17 @@ class DataSet:
     @header.setter
     def header(self, value: str):
         self._header = value
+        self._version += 1
         if self._mediator is not None:
-            self._mediator.update_datasets()
+            self._mediator.update_datasets(self)
 
     # Deleter
     @header.deleter
     def header(self):
         self._header = ''
+        self._version += 1
         if self._mediator is not None:
-            self._mediator.update_datasets()
+            self._mediator.update_datasets(self)
 
     # Mediator properties
     # Getter
@@ -247,9 +268,32 @@ class DataSet:
     # Only allow getting and setting
     # Getter
     @property
-    def theme(self):
+    def theme(self) -> Theme:
+        """
+        Get or set the Theme used to format the DataSet. DataSets share a
+        frozen default Theme, copied the first time it is got so the copy
+        can be modified.
+        """
+        # If the DataSet uses the shared default theme, copy it
+        if self._theme is None:
+            self._theme = get_default_theme().copy()
+
+        # Otherwise, pass
+        else:
+            pass
+
         return self._theme
 
+    # Define the active theme property, ONLY DEFINE GETTER
+    @property
+    def active_theme(self) -> Theme:
+        """
+        Get the Theme used to format the DataSet, without copying the shared
+        default Theme. Used when reporting, so must not be modified.
+        """
+        return self._theme if self._theme is not None \
+            else get_default_theme()
+
     # Setter
     @theme.setter
     def theme(self, value: Theme):
@@ -24,7 +24,19 @@ from ._column_id import _ColumnID
 from ..formula import Formula
 from ..logging_and_handling import setup_logger, setup_error_logging
 from ..match import match, MatchConfig
-from ..utils import get_molecular_weight, get_number_element_atoms, Categories
+from ..utils import get_molecular_weight, get_number_element_atoms, \
+                    Categories, row_filter
+
+""" CONSTANTS """
+
+# Maximum number of rows in an Excel worksheet
+EXCEL_MAX_ROWS = 1048576
+
+# Maximum number of columns in an Excel worksheet
+EXCEL_MAX_COLUMNS = 16384
+
+# Maximum length of an Excel worksheet name
+EXCEL_MAX_SHEET_NAME = 31
 
 """ LOGGING AND HANDLING """
 
@@ -84,6 +96,9 @@ class Table(DataSet):
         # Create a default DataFrame
         data_frame = data_frame if data_frame is not None else pd.DataFrame()
 
+        # Initialize the key describing the state the reference was built for
+        self._reference_key: tuple[Any, ...] | None = None
+
         # Run DataSet initialization
         super().__init__(data=data_frame,
                          start_cell=start_cell,
@@ -111,6 +126,7 @@ class Table(DataSet):
     @data.setter
     def data(self, value: pd.DataFrame | None):
         self._data = value
+        self._version += 1
         self._update_table()
 
     # Deleter
@@ -118,6 +134,7 @@ class Table(DataSet):
     def data(self):
         del self._data
         self._data = pd.DataFrame()
+        self._version += 1
         self._update_table()
 
     # Footprint
@@ -141,9 +158,10 @@ class Table(DataSet):
         # Get the starting column's letter
         start_column = get_column_letter(start_column_index + 1)
 
-        # Find the final column index by adding the length of the columns
-        # attribute
-        end_column_index = start_column_index + len(self.columns)
+        # Find the final column index by adding the number of columns in the
+        # first shard
+        end_column_index = start_column_index + \
+            min(len(self.columns), EXCEL_MAX_COLUMNS - start_column_index)
 
         # Get the final column letter
         end_column = get_column_letter(end_column_index)
@@ -174,11 +192,27 @@ class Table(DataSet):
     def reference(self):
         """
         Get the current reference object for the DataSet. Unable to set
-        or delete this value as it is managed internally.
+        or delete this value as it is managed internally. The reference is
+        cached and only rebuilt after the data, sheet, start cell or header
+        change.
         """
         self._update_table()
         return self._reference
 
+    # Define the shard layout property
+    # Only give shard layout a getter
+    @property
+    def shard_layout(self) -> list[dict[str, Any]]:
+        """
+        Get the layout of the Table's shards. Tables with more rows or
+        columns than fit in an Excel worksheet are split into shards, each
+        reported to its own sheet. Every shard is a dictionary with the
+        'sheet' it is reported to and the 'rows' and 'columns' of the data
+        it holds, as (start, stop) positions.
+        """
+        self._update_table()
+        return [dict(shard) for shard in self._shard_layout]
+
     # Sheet properties
     # Getter
     @property
@@ -194,14 +228,16 @@ class Table(DataSet):
         if value == '':
             raise ValueError('Table sheet cannot be an empty string.')
         self._sheet = value
+        self._version += 1
         self._update_table()
         if self._mediator is not None:
-            self._mediator.update_datasets()
+            self._mediator.update_datasets(self)
 
     # Deleter
     @sheet.deleter
     def sheet(self):
         self._sheet = 'Sheet1'
+        self._version += 1
         self._update_table()
 
     # Start cell properties
@@ -225,9 +261,10 @@ class Table(DataSet):
         # If an exception occurs...
         except Exception as e:
             raise ValueError(f'Passed start cell is not valid: {e}')
+        self._version += 1
         self._update_table()
         if self._mediator is not None:
-            self._mediator.update_datasets()
+            self._mediator.update_datasets(self)
 
     # Deleter
     @start_cell.deleter
@@ -236,6 +273,7 @@ class Table(DataSet):
         self._start_cell = '$A$1'
         # Get the cell's absolute indices
         self.start_column, self.start_row = self.get_cell_indices('$A$1')
+        self._version += 1
         self._update_table()
 
     """ METHODS """
@@ -451,11 +489,24 @@ class Table(DataSet):
 
     # Method to get the insert string for a given column
     @error_logging
-    def insert(self, column: str, range: bool = False) -> str:
+    def insert(self,
+               column: str,
+               range: bool = False,
+               row: int | None = None) -> str:
         """
         Method that returns a unique identifier within a string insert. Used
         when composing dynamic formulas for reporting to Excel.
 
+        Parameters
+        ----------
+        column : str
+            Name of the column to insert.
+        range : bool, optional
+            Whether to insert the column's whole range, by default False.
+        row : int | None, optional
+            Position of one row whose cell to insert, by default None
+            (insert the column).
+
         Returns
         -------
         insert: str
@@ -468,6 +519,11 @@ class Table(DataSet):
             # Set insert to a Table's column range insert
             insert = f'|table: {self.id}, key: {column}, range: True|'
 
+        # Otherwise, if a row is given...
+        elif row is not None:
+            # Set insert to a Table's cell insert
+            insert = f'|table: {self.id}, key: {column}, row: {row}|'
+
         # Otherwise...
         else:
             # Set insert to Table's column insert
@@ -507,6 +563,74 @@ class Table(DataSet):
 
         return None
 
+    # Method to get the Table's shards
+    def get_shards(self) -> list[Table]:
+        """
+        Method to get a Table for every shard of the current Table (see
+        shard_layout), sharing its header, start cell and theme. If the
+        Table fits in one worksheet, the only shard is the Table itself.
+
+        Returns
+        -------
+        list[Table]
+            Tables holding the data of every shard.
+
+        """
+
+        # Get the shard layout
+        shard_layout = self.shard_layout
+
+        # If there is only one shard, return the Table itself
+        if len(shard_layout) == 1:
+            return [self]
+
+        # Otherwise, pass
+        else:
+            pass
+
+        # Initialize a list of shards
+        shards = []
+
+        # For every shard...
+        for shard in shard_layout:
+
+            # Create a Table holding the shard's data
+            shard_table = Table(self._data.iloc[slice(*shard['rows']),
+                                                slice(*shard['columns'])],
+                                start_cell=self.start_cell,
+                                sheet=shard['sheet'],
+                                header=self.header)
+
+            # Share the Table's theme, or the shared default theme
+            shard_table._theme = self._theme
+
+            # Add the shard
+            shards.append(shard_table)
+
+        return shards
+
+    # Method to get the rows of the current data meeting a filter
+    @error_logging
+    def filter(self, filter_dict: dict[str, Any]) -> pd.DataFrame:
+        """
+        Method to get the rows of the Table's data that meet a row filter
+        specification, leaving the Table itself unchanged.
+
+        Parameters
+        ----------
+        filter_dict : dict[str, Any]
+            Dictionary containing column names as keys and either desired
+            cell values or dictionaries of filter operators as values (see
+            MatchConfig.local_filter_row).
+
+        Returns
+        -------
+        filter_DF : pd.DataFrame
+            Rows of the Table's data meeting every condition.
+        """
+
+        return row_filter(self._data, filter_dict)
+
     # Method to match one dataframe to current data
     def match(self,
               import_DF: pd.DataFrame,
@@ -533,7 +657,8 @@ class Table(DataSet):
     @error_logging
     def _update_reference(self):
         """
-        Method that updates the Table's reference dictionary.
+        Method that updates the Table's reference dictionary and the layout
+        of its shards.
 
         Returns
         -------
@@ -541,61 +666,134 @@ class Table(DataSet):
 
         """
 
-        # For every column in columns...
-        for column in self.columns:
+        # Update the layout of the Table's shards
+        self._update_shard_layout()
 
-            # Get the start cell's column letter, adjusting from absolute
-            col_letter = \
-                self._get_column_letter_wrt_start_cell(column,
-                                                       self._data,
-                                                       self.start_column + 1)
+        # Get the first data row, adjusting from absolute
+        first_row = self.start_row + (3 if self.header != '' else 2)
 
-            # Get a Boolean indicating whether the Table has a header
-            has_header = False if self.header == '' else True
+        # For every shard...
+        for shard in self._shard_layout:
 
-            # If there is a header...
-            if has_header:
+            # Get the shard's first and last row, adjusting from absolute
+            start_row = first_row
+            end_row = first_row + shard['rows'][1] - shard['rows'][0] - 1
 
-                # Get a start row, adjusting from absolute
-                start_row = self.start_row + 3
+            # Get the sheet prefix used in every range reference
+            sheet_prefix = f"'{shard['sheet']}'!"
 
-                # Get an end row, adjusting from absolute
-                end_row = self.start_row + 2 + self.length
+            # For every column in the shard, getting column letters from
+            # the column's position in the shard, adjusting from absolute
+            for column_index, column in enumerate(
+                    self.columns[shard['columns'][0]:shard['columns'][1]]):
 
-                # Get a range reference, adjusting from absolute
-                column_range = (f"'{self._sheet}'!"
-                                f"${col_letter}${start_row}:"
-                                f"${col_letter}${end_row}")
+                # Get the column's letter
+                col_letter = get_column_letter(self.start_column + 1 +
+                                               column_index)
 
                 # Get a plain range reference
                 plain_range = (f"${col_letter}${start_row}:"
                                f"${col_letter}${end_row}")
 
-            # If there isn't a header...
-            else:
-                # Get a start row, adjusting from absolute
-                start_row = self.start_row + 2
+                # Get the column's reference within the shard
+                shard_reference = \
+                    {'column_letter': col_letter,
+                     'start_row': start_row,
+                     'end_row': end_row,
+                     'sheet': shard['sheet'],
+                     'length': shard['rows'][1] - shard['rows'][0],
+                     'range': sheet_prefix + plain_range,
+                     'plain_range': plain_range}
+
+                # If the column has no reference yet, use the first shard's
+                # reference with the length of the whole column
+                if column not in self._reference:
+                    self._reference[column] = \
+                        {**shard_reference,
+                         'length': self.length,
+                         'shards': [shard_reference]}
+
+                # Otherwise, add the shard's reference
+                else:
+                    self._reference[column]['shards'].append(shard_reference)
 
-                # Get an end row, adjusting from absolute
-                end_row = self.start_row + 1 + self.length
+        return None
 
-                # Get a range reference, adjusting from absolute
-                column_range = (f"'{self._sheet}'!"
-                                f"${col_letter}${start_row}:"
-                                f"${col_letter}${end_row}")
+    # Method to update the layout of the Table's shards
+    def _update_shard_layout(self):
+        """
+        Method that splits the Table into shards fitting within Excel's
+        worksheet limits. Every shard repeats the header and column names
+        at the Table's start cell. The first shard is on the Table's sheet
+        and every other shard is on a continuation sheet named after it,
+        skipping names taken by other DataSets and Charts.
 
-                # Get a plain range reference
-                plain_range = column_range.split('!')[-1]
-
-            # Update the reference object
-            self._reference[column] = \
-                {'column_letter': col_letter,
-                 'start_row': start_row,
-                 'end_row': end_row,
-                 'sheet': self._sheet,
-                 'length': self.length,
-                 'range': column_range,
-                 'plain_range': plain_range}
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        ValueError
+            If the start cell leaves no room for data rows or columns.
+
+        """
+
+        # Get the number of data rows and columns that fit below and to the
+        # right of the start cell
+        shard_rows = EXCEL_MAX_ROWS - self.start_row - \
+            (2 if self.header != '' else 1)
+        shard_columns = EXCEL_MAX_COLUMNS - self.start_column
+
+        # If no data rows or columns fit, raise an error
+        if shard_rows < 1 or shard_columns < 1:
+            raise ValueError('Table start cell leaves no room for data.')
+
+        # Otherwise, pass
+        else:
+            pass
+
+        # Get the bounds of every block of rows and columns, keeping one
+        # block even if the Table is empty
+        row_blocks = [(first, min(first + shard_rows, self.length))
+                      for first in range(0, max(self.length, 1),
+                                         shard_rows)]
+        column_blocks = [(first, min(first + shard_columns,
+                                     len(self.columns)))
+                         for first in range(0, max(len(self.columns), 1),
+                                            shard_columns)]
+
+        # Get the sheets other DataSets and Charts are reported to
+        taken_sheets = self._get_taken_sheets()
+
+        # Initialize the layout
+        self._shard_layout = []
+
+        # Initialize the index of the next continuation sheet
+        index = 1
+
+        # For every block of rows and columns...
+        for rows in row_blocks:
+            for columns in column_blocks:
+
+                # If the shard is the first, use the Table's sheet
+                if not self._shard_layout:
+                    sheet = self._sheet
+
+                # Otherwise, get the next continuation sheet whose name is
+                # not taken
+                else:
+                    sheet = self._get_continuation_sheet(self._sheet, index)
+                    while sheet in taken_sheets:
+                        index += 1
+                        sheet = \
+                            self._get_continuation_sheet(self._sheet, index)
+                    index += 1
+
+                # Add the shard
+                self._shard_layout.append({'sheet': sheet,
+                                           'rows': rows,
+                                           'columns': columns})
 
         return None
 
@@ -603,7 +801,8 @@ class Table(DataSet):
     @error_logging
     def _update_table(self):
         """
-        Method that updates the current Table.
+        Method that updates the current Table, rebuilding the reference only
+        if the Table changed since it was last built.
 
         Returns
         -------
@@ -611,6 +810,30 @@ class Table(DataSet):
 
         """
 
+        # Get a key describing the current state of the Table
+        # NOTE: The data and its columns are compared by identity, so
+        # in-place edits that add, remove or rename columns or change the
+        # number of rows are also detected, as are changes to the sheets
+        # taken by other DataSets and Charts
+        reference_key = (self._version,
+                         self._data,
+                         self._data.columns,
+                         len(self._data),
+                         self._get_taken_sheets())
+
+        # If the reference was built for the current state, keep it
+        if self._reference_key is not None and \
+           self._reference_key[0] == reference_key[0] and \
+           self._reference_key[1] is reference_key[1] and \
+           self._reference_key[2] is reference_key[2] and \
+           self._reference_key[3] == reference_key[3] and \
+           self._reference_key[4] == reference_key[4]:
+            return None
+
+        # Otherwise, pass
+        else:
+            pass
+
         # Update the length header
         self.length: int = \
             len(self._data)
@@ -622,6 +845,11 @@ class Table(DataSet):
         # Initialize the reference object
         self._reference = {}
 
+        # Initialize the shard layout with one shard holding the Table
+        self._shard_layout = [{'sheet': self._sheet,
+                               'rows': (0, self.length),
+                               'columns': (0, len(self.columns))}]
+
         # Try to update the reference
         # NOTE: will not work if there is no valid sheet or start_cell
         try:
@@ -631,9 +859,70 @@ class Table(DataSet):
             # logger.info('Failed to update reference.')
             pass
 
+        # Save the key the reference was built for
+        self._reference_key = reference_key
+
         return None
 
+    # Method to get the sheets taken by other DataSets and Charts
+    def _get_taken_sheets(self) -> set[str]:
+        """
+        Method that returns the sheets other DataSets and Charts in the
+        Table's Results are reported to, which continuation sheets must
+        not reuse.
+
+        Returns
+        -------
+        set[str]
+            Names of the sheets, empty if the Table has no Results.
+
+        """
+
+        # If the Table has no Results, no sheets are taken
+        if self._mediator is None:
+            return set()
+
+        # Otherwise, pass
+        else:
+            pass
+
+        return self._mediator.get_sheets() - {self._sheet}
+
     """ STATIC METHODS """
+    # Static method to get the name of a continuation sheet
+    @staticmethod
+    def _get_continuation_sheet(sheet: str, index: int) -> str:
+        """
+        Static method that returns the name of the sheet holding a shard,
+        truncating the original sheet name to fit Excel's limit.
+
+        Parameters
+        ----------
+        sheet : str
+            Name of the sheet holding the first shard.
+        index : int
+            Index of the shard.
+
+        Returns
+        -------
+        str
+            Name of the sheet holding the shard.
+
+        """
+
+        # If the shard is the first, use the original sheet
+        if index == 0:
+            return sheet
+
+        # Otherwise, pass
+        else:
+            pass
+
+        # Get the suffix numbering the shard
+        suffix = f' ({index + 1})'
+
+        return sheet[:EXCEL_MAX_SHEET_NAME - len(suffix)] + suffix
+
     # Static method to get the letter coordinate of a column in a DataFrame
     # with respect to a starting column index
     @staticmethod
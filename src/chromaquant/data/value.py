@@ -63,8 +63,17 @@ class Value(DataSet):
     ValueError
         If start_cell is set to an invalid Excel cell.
 
+    Notes
+    -----
+    Values define no attributes beyond those of DataSet, so they have no
+    per-instance dictionary, and their reference is only built when got.
+    To report many values at once, see ValueBlock.
+
     """
 
+    # Define no attributes beyond those of DataSet
+    __slots__ = ()
+
     def __init__(self,
                  data: Any = float('nan'),
                  start_cell: str = '',
@@ -80,21 +89,19 @@ class Value(DataSet):
                          header=header,
                          results=results)
 
-        # Update the value
-        self._update_value()
-
     """ PROPERTIES """
     # Define the reference property, ONLY DEFINE GETTER
     @property
     def reference(self):
         """
         Get the current reference object for the DataSet. Unable to set
-        or delete this value as it is managed internally.
+        or delete this value as it is managed internally. The reference is
+        built when got, so Values that are never referenced build none.
         """
         self._update_value()
         return self._reference
 
-    # Redefining properties to include update_value
+    # Redefining properties, since the reference is rebuilt when got
     # Data properties
     # Getter
     @property
@@ -109,13 +116,11 @@ class Value(DataSet):
     @data.setter
     def data(self, value: Any):
         self._data = value
-        self._update_value()
 
     # Deleter
     @data.deleter
     def data(self):
         del self._data
-        self._update_value()
 
     # Sheet properties
     # Getter
@@ -132,17 +137,15 @@ class Value(DataSet):
         if value == '':
             raise ValueError('Value sheet cannot be an empty string.')
         self._sheet = value
-        self._update_value()
         if self._mediator is not None:
-            self._mediator.update_datasets()
+            self._mediator.update_datasets(self)
 
     # Deleter
     @sheet.deleter
     def sheet(self):
         self._sheet = 'Sheet1'
-        self._update_value()
         if self._mediator is not None:
-            self._mediator.update_datasets()
+            self._mediator.update_datasets(self)
 
     # Start cell properties
     # Getter
@@ -163,9 +166,8 @@ class Value(DataSet):
             self._start_cell = value
         except Exception as e:
             raise ValueError(f'Passed start cell is not valid: {e}')
-        self._update_value()
         if self._mediator is not None:
-            self._mediator.update_datasets()
+            self._mediator.update_datasets(self)
 
     # Deleter
     @start_cell.deleter
@@ -174,9 +176,8 @@ class Value(DataSet):
         self._start_cell = '$A$1'
         # Get the cell's absolute indices
         self.start_column, self.start_row = self.get_cell_indices('$A$1')
-        self._update_value()
         if self._mediator is not None:
-            self._mediator.update_datasets()
+            self._mediator.update_datasets(self)
 
     """ METHODS """
     # Method to get the Value insert string
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+
+The ValueBlock class allows users to store many single values (e.g.,
+per-sample areas or masses) in one array, reported as a contiguous range.
+
+"""
+
+from __future__ import annotations
+
+import logging
+import numpy as np
+import pandas as pd
+from typing import Any, TYPE_CHECKING
+if TYPE_CHECKING:
+    from ..results import Results
+from .table import Table
+from ..logging_and_handling import setup_logger, setup_error_logging
+
+""" CONSTANTS """
+
+# Name of the column holding the names of the values
+NAME_COLUMN = 'Name'
+
+# Name of the column holding the values
+VALUE_COLUMN = 'Value'
+
+""" LOGGING AND HANDLING """
+
+# Create a logger
+logger = logging.getLogger(__name__)
+
+# Format the logger
+logger = setup_logger(logger)
+
+# Get an error logging decorator
+error_logging = setup_error_logging(logger)
+
+""" CLASS """
+
+
+# Define the ValueBlock class
+class ValueBlock(Table):
+    """
+    Class used to store many single values in one array alongside
+    reporting information. The values are reported as one column of
+    contiguous cells, with their names in the column to its left if given.
+
+    Parameters
+    ----------
+    values : Any, optional
+        One-dimensional array-like of values to be stored.
+
+    names : list[str] | None, optional
+        Names of the values, by default None (report no names).
+
+    start_cell : str, optional
+        Reference to cell in Excel where the block will be reported,
+        referring to the top-left of report range. Must be a valid Excel
+        cell (e.g., 'A1', '$B$2').
+
+    sheet : str, optional
+        Name of Excel worksheet (sheet within workbook) where data will
+        be reported.
+
+    header: str, optional
+        Header to add above the block, equivalent to a title.
+
+    dtype : Any, optional
+        NumPy type of the array of values, by default float.
+
+    results: Results, optional
+        Results object that mediates this DataSet.
+
+    Raises
+    ------
+    ValueError
+        If the values are not one-dimensional.
+    ValueError
+        If the names and values have different lengths.
+
+    Notes
+    -----
+    A ValueBlock is a Table with a name and a value column, so Results
+    report, reference and export it like any Table. Each value costs one
+    array item instead of one Value. Use cell to reference a single value
+    in formulas.
+
+    Examples
+    --------
+    >>> areas = cq.ValueBlock(is_areas, names=sample_names,
+    ...                       start_cell='B2', sheet='IS Areas')
+    >>> results.add_table(areas)
+    >>> formula = cq.Formula(f'={areas.cell(0)}*2', key_pointer=value.id)
+
+    """
+
+    def __init__(self,
+                 values: Any = (),
+                 names: list[str] | None = None,
+                 start_cell: str = '',
+                 sheet: str = '',
+                 header: str = '',
+                 dtype: Any = float,
+                 results: Results = None):
+
+        # Get the values as one array
+        values = np.asarray(values, dtype=dtype)
+
+        # If the values are not one-dimensional, raise an error
+        if values.ndim != 1:
+            raise ValueError('ValueBlock values must be one-dimensional.')
+
+        # Otherwise, pass
+        else:
+            pass
+
+        # If there are names of a different length, raise an error
+        if names is not None and len(names) != len(values):
+            raise ValueError('ValueBlock names and values must have the '
+                             'same length.')
+
+        # Otherwise, pass
+        else:
+            pass
+
+        # Get the columns, with names first if given
+        columns = {VALUE_COLUMN: values} if names is None \
+            else {NAME_COLUMN: list(names), VALUE_COLUMN: values}
+
+        # Run Table initialization with a DataFrame referencing the array
+        super().__init__(data_frame=pd.DataFrame(columns, copy=False),
+                         start_cell=start_cell,
+                         sheet=sheet,
+                         header=header,
+                         results=results)
+
+    # Define the length of the ValueBlock
+    def __len__(self) -> int:
+        return len(self._data)
+
+    # Define getting one value by position
+    def __getitem__(self, index: int) -> Any:
+        return self._data[VALUE_COLUMN].iat[index]
+
+    # Define setting one value by position
+    def __setitem__(self, index: int, value: Any):
+
+        # Set the value
+        self._data.iat[index, self._data.columns.get_loc(VALUE_COLUMN)] = \
+            value
+
+        # Increment the version counter
+        self._version += 1
+
+    """ PROPERTIES """
+    # Values property, ONLY DEFINE GETTER
+    @property
+    def values(self) -> np.ndarray:
+        """
+        Get the array of values stored in the ValueBlock.
+        """
+        return self._data[VALUE_COLUMN].to_numpy()
+
+    # Names property, ONLY DEFINE GETTER
+    @property
+    def names(self) -> list[str] | None:
+        """
+        Get the names of the values, or None if the ValueBlock has none.
+        """
+        return self._data[NAME_COLUMN].tolist() \
+            if NAME_COLUMN in self._data.columns else None
+
+    """ METHODS """
+    # Method to get the cell insert of one value
+    @error_logging
+    def cell(self, index: int) -> str:
+        """
+        Method that returns the insert of the cell a value is reported to,
+        resolved to the cell's reference when the report is written. Used
+        when composing formulas referencing one value.
+
+        Parameters
+        ----------
+        index : int
+            Position of the value.
+
+        Returns
+        -------
+        str
+            Formula insert containing the ValueBlock's identifier and the
+            value's position.
+
+        Raises
+        ------
+        IndexError
+            If the position is out of range.
+
+        """
+
+        # If the position is out of range, raise an error
+        if not 0 <= index < len(self):
+            raise IndexError(f'ValueBlock index {index} is out of range.')
+
+        # Otherwise, pass
+        else:
+            pass
+
+        return self.insert(VALUE_COLUMN, row=index)
@@ -9,4 +9,5 @@ patterns for use in Excel report formula creation.
 """
 
 from .formula import Formula
+from .evaluation import FormulaEvaluator
 from .base_formulas import *
@@ -0,0 +1,1821 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+
+The evaluation submodule computes the values of formulas without Excel.
+Formula strings are parsed into expression trees, which are evaluated with
+NumPy against the Tables, Values and Breakdowns of a Results instance.
+Formulas output to a Table column are evaluated once for the whole column
+from their template rather than once per row.
+
+Only the subset of Excel used in ChromaQuant reports is supported:
+arithmetic (+, -, *, /, ^), IF, IFERROR, INDEX, exact MATCH, VSTACK, SUM,
+AVERAGE, MIN, MAX, COUNT, SUMIFS, COUNTIFS, AVERAGEIFS, MINIFS and MAXIFS.
+Excel errors (e.g., #DIV/0! or #N/A) are represented as NaN carrying the
+kind of error (see get_error_code).
+
+"""
+
+import logging
+import numpy as np
+import re
+from functools import cached_property, lru_cache
+from openpyxl.utils import coordinate_to_tuple
+from pandas import DataFrame, factorize
+from typing import Any
+from .formula import Formula, _parse_formula_inserts
+from ..logging_and_handling import setup_logger, setup_error_logging
+
+""" CONSTANTS """
+
+# Regular expression matching one token of a formula string
+FORMULA_TOKEN_PATTERN = re.compile(r"""
+    \s*(?:
+    (?P<insert>\|[^|]*\|)|
+    (?P<string>"(?:[^"]|"")*")|
+    (?P<function>[A-Za-z_][A-Za-z0-9_.]*(?=\s*\())|
+    (?P<reference>(?:(?:'(?:[^']|'')+'|[A-Za-z_][A-Za-z0-9_.]*)!)?
+        \$?[A-Za-z]{1,3}\$?[0-9]+(?::\$?[A-Za-z]{1,3}\$?[0-9]+)?)|
+    (?P<number>(?:[0-9]+\.?[0-9]*|\.[0-9]+)(?:[eE][-+]?[0-9]+)?)|
+    (?P<boolean>TRUE|FALSE)|
+    (?P<operator>[-+*/^(),])
+    )""", re.VERBOSE)
+
+# Functions supported by the evaluator
+EVALUATION_FUNCTIONS = ['IF', 'IFERROR', 'INDEX', 'MATCH', 'VSTACK',
+                        'SUM', 'AVERAGE', 'MIN', 'MAX', 'COUNT',
+                        'SUMIFS', 'COUNTIFS', 'AVERAGEIFS', 'MINIFS', 'MAXIFS']
+
+# Prefix of functions added to Excel after the file format was defined
+FUTURE_FUNCTION_PREFIX = '_XLFN.'
+
+# Regular expression splitting a criterion into an operator and operand
+CRITERION_PATTERN = re.compile(r'(<=|>=|<>|<|>|=)?(.*)$', re.DOTALL)
+
+# Excel error codes, in the order of their ERROR.TYPE numbers
+ERROR_CODES = ('#NULL!', '#DIV/0!', '#VALUE!', '#REF!', '#NAME?', '#NUM!',
+               '#N/A')
+
+# Bits of a quiet NaN, and the mask of the payload bits it can carry
+NAN_BITS = 0x7FF8000000000000
+NAN_PAYLOAD_MASK = 0x0007FFFFFFFFFFFF
+
+# Excel errors as NaN carrying their ERROR.TYPE number as payload
+# NOTE: arithmetic on NaN keeps the payload of its NaN operand
+ERRORS = {code: float(np.uint64(NAN_BITS + number).view(np.float64))
+          for number, code in enumerate(ERROR_CODES, start=1)}
+
+""" LOGGING AND HANDLING """
+
+# Create a logger
+logger = logging.getLogger(__name__)
+
+# Format the logger
+logger = setup_logger(logger)
+
+# Get an error logging decorator
+error_logging = setup_error_logging(logger)
+
+""" FUNCTIONS """
+
+
+# Function to split a formula string into tokens
+def _tokenize_formula(formula: str) -> list[tuple[str, str]]:
+    """
+    Splits a formula string into tokens.
+
+    Parameters
+    ----------
+    formula : str
+        Formula string, with or without a leading equals sign.
+
+    Returns
+    -------
+    list[tuple[str, str]]
+        List of tokens as (kind, text) pairs.
+
+    Raises
+    ------
+    ValueError
+        If the formula contains unsupported syntax.
+
+    """
+
+    # Remove the leading equals sign, if present
+    formula = formula[1:] if formula.startswith('=') else formula
+
+    # Initialize a list of tokens and the current position
+    tokens = []
+    position = 0
+
+    # While there is a non-whitespace character left...
+    while formula[position:].strip():
+
+        # Match the next token
+        match = FORMULA_TOKEN_PATTERN.match(formula, position)
+
+        # If no token matches, raise an error
+        if match is None or match.lastgroup is None:
+            raise ValueError('Unsupported formula syntax at'
+                             f' "{formula[position:]}"')
+
+        # Otherwise, pass
+        else:
+            pass
+
+        # Add the token and move past it
+        tokens.append((match.lastgroup, match.group(match.lastgroup)))
+        position = match.end()
+
+    return tokens
+
+
+# Function to parse a cell or range reference into a tree node
+def _parse_reference(reference: str) -> tuple:
+    """
+    Parses a cell or range reference into a tree node.
+
+    Parameters
+    ----------
+    reference : str
+        Reference, optionally prefixed by a quoted or unquoted sheet name.
+
+    Returns
+    -------
+    tuple
+        Node ('reference', sheet, first_row, first_column, last_row,
+        last_column), with 1-based indices and sheet None if no sheet
+        was given.
+
+    """
+
+    # If the reference names a sheet...
+    if '!' in reference:
+
+        # Split the sheet from the cells
+        sheet, cells = reference.rsplit('!', 1)
+
+        # If the sheet is quoted, remove the quotes
+        if sheet.startswith("'"):
+            sheet = sheet[1:-1].replace("''", "'")
+
+        # Otherwise, pass
+        else:
+            pass
+
+    # Otherwise, there is no sheet
+    else:
+        sheet, cells = None, reference
+
+    # Get the first and last cells, removing absolute markers
+    first_cell, _, last_cell = cells.replace('$', '').upper().partition(':')
+
+    # Get the row and column of each cell
+    first_row, first_column = coordinate_to_tuple(first_cell)
+    last_row, last_column = \
+        coordinate_to_tuple(last_cell) if last_cell \
+        else (first_row, first_column)
+
+    return ('reference', sheet, first_row, first_column,
+            last_row, last_column)
+
+
+# Function to parse a formula string into an expression tree
+@lru_cache(maxsize=1024)
+def parse_formula_tree(formula: str) -> tuple:
+    """
+    Parses a formula string into an expression tree. Trees are cached by
+    formula string and built from tuples, so they are immutable.
+
+    Parameters
+    ----------
+    formula : str
+        Formula string with or without inserts.
+
+    Returns
+    -------
+    tuple
+        Root node of the expression tree.
+
+    Raises
+    ------
+    ValueError
+        If the formula contains unsupported syntax.
+
+    """
+
+    # Get the formula's tokens
+    tokens = _tokenize_formula(formula)
+
+    # Initialize the position of the current token
+    position = 0
+
+    # Function to get the current token without consuming it
+    def peek() -> tuple[str, str]:
+        return tokens[position] if position < len(tokens) else ('', '')
+
+    # Function to consume the current token
+    def take() -> tuple[str, str]:
+        nonlocal position
+        token = peek()
+        position += 1
+        return token
+
+    # Function to consume an expected operator
+    def expect(operator: str):
+        if take() != ('operator', operator):
+            raise ValueError(f'Expected "{operator}" in formula "{formula}"')
+
+    # Function to parse sums and differences
+    def parse_additive() -> tuple:
+        node = parse_multiplicative()
+        while peek() in (('operator', '+'), ('operator', '-')):
+            node = ('binary', take()[1], node, parse_multiplicative())
+        return node
+
+    # Function to parse products and quotients
+    def parse_multiplicative() -> tuple:
+        node = parse_power()
+        while peek() in (('operator', '*'), ('operator', '/')):
+            node = ('binary', take()[1], node, parse_power())
+        return node
+
+    # Function to parse powers
+    # NOTE: As in Excel, negation binds more tightly than powers
+    def parse_power() -> tuple:
+        node = parse_unary()
+        while peek() == ('operator', '^'):
+            node = ('binary', take()[1], node, parse_unary())
+        return node
+
+    # Function to parse signs
+    def parse_unary() -> tuple:
+        if peek() == ('operator', '-'):
+            take()
+            return ('negate', parse_unary())
+        elif peek() == ('operator', '+'):
+            take()
+            return parse_unary()
+        else:
+            return parse_primary()
+
+    # Function to parse literals, inserts, references, functions and
+    # parenthesized expressions
+    def parse_primary() -> tuple:
+        kind, text = take()
+        if kind == 'number':
+            return ('literal', float(text))
+        elif kind == 'string':
+            return ('literal', text[1:-1].replace('""', '"'))
+        elif kind == 'boolean':
+            return ('literal', text == 'TRUE')
+        elif kind == 'insert':
+            return ('insert', text)
+        elif kind == 'reference':
+            return _parse_reference(text)
+        elif kind == 'function':
+            expect('(')
+            arguments = []
+            if peek() != ('operator', ')'):
+                arguments.append(parse_additive())
+                while peek() == ('operator', ','):
+                    take()
+                    arguments.append(parse_additive())
+            expect(')')
+            return ('function', text.upper(), tuple(arguments))
+        elif (kind, text) == ('operator', '('):
+            node = parse_additive()
+            expect(')')
+            return node
+        else:
+            raise ValueError(f'Unexpected "{text}" in formula "{formula}"')
+
+    # Parse the formula
+    tree = parse_additive()
+
+    # If any tokens are left over, raise an error
+    if position != len(tokens):
+        raise ValueError(f'Unexpected "{peek()[1]}" in formula "{formula}"')
+
+    # Otherwise, pass
+    else:
+        pass
+
+    return tree
+
+
+# Function to convert a scalar to a number
+def _scalar_to_number(value: Any) -> float:
+    """
+    Converts a scalar to a number following Excel arithmetic, where blank
+    cells count as zero and non-numeric text is a #VALUE! error.
+
+    Parameters
+    ----------
+    value : Any
+        Scalar to convert.
+
+    Returns
+    -------
+    float
+        Converted number.
+
+    """
+
+    # If the value is blank, it counts as zero
+    if value is None:
+        return 0.0
+
+    # Otherwise, if the value is a boolean or number, convert it
+    elif isinstance(value, (bool, int, float, np.number, np.bool_)):
+        return float(value)
+
+    # Otherwise, if the value is text, try to read a number from it
+    elif isinstance(value, str):
+        try:
+            return float(value)
+        except ValueError:
+            return ERRORS['#VALUE!']
+
+    # Otherwise, the value cannot be a number
+    else:
+        return ERRORS['#VALUE!']
+
+
+# Function to convert a scalar or array to numbers
+def _to_number(value: Any) -> float | np.ndarray:
+    """
+    Converts a scalar, array or range to numbers following Excel
+    arithmetic.
+
+    Parameters
+    ----------
+    value : Any
+        Scalar, numpy array or _Range to convert.
+
+    Returns
+    -------
+    float | np.ndarray
+        Converted number or float array.
+
+    """
+
+    # If the value is a range, use its values
+    if isinstance(value, _Range):
+        value = value.values
+
+    # Otherwise, pass
+    else:
+        pass
+
+    # If the value is not an array, convert the scalar
+    if not isinstance(value, np.ndarray):
+        return _scalar_to_number(value)
+
+    # Otherwise, if the array is already numeric, cast it
+    elif value.dtype.kind in 'biuf':
+        return value.astype(float)
+
+    # Otherwise, convert every entry
+    else:
+        return np.fromiter((_scalar_to_number(entry) for entry in value),
+                           dtype=float, count=len(value))
+
+
+# Function to check whether a scalar or array is an error
+def _is_error(value: Any) -> bool | np.ndarray:
+    """
+    Checks whether a scalar or every entry of an array is an error (NaN).
+
+    Parameters
+    ----------
+    value : Any
+        Scalar or numpy array to check.
+
+    Returns
+    -------
+    bool | np.ndarray
+        Whether the scalar is an error, or a boolean array for arrays.
+
+    """
+
+    # If the value is not an array, check the scalar
+    if not isinstance(value, np.ndarray):
+        return isinstance(value, (float, np.floating)) and value != value
+
+    # Otherwise, if the array is of floats, check for NaN
+    elif value.dtype.kind == 'f':
+        return np.isnan(value)
+
+    # Otherwise, if the array is of objects, check every entry
+    elif value.dtype.kind == 'O':
+        return np.fromiter((isinstance(entry, (float, np.floating))
+                            and entry != entry for entry in value),
+                           dtype=bool, count=len(value))
+
+    # Otherwise, there are no errors
+    else:
+        return np.zeros(len(value), dtype=bool)
+
+
+# Function to get the errors of positions out of a range
+def _get_position_errors(positions: Any, length: int) -> float | np.ndarray:
+    """
+    Gets the errors of 1-based positions out of a range, as in Excel's
+    INDEX: erroneous positions keep their error, negative positions are
+    #VALUE! errors and positions past the range #REF! errors.
+
+    Parameters
+    ----------
+    positions : Any
+        Number or float array of truncated 1-based positions.
+    length : int
+        Length of the range.
+
+    Returns
+    -------
+    float | np.ndarray
+        Error of every position. Positions within the range, and position
+        zero (which Excel reads as the whole range), are errors of unknown
+        kind.
+
+    """
+
+    # Get the error of every position
+    with np.errstate(invalid='ignore'):
+        return np.where(np.isnan(positions), positions,
+                        np.where(positions < 0, ERRORS['#VALUE!'],
+                                 np.where(positions > length,
+                                          ERRORS['#REF!'], np.nan)))
+
+
+# Function to get the error code of an error
+def get_error_code(value: Any) -> str | None:
+    """
+    Gets the Excel error code of a computed error (e.g., '#DIV/0!').
+
+    Parameters
+    ----------
+    value : Any
+        Computed scalar.
+
+    Returns
+    -------
+    str | None
+        Error code, or None if the value is not an error or the kind of
+        error is unknown (e.g., NaN read from data).
+
+    """
+
+    # If the value is not an error, it has no code
+    if not _is_error(value):
+        return None
+
+    # Otherwise, pass
+    else:
+        pass
+
+    # Get the ERROR.TYPE number carried by the NaN
+    number = int(np.float64(value).view(np.uint64)) & NAN_PAYLOAD_MASK
+
+    return ERROR_CODES[number - 1] if 1 <= number <= len(ERROR_CODES) \
+        else None
+
+
+# Function to convert an Excel wildcard pattern to a regular expression
+def _wildcard_to_regex(pattern: str) -> re.Pattern:
+    """
+    Converts an Excel wildcard pattern (*, ? and ~ escapes) to a
+    case-insensitive regular expression.
+
+    Parameters
+    ----------
+    pattern : str
+        Excel wildcard pattern.
+
+    Returns
+    -------
+    re.Pattern
+        Compiled regular expression matching the whole string.
+
+    """
+
+    # Translate every wildcard, escaped wildcard and literal
+    regex = ''.join('.*' if part == '*' else '.' if part == '?'
+                    else re.escape(part[-1])
+                    for part in re.findall(r'~[*?~]|[*?]|[^*?~]+|~',
+                                           pattern))
+
+    return re.compile(regex, re.IGNORECASE | re.DOTALL)
+
+
+""" CLASSES """
+
+
+# Define a class for ranges of cells passed to functions
+class _Range:
+    """
+    A range of cells passed to a function. Its values are kept as one
+    array, and the conversions used by lookups and criteria are computed
+    once and shared by every formula referring to the range.
+    """
+
+    # Initialize class
+    def __init__(self, values: np.ndarray):
+
+        # Set the values
+        self.values = values
+
+        # Initialize a dictionary of criteria masks
+        self._masks: dict[tuple, np.ndarray] = {}
+
+    # Length method
+    def __len__(self):
+        return len(self.values)
+
+    # Numbers in the range, NaN where the cell is not a number
+    @cached_property
+    def numbers(self) -> np.ndarray:
+
+        # If the values are numeric, cast them
+        if self.values.dtype.kind in 'iuf':
+            return self.values.astype(float)
+
+        # Otherwise, convert every number, leaving out text and booleans
+        else:
+            return np.fromiter(
+                (float(entry) if isinstance(entry, (int, float, np.number))
+                 and not isinstance(entry, (bool, np.bool_)) else np.nan
+                 for entry in self.values),
+                dtype=float, count=len(self.values))
+
+    # Whether every cell in the range is an error
+    @cached_property
+    def errors(self) -> np.ndarray:
+        return _is_error(self.values)
+
+    # Text in the range in lower case, None where the cell is not text
+    @cached_property
+    def strings(self) -> np.ndarray:
+        return np.array([entry.casefold() if isinstance(entry, str)
+                         else None for entry in self.values], dtype=object)
+
+    # Whether every cell in the range is blank
+    @cached_property
+    def blanks(self) -> np.ndarray:
+
+        # If the values are numeric, no cell is blank
+        if self.values.dtype.kind in 'biuf':
+            return np.zeros(len(self.values), dtype=bool)
+
+        # Otherwise, check every cell
+        else:
+            return np.fromiter((entry is None for entry in self.values),
+                               dtype=bool, count=len(self.values))
+
+    # 1-based position of the first cell with every lookup key
+    @cached_property
+    def positions(self) -> dict[tuple, int]:
+
+        # Initialize a dictionary of positions
+        positions = {}
+
+        # For every cell, in reverse so the first cell is kept...
+        for i in range(len(self.values) - 1, -1, -1):
+
+            # Get the cell's lookup key
+            key = self.lookup_key(self.values[i])
+
+            # If the cell has a key, add its position
+            if key is not None:
+                positions[key] = i + 1
+
+            # Otherwise, pass
+            else:
+                pass
+
+        return positions
+
+    # Method to get the criteria mask of a criterion
+    def criteria_mask(self, criterion: Any) -> np.ndarray:
+        """
+        Gets the cells that meet a criterion, as in Excel's SUMIFS.
+
+        Parameters
+        ----------
+        criterion : Any
+            Number, boolean or text criterion, optionally starting with a
+            comparison operator (e.g., ">5", "<>Alkane").
+
+        Returns
+        -------
+        np.ndarray
+            Boolean array, True where the cell meets the criterion.
+
+        """
+
+        # Get the criterion's cache key
+        key = (type(criterion), criterion)
+
+        # If the mask is not cached, compute and cache it
+        if key not in self._masks:
+            self._masks[key] = self._compute_criteria_mask(criterion)
+
+        # Otherwise, pass
+        else:
+            pass
+
+        return self._masks[key]
+
+    # Method to compute the criteria mask of a criterion
+    def _compute_criteria_mask(self, criterion: Any) -> np.ndarray:
+
+        # If the criterion is blank, it counts as zero
+        if criterion is None:
+            criterion = 0.0
+
+        # Otherwise, pass
+        else:
+            pass
+
+        # If the criterion is a boolean, match equal booleans
+        if isinstance(criterion, (bool, np.bool_)):
+            return np.fromiter((isinstance(entry, (bool, np.bool_))
+                                and entry == criterion
+                                for entry in self.values),
+                               dtype=bool, count=len(self.values))
+
+        # Otherwise, if the criterion is a number, match equal numbers
+        elif not isinstance(criterion, str):
+            operator, operand = '=', _scalar_to_number(criterion)
+
+        # Otherwise, split the criterion into an operator and operand
+        else:
+
+            # Get the operator and operand
+            operator, operand = CRITERION_PATTERN.match(criterion).groups()
+            operator = operator or '='
+
+            # Try to read a number from the operand
+            try:
+                operand = float(operand)
+
+            # If the operand is not a number, keep the text
+            except ValueError:
+                pass
+
+        # If the operand is a number...
+        if isinstance(operand, float):
+
+            # Compare the numbers in the range
+            with np.errstate(invalid='ignore'):
+                mask = {'=': self.numbers == operand,
+                        '<>': ~(self.numbers == operand),
+                        '<': self.numbers < operand,
+                        '>': self.numbers > operand,
+                        '<=': self.numbers <= operand,
+                        '>=': self.numbers >= operand}[operator]
+
+        # Otherwise, if the operand is empty text...
+        elif operand == '':
+
+            # Match blank cells and empty text
+            mask = self.blanks | (self.strings == '')
+
+            # If the operator is not equality, invert the mask
+            mask = ~mask if operator == '<>' else mask
+
+        # Otherwise, if matching text for equality...
+        elif operator in ('=', '<>'):
+
+            # If the operand has wildcards, match a regular expression
+            if re.search(r'[*?]', operand):
+                pattern = _wildcard_to_regex(operand)
+                mask = np.fromiter((entry is not None
+                                    and pattern.fullmatch(entry) is not None
+                                    for entry in self.strings),
+                                   dtype=bool, count=len(self.values))
+
+            # Otherwise, compare the text directly
+            else:
+                mask = self.strings == operand.casefold()
+
+            # If the operator is inequality, invert the mask
+            mask = ~mask if operator == '<>' else mask
+
+        # Otherwise, compare text in order
+        else:
+
+            # Get the operand in lower case
+            operand = operand.casefold()
+
+            # Compare the text of every text cell
+            compare = {'<': str.__lt__, '>': str.__gt__,
+                       '<=': str.__le__, '>=': str.__ge__}[operator]
+            mask = np.fromiter((entry is not None and compare(entry, operand)
+                                for entry in self.strings),
+                               dtype=bool, count=len(self.values))
+
+        return np.asarray(mask, dtype=bool)
+
+    """ STATIC METHODS """
+    # Method to get the key used when looking up a value
+    @staticmethod
+    def lookup_key(value: Any) -> tuple | None:
+
+        # If the value is text, compare it without case
+        if isinstance(value, str):
+            return ('text', value.casefold())
+
+        # Otherwise, if the value is a boolean, compare it as is
+        elif isinstance(value, (bool, np.bool_)):
+            return ('boolean', bool(value))
+
+        # Otherwise, if the value is a number, compare it as a float
+        elif isinstance(value, (int, float, np.number)) and value == value:
+            return ('number', float(value))
+
+        # Otherwise, the value cannot be looked up
+        else:
+            return None
+
+
+# Define the formula evaluator class
+class FormulaEvaluator:
+    """
+    FormulaEvaluator objects compute the values of the formulas in Tables,
+    Values and Breakdowns without Excel.
+
+    Formulas cached in Results are evaluated from their templates, so a
+    formula output to a Table column is evaluated once with NumPy for
+    the whole column. Other formula strings, like those in Breakdowns,
+    are evaluated cell by cell by resolving their cell references against
+    the layout of every DataSet.
+
+    Parameters
+    ----------
+    tables : list
+        Tables to evaluate.
+    values : list
+        Values to evaluate.
+    breakdowns : list
+        Breakdowns to evaluate.
+    formulas : list[Formula]
+        Formulas output to the passed DataSets.
+
+    """
+
+    # Initialize class
+    def __init__(self,
+                 tables: list,
+                 values: list,
+                 breakdowns: list,
+                 formulas: list[Formula]):
+
+        # Get dictionaries of DataSets by their ids
+        self._tables = {table.id: table for table in tables}
+        self._values = {value.id: value for value in values}
+        self._breakdowns = {breakdown.id: breakdown
+                            for breakdown in breakdowns}
+
+        # Get the Formula output to every Table column and Value, letting
+        # later Formulas replace earlier ones
+        self._formulas = {(formula.table_pointer, formula.key_pointer):
+                          formula for formula in formulas
+                          if formula.formula_string}
+
+        # Initialize dictionaries of computed columns, values and breakdowns
+        self._computed: dict[tuple, Any] = {}
+
+        # Initialize a dictionary of ranges shared between formulas
+        self._ranges: dict[tuple, _Range] = {}
+
+        # Initialize the set of results being computed, to find cycles
+        self._computing: set[tuple] = set()
+
+        # Get the layout of every DataSet, by sheet
+        self._layout = self._get_layout(tables, values, breakdowns)
+
+    """ METHODS """
+    # Method to evaluate every DataSet
+    def evaluate(self) -> dict[str, DataFrame | Any]:
+        """
+        Evaluates every DataSet.
+
+        Returns
+        -------
+        dict[str, DataFrame | Any]
+            Dictionary with DataSet ids as keys. Tables and Breakdowns map
+            to DataFrames of computed values, and Values to their computed
+            value.
+
+        Raises
+        ------
+        ValueError
+            If a formula uses unsupported syntax or functions, or formulas
+            refer to each other in a cycle.
+
+        """
+
+        # Initialize a dictionary of results
+        results = {}
+
+        # For every Table...
+        for table_id, table in self._tables.items():
+            # Get a DataFrame of every computed column
+            results[table_id] = \
+                DataFrame({column: self.evaluate_column(table, column)
+                           for column in table.data.columns},
+                          index=table.data.index)
+
+        # For every Value...
+        for value_id, value in self._values.items():
+            # Get the computed value
+            results[value_id] = self.evaluate_value(value)
+
+        # For every Breakdown...
+        for breakdown_id, breakdown in self._breakdowns.items():
+            # Get the computed Breakdown
+            results[breakdown_id] = self.evaluate_breakdown(breakdown)
+
+        return results
+
+    # Method to evaluate a Table column
+    def evaluate_column(self, table, column: str) -> np.ndarray:
+        """
+        Evaluates a Table column.
+
+        Parameters
+        ----------
+        table : Table
+            Table containing the column.
+        column : str
+            Name of the column.
+
+        Returns
+        -------
+        np.ndarray
+            Computed values of the column.
+
+        """
+
+        # Get the column's key
+        key = ('column', table.id, column)
+
+        # If the column was not computed, compute it
+        if key not in self._computed:
+            self._computed[key] = \
+                self._compute(key, self._compute_column, table, column)
+
+        # Otherwise, pass
+        else:
+            pass
+
+        return self._computed[key]
+
+    # Method to evaluate a Value
+    def evaluate_value(self, value) -> Any:
+        """
+        Evaluates a Value.
+
+        Parameters
+        ----------
+        value : Value
+            Value to evaluate.
+
+        Returns
+        -------
+        Any
+            Computed value.
+
+        """
+
+        # Get the Value's key
+        key = ('value', value.id)
+
+        # If the Value was not computed, compute it
+        if key not in self._computed:
+            self._computed[key] = \
+                self._compute(key, self._compute_value, value)
+
+        # Otherwise, pass
+        else:
+            pass
+
+        return self._computed[key]
+
+    # Method to evaluate a Breakdown
+    def evaluate_breakdown(self, breakdown) -> DataFrame:
+        """
+        Evaluates a Breakdown.
+
+        Parameters
+        ----------
+        breakdown : Breakdown
+            Breakdown to evaluate.
+
+        Returns
+        -------
+        DataFrame
+            Computed values of the Breakdown.
+
+        """
+
+        # Get a DataFrame of every computed column
+        # NOTE: Columns are computed separately, since formulas in one
+        # column may refer to group names in another
+        return DataFrame(
+            {column: self._evaluate_breakdown_column(breakdown, position)
+             for position, column in enumerate(breakdown.data.columns)},
+            index=breakdown.data.index)
+
+    # Method to evaluate one column of a Breakdown
+    def _evaluate_breakdown_column(self, breakdown, position: int
+                                   ) -> np.ndarray:
+
+        # Get the column's key
+        key = ('breakdown', breakdown.id, position)
+
+        # If the column was not computed, compute it
+        if key not in self._computed:
+            self._computed[key] = \
+                self._compute(key, self._evaluate_cells,
+                              breakdown.data.iloc[:, position].to_numpy(),
+                              breakdown.sheet)
+
+        # Otherwise, pass
+        else:
+            pass
+
+        return self._computed[key]
+
+    # Method to compute a result while checking for cycles
+    def _compute(self, key: tuple, function, *arguments) -> Any:
+
+        # If the result is already being computed, raise an error
+        if key in self._computing:
+            raise ValueError(f'Formulas refer to each other in a cycle: {key}')
+
+        # Otherwise, pass
+        else:
+            pass
+
+        # Compute the result, marking it as being computed
+        self._computing.add(key)
+        try:
+            return function(*arguments)
+        finally:
+            self._computing.discard(key)
+
+    # Method to compute a Table column
+    def _compute_column(self, table, column: str) -> np.ndarray:
+
+        # Get the column's Formula, if any
+        formula = self._formulas.get((table.id, column))
+
+        # If the column is output by a Formula...
+        if formula is not None:
+
+            # Get the number of rows
+            length = len(table.data)
+
+            # Evaluate the Formula's template once for every row
+            result = self._evaluate_node(
+                parse_formula_tree(formula.formula_string),
+                {'sheet': table.sheet, 'length': length})
+
+            # Return the result for every row
+            return self._broadcast(result, length)
+
+        # Otherwise, evaluate any formula strings in the column
+        else:
+            return self._evaluate_cells(table.data[column].to_numpy(),
+                                        table.sheet)
+
+    # Method to compute a Value
+    def _compute_value(self, value) -> Any:
+
+        # Get the Value's Formula, if any
+        formula = self._formulas.get(('', value.id))
+
+        # If the Value is output by a Formula, evaluate its template
+        if formula is not None:
+            result = self._evaluate_node(
+                parse_formula_tree(formula.formula_string),
+                {'sheet': value.sheet, 'length': None})
+
+        # Otherwise, evaluate the Value's data
+        else:
+            result = self._evaluate_cells(np.array([value.data],
+                                                   dtype=object),
+                                          value.sheet)[0]
+
+        # If the result is a range of one cell, get the cell
+        if isinstance(result, _Range) and len(result) == 1:
+            result = result.values[0]
+
+        # Otherwise, pass
+        else:
+            pass
+
+        return result.item() if isinstance(result, np.generic) else result
+
+    # Method to evaluate formula strings in an array of cells
+    def _evaluate_cells(self, cells: np.ndarray, sheet: str) -> np.ndarray:
+
+        # Get the positions of formula strings
+        positions = [i for i, cell in enumerate(cells)
+                     if isinstance(cell, str) and cell.startswith('=')]
+
+        # If there are no formula strings, return the cells
+        if not positions:
+            return cells
+
+        # Otherwise, pass
+        else:
+            pass
+
+        # Get a copy of the cells that can hold any result
+        cells = cells.astype(object)
+
+        # For every formula string...
+        for i in positions:
+
+            # Evaluate the formula
+            result = self._evaluate_node(parse_formula_tree(cells[i]),
+                                         {'sheet': sheet, 'length': None})
+
+            # If the result is a range, get its first cell
+            if isinstance(result, _Range):
+                result = result.values[0] if len(result) else None
+
+            # Otherwise, pass
+            else:
+                pass
+
+            # Add the result
+            cells[i] = \
+                result.item() if isinstance(result, np.generic) else result
+
+        return cells
+
+    # Method to evaluate an expression tree node
+    def _evaluate_node(self, node: tuple, context: dict[str, Any]) -> Any:
+        """
+        Evaluates an expression tree node.
+
+        Parameters
+        ----------
+        node : tuple
+            Node to evaluate.
+        context : dict[str, Any]
+            Dictionary with the 'sheet' of the formula, used by references
+            without a sheet, and the output 'length' of formulas output to
+            a Table column (None otherwise).
+
+        Returns
+        -------
+        Any
+            A scalar, a numpy array with one entry per output row, or a
+            _Range.
+
+        """
+
+        # Get the node's kind
+        kind = node[0]
+
+        # If the node is a literal, return it
+        if kind == 'literal':
+            return node[1]
+
+        # Otherwise, if the node is a DataSet insert, resolve it
+        elif kind == 'insert':
+            return self._resolve_insert(node[1], context)
+
+        # Otherwise, if the node is a cell reference, resolve it
+        elif kind == 'reference':
+            return self._resolve_reference(node, context)
+
+        # Otherwise, if the node is a negation, negate its operand
+        elif kind == 'negate':
+            return -_to_number(self._evaluate_node(node[1], context))
+
+        # Otherwise, if the node is a binary operation, apply it
+        elif kind == 'binary':
+            return self._evaluate_binary(node[1],
+                                         self._evaluate_node(node[2],
+                                                             context),
+                                         self._evaluate_node(node[3],
+                                                             context))
+
+        # Otherwise, evaluate a function
+        else:
+            return self._evaluate_function(node[1], node[2], context)
+
+    # Method to resolve a DataSet insert
+    def _resolve_insert(self, raw: str, context: dict[str, Any]) -> Any:
+
+        # Get the insert's pointers
+        pointers = _parse_formula_inserts(raw)[0][0]['pointers']
+
+        # If the insert points to a Table column...
+        if 'table' in pointers and 'key' in pointers:
+
+            # Get the Table's computed column
+            column = self.evaluate_column(self._tables[pointers['table']],
+                                          pointers['key'])
+
+            # If the insert points to one row, return the row's entry
+            if 'row' in pointers:
+                return column[int(pointers['row'])]
+
+            # Otherwise, if the insert is a range, or the formula is not
+            # output to a Table column, return the whole column as a range
+            elif pointers.get('range', '').capitalize() == 'True' \
+               or context['length'] is None:
+                return self._get_range(('column', pointers['table'],
+                                        pointers['key']), column)
+
+            # Otherwise, if the column is shorter than the output,
+            # raise an error
+            elif len(column) < context['length']:
+                raise ValueError(f'Column "{pointers["key"]}" of table'
+                                 f' "{pointers["table"]}" is shorter than'
+                                 ' the formula output')
+
+            # Otherwise, return one entry per output row
+            else:
+                return column[:context['length']]
+
+        # Otherwise, if the insert points to a Value, return its value
+        elif 'key' in pointers:
+            return self.evaluate_value(self._values[pointers['key']])
+
+        # Otherwise, raise an error
+        else:
+            raise ValueError('Insert list contains non-key or non-table'
+                             ' elements')
+
+    # Method to resolve a cell or range reference
+    def _resolve_reference(self, node: tuple, context: dict[str, Any]) -> Any:
+
+        # Get the reference's sheet and bounds
+        _, sheet, first_row, first_column, last_row, last_column = node
+        sheet = context['sheet'] if sheet is None else sheet
+
+        # If no DataSet is on the sheet, the sheet is not in the report
+        if sheet not in self._layout:
+            return ERRORS['#REF!']
+
+        # Otherwise, pass
+        else:
+            pass
+
+        # If the reference is one cell, return the cell's value
+        if (first_row, first_column) == (last_row, last_column):
+            return self._get_cell(sheet, first_row, first_column)
+
+        # Otherwise, pass
+        else:
+            pass
+
+        # Get the range's key
+        key = ('reference', sheet, first_row, first_column,
+               last_row, last_column)
+
+        # If the range is cached, return it
+        if key in self._ranges:
+            return self._ranges[key]
+
+        # Otherwise, pass
+        else:
+            pass
+
+        # For every Table or Breakdown on the sheet...
+        for dataset, top_row, left_column, bottom_row, right_column, \
+                row_offset, column_offset in self._layout.get(sheet, []):
+
+            # If the range lies within one column of the body, use a slice
+            # of the computed column
+            if first_column == last_column \
+               and left_column <= first_column <= right_column \
+               and top_row < first_row and last_row <= bottom_row \
+               and not self._is_value(dataset):
+                values = self._get_dataset_column(
+                    dataset, first_column - left_column + column_offset)
+                return self._get_range(
+                    key, values[first_row - top_row - 1 + row_offset:
+                                last_row - top_row + row_offset])
+
+            # Otherwise, pass
+            else:
+                pass
+
+        # Otherwise, get every cell in the range, row by row
+        values = np.array([self._get_cell(sheet, row, column)
+                           for row in range(first_row, last_row + 1)
+                           for column in range(first_column,
+                                               last_column + 1)],
+                          dtype=object)
+
+        return self._get_range(key, values)
+
+    # Method to get the value of one cell
+    def _get_cell(self, sheet: str, row: int, column: int) -> Any:
+
+        # For every DataSet on the sheet...
+        for dataset, top_row, left_column, bottom_row, right_column, \
+                row_offset, column_offset in self._layout.get(sheet, []):
+
+            # If the cell is not within the DataSet, continue
+            if not (left_column <= column <= right_column
+                    and top_row <= row <= bottom_row):
+                continue
+
+            # Otherwise, if the DataSet is a Value, get its value
+            elif self._is_value(dataset):
+                return self.evaluate_value(dataset)
+
+            # Otherwise, if the cell is in the subheader, get the column name
+            elif row == top_row:
+                return dataset.data.columns[column - left_column +
+                                            column_offset]
+
+            # Otherwise, get the cell's computed value
+            else:
+                return self._get_dataset_column(
+                    dataset, column - left_column + column_offset
+                    )[row - top_row - 1 + row_offset]
+
+        # If no DataSet contains the cell, it is blank
+        return None
+
+    # Method to get a computed column of a Table or Breakdown by position
+    def _get_dataset_column(self, dataset, position: int) -> np.ndarray:
+
+        # If the DataSet is a Table, get its computed column
+        if dataset.id in self._tables:
+            return self.evaluate_column(dataset,
+                                        dataset.data.columns[position])
+
+        # Otherwise, get the column of the computed Breakdown
+        else:
+            return self._evaluate_breakdown_column(dataset, position)
+
+    # Method to get a range shared between formulas
+    def _get_range(self, key: tuple, values: np.ndarray) -> _Range:
+
+        # If the range is not cached, cache it
+        if key not in self._ranges:
+            self._ranges[key] = _Range(values)
+
+        # Otherwise, pass
+        else:
+            pass
+
+        return self._ranges[key]
+
+    # Method to check whether a DataSet is a Value
+    def _is_value(self, dataset) -> bool:
+        return dataset.id in self._values
+
+    # Method to apply a binary operator
+    def _evaluate_binary(self, operator: str, left: Any, right: Any) -> Any:
+
+        # Convert both operands to numbers
+        left = _to_number(left)
+        right = _to_number(right)
+
+        # Apply the operator, ignoring division by zero and overflow
+        with np.errstate(all='ignore'):
+            result = {'+': np.add,
+                      '-': np.subtract,
+                      '*': np.multiply,
+                      '/': np.divide,
+                      '^': np.power}[operator](left, right)
+
+            # Get the results that are new errors, since errors in the
+            # operands keep their kind
+            errors = \
+                ~np.isfinite(result) & ~np.isnan(left) & ~np.isnan(right)
+
+            # Get the new errors dividing by zero, including zero raised
+            # to a negative power
+            divisions = np.equal(right, 0) if operator == '/' \
+                else np.equal(left, 0) if operator == '^' else False
+
+        # Set new errors to #DIV/0! or, for other infinite or invalid
+        # results, #NUM!, as Excel does
+        result = np.where(errors,
+                          np.where(divisions, ERRORS['#DIV/0!'],
+                                   ERRORS['#NUM!']),
+                          result)
+
+        return result if np.ndim(result) else float(result)
+
+    # Method to evaluate a function
+    def _evaluate_function(self,
+                           name: str,
+                           arguments: tuple,
+                           context: dict[str, Any]) -> Any:
+
+        # Remove the prefix of newer functions, if present
+        name = name.removeprefix(FUTURE_FUNCTION_PREFIX)
+
+        # If the function is not supported, raise an error
+        if name not in EVALUATION_FUNCTIONS:
+            raise ValueError(f'Unsupported function "{name}"')
+
+        # Otherwise, pass
+        else:
+            pass
+
+        # Evaluate every argument
+        values = [self._evaluate_node(argument, context)
+                  for argument in arguments]
+
+        # If the function is IF, choose between two values
+        if name == 'IF':
+            return self._function_if(*values)
+
+        # Otherwise, if the function is IFERROR, replace errors
+        elif name == 'IFERROR':
+            return self._function_iferror(*values)
+
+        # Otherwise, if the function is INDEX, get entries by position
+        elif name == 'INDEX':
+            return self._function_index(*values)
+
+        # Otherwise, if the function is MATCH, get positions of entries
+        elif name == 'MATCH':
+            return self._function_match(*values)
+
+        # Otherwise, if the function is VSTACK, stack its arguments
+        elif name == 'VSTACK':
+            return self._function_vstack(values)
+
+        # Otherwise, if the function is a conditional aggregate...
+        elif name.endswith('IFS'):
+            return self._function_conditional_aggregate(name, values)
+
+        # Otherwise, aggregate every argument
+        else:
+            return self._function_aggregate(name, values)
+
+    # Method to choose between two values by a condition
+    @staticmethod
+    def _function_if(condition: Any,
+                     value: Any,
+                     alternative: Any = False) -> Any:
+
+        # Get the condition as numbers, with nonzero numbers being true
+        condition = _to_number(condition)
+
+        # If the values are ranges, use their values
+        value = value.values if isinstance(value, _Range) else value
+        alternative = \
+            alternative.values if isinstance(alternative, _Range) \
+            else alternative
+
+        # If the condition is a scalar, return the chosen value or the
+        # condition's error
+        if not isinstance(condition, np.ndarray):
+            return condition if np.isnan(condition) \
+                else value if condition != 0 else alternative
+
+        # Otherwise, pass
+        else:
+            pass
+
+        # Choose the value of every row, setting the condition's error
+        # where the condition is an error
+        result = np.where(condition != 0, value, alternative).astype(object)
+        errors = np.isnan(condition)
+        result[errors] = condition[errors]
+
+        return result
+
+    # Method to replace errors with an alternative
+    @staticmethod
+    def _function_iferror(value: Any, alternative: Any) -> Any:
+
+        # If the value is a range, use its values
+        value = value.values if isinstance(value, _Range) else value
+        alternative = \
+            alternative.values if isinstance(alternative, _Range) \
+            else alternative
+
+        # Get the errors
+        errors = _is_error(value)
+
+        # If the value is a scalar, return it or the alternative
+        if not isinstance(errors, np.ndarray):
+            return alternative if errors else value
+
+        # Otherwise, if there are no errors, return the value
+        elif not errors.any():
+            return value
+
+        # Otherwise, pass
+        else:
+            pass
+
+        # Replace every error with the alternative
+        result = value.astype(object)
+        result[errors] = \
+            alternative[errors] if isinstance(alternative, np.ndarray) \
+            else alternative
+
+        return result
+
+    # Method to get entries of a range by position
+    @staticmethod
+    def _function_index(cells: Any, row: Any, column: Any = 1.0) -> Any:
+
+        # Get the cells as an array
+        values = cells.values if isinstance(cells, _Range) \
+            else np.atleast_1d(cells)
+
+        # Get the column, truncating as Excel does
+        column = np.trunc(_to_number(column))
+
+        # If the column is not the first, the result is an error
+        if column != 1:
+            return float(_get_position_errors(column, 1))
+
+        # Otherwise, pass
+        else:
+            pass
+
+        # Get the 0-based positions, truncating as Excel does
+        positions = np.trunc(_to_number(row)) - 1
+
+        # Get the valid positions
+        with np.errstate(invalid='ignore'):
+            valid = (positions >= 0) & (positions < len(values))
+
+        # Get the error of every position out of the range
+        errors = _get_position_errors(positions + 1, len(values))
+
+        # If the position is a scalar, return the entry or an error
+        if not isinstance(positions, np.ndarray):
+            return values[int(positions)] if valid else float(errors)
+
+        # Otherwise, if no position is valid, every entry is an error
+        elif not valid.any():
+            return errors
+
+        # Otherwise, pass
+        else:
+            pass
+
+        # Get the entry at every valid position
+        result = values[np.where(valid, positions, 0).astype(int)]
+
+        # If any position is invalid, set its entry to an error
+        if not valid.all():
+            result = result.astype(object if result.dtype.kind != 'f'
+                                   else float)
+            result[~valid] = errors[~valid]
+
+        # Otherwise, pass
+        else:
+            pass
+
+        return result
+
+    # Method to get the positions of entries in a range
+    @staticmethod
+    def _function_match(lookup: Any,
+                        cells: Any,
+                        match_type: Any = 1.0) -> Any:
+
+        # If the match is not exact, raise an error
+        if _to_number(match_type) != 0:
+            raise ValueError('Only exact MATCH (match_type 0) is supported')
+
+        # Otherwise, pass
+        else:
+            pass
+
+        # Get the cells as a range
+        cells = cells if isinstance(cells, _Range) \
+            else _Range(np.atleast_1d(cells))
+
+        # Function to get the position of one lookup value
+        def position(value: Any) -> float:
+
+            # If the value is an error, return the error
+            if _is_error(value):
+                return float(value)
+
+            # Otherwise, if the value is text with wildcards, match every
+            # text cell
+            elif isinstance(value, str) and re.search(r'[*?]', value):
+                pattern = _wildcard_to_regex(value)
+                return next((i + 1.0 for i, entry in enumerate(cells.strings)
+                             if entry is not None
+                             and pattern.fullmatch(entry)), ERRORS['#N/A'])
+
+            # Otherwise, get the position of the value's key
+            else:
+                return float(cells.positions.get(
+                    _Range.lookup_key(value), ERRORS['#N/A']))
+
+        # If the lookup is a range, use its values
+        lookup = lookup.values if isinstance(lookup, _Range) else lookup
+
+        # If the lookup is a scalar, return its position
+        if not isinstance(lookup, np.ndarray):
+            return position(lookup)
+
+        # Otherwise, return the position of every lookup value
+        else:
+            return np.fromiter((position(value) for value in lookup),
+                               dtype=float, count=len(lookup))
+
+    # Method to stack ranges and scalars into one range
+    @staticmethod
+    def _function_vstack(arguments: list) -> _Range:
+
+        # Stack the values of every argument
+        return _Range(np.concatenate(
+            [argument.values if isinstance(argument, _Range)
+             else np.atleast_1d(argument).astype(object)
+             for argument in arguments]))
+
+    # Method to aggregate the cells that meet criteria
+    @staticmethod
+    def _function_conditional_aggregate(name: str, arguments: list) -> Any:
+
+        # Function to get an argument as a range
+        def as_range(argument: Any) -> _Range:
+            return argument if isinstance(argument, _Range) \
+                else _Range(np.atleast_1d(argument))
+
+        # Get the range to aggregate and criteria pairs
+        # NOTE: COUNTIFS has no range to aggregate
+        summarized = None if name == 'COUNTIFS' else as_range(arguments[0])
+        pairs = arguments[:] if name == 'COUNTIFS' else arguments[1:]
+
+        # If the criteria are not in pairs, raise an error
+        if len(pairs) == 0 or len(pairs) % 2 != 0:
+            raise ValueError(f'{name} expects pairs of ranges and criteria')
+
+        # Otherwise, pass
+        else:
+            pass
+
+        # Get the criteria ranges and criteria
+        ranges = [as_range(cells) for cells in pairs[::2]]
+        criteria = [criterion.values if isinstance(criterion, _Range)
+                    else criterion for criterion in pairs[1::2]]
+
+        # If the ranges differ in size, the result is an error
+        if len({len(cells) for cells in ranges}
+               | ({len(summarized)} if summarized is not None else set())) \
+           != 1:
+            return ERRORS['#VALUE!']
+
+        # Otherwise, pass
+        else:
+            pass
+
+        # Function to aggregate the cells meeting one set of criteria
+        def aggregate(criteria_set: list) -> float:
+
+            # Get the cells meeting every criterion
+            mask = np.logical_and.reduce(
+                [cells.criteria_mask(criterion)
+                 for cells, criterion in zip(ranges, criteria_set)])
+
+            # If counting, return the number of cells
+            if summarized is None:
+                return float(mask.sum())
+
+            # Otherwise, if any matched cell is an error, return the first
+            elif summarized.errors[mask].any():
+                return float(
+                    summarized.numbers[mask & summarized.errors][0])
+
+            # Otherwise, pass
+            else:
+                pass
+
+            # Get the matched numbers, leaving out text and blanks
+            numbers = summarized.numbers[mask]
+            numbers = numbers[~np.isnan(numbers)]
+
+            # Aggregate the numbers
+            if name == 'SUMIFS':
+                return float(numbers.sum())
+            elif name == 'AVERAGEIFS':
+                return float(numbers.mean()) if len(numbers) \
+                    else ERRORS['#DIV/0!']
+            elif name == 'MINIFS':
+                return float(numbers.min()) if len(numbers) else 0.0
+            else:
+                return float(numbers.max()) if len(numbers) else 0.0
+
+        # Get the criteria with one entry per output row
+        arrays = [criterion for criterion in criteria
+                  if isinstance(criterion, np.ndarray)]
+
+        # If every criterion is a scalar, aggregate once
+        if not arrays:
+            return aggregate(criteria)
+
+        # Otherwise, pass
+        else:
+            pass
+
+        # Get codes of the distinct entries of every criterion
+        factors = [factorize(criterion, use_na_sentinel=False)
+                   if isinstance(criterion, np.ndarray)
+                   else (np.zeros(len(arrays[0]), dtype=int),
+                         np.array([criterion], dtype=object))
+                   for criterion in criteria]
+
+        # Get the distinct combinations of criteria over the rows
+        combinations, inverse = np.unique(
+            np.stack([codes for codes, _ in factors], axis=1),
+            axis=0, return_inverse=True)
+
+        # Aggregate once for every distinct combination of criteria
+        results = np.array([aggregate([uniques[code] for code, (_, uniques)
+                                       in zip(combination, factors)])
+                            for combination in combinations], dtype=float)
+
+        return results[inverse.reshape(-1)]
+
+    # Method to aggregate numbers in ranges and scalars
+    @staticmethod
+    def _function_aggregate(name: str, arguments: list) -> Any:
+
+        # Initialize lists of partial sums, counts, minimums and maximums
+        sums, counts, minimums, maximums = [], [], [], []
+
+        # For every argument...
+        for argument in arguments:
+
+            # If the argument is a range, aggregate its numbers
+            if isinstance(argument, _Range):
+
+                # Get the numbers, leaving out text and blanks
+                numbers = argument.numbers[~np.isnan(argument.numbers)]
+
+                # If the range contains an error, its partials are the
+                # first error
+                errors = argument.numbers[argument.errors]
+                error = float(errors[0]) if len(errors) else None
+
+                # Add the partials
+                sums.append(error if error is not None else numbers.sum())
+                counts.append(float(len(numbers)))
+                minimums.append(error if error is not None else
+                                numbers.min() if len(numbers) else np.inf)
+                maximums.append(error if error is not None else
+                                numbers.max() if len(numbers) else -np.inf)
+
+            # Otherwise, add the number as every partial
+            else:
+
+                # Convert the argument to numbers
+                numbers = _to_number(argument)
+
+                # Add the partials, counting only numbers
+                sums.append(numbers)
+                counts.append(1.0 - np.isnan(numbers))
+                minimums.append(numbers)
+                maximums.append(numbers)
+
+        # Combine the partials
+        total = sum(sums, 0.0)
+        count = sum(counts, 0.0)
+
+        # Get whether there is a result, being numbers or errors to use
+        # NOTE: errors in any argument are kept in the total
+        has_result = (count > 0) | np.isnan(total)
+
+        # Get the result of the function
+        with np.errstate(all='ignore'):
+            if name == 'SUM':
+                result = total
+            elif name == 'COUNT':
+                result = count
+            elif name == 'AVERAGE':
+                result = np.where(has_result, total / count,
+                                  ERRORS['#DIV/0!'])
+            elif name == 'MIN':
+                result = np.where(has_result,
+                                  np.minimum.reduce(np.broadcast_arrays(
+                                      *minimums)), 0.0)
+            else:
+                result = np.where(has_result,
+                                  np.maximum.reduce(np.broadcast_arrays(
+                                      *maximums)), 0.0)
+
+        return result if np.ndim(result) else float(result)
+
+    """ STATIC METHODS """
+    # Method to get the layout of every DataSet, by sheet
+    @staticmethod
+    def _get_layout(tables: list,
+                    values: list,
+                    breakdowns: list) -> dict[str, list[tuple]]:
+        """
+        Gets the cells covered by every DataSet, by sheet.
+
+        Parameters
+        ----------
+        tables : list
+            Tables to get the layout of.
+        values : list
+            Values to get the layout of.
+        breakdowns : list
+            Breakdowns to get the layout of.
+
+        Returns
+        -------
+        dict[str, list[tuple]]
+            Dictionary with sheets as keys and lists of (dataset, top_row,
+            left_column, bottom_row, right_column, row_offset,
+            column_offset) as values, with 1-based indices. For Tables and
+            Breakdowns, the top row is the row of column names. For Values,
+            it is the row of the value. The offsets are the positions of
+            the first row and column of a Table shard in the Table's data,
+            and zero for every other DataSet.
+
+        """
+
+        # Initialize the layout
+        layout = {}
+
+        # For every Table...
+        for table in tables:
+
+            # Get the row of column names, below the header if any
+            top_row = table.start_row + (2 if table.header != '' else 1)
+
+            # For every shard of the Table...
+            for shard in table.shard_layout:
+
+                # Get the first row and column of the shard in the data
+                row_offset, stop_row = shard['rows']
+                column_offset, stop_column = shard['columns']
+
+                # Add the shard's cells
+                layout.setdefault(shard['sheet'], []).append(
+                    (table, top_row, table.start_column + 1,
+                     top_row + stop_row - row_offset,
+                     table.start_column + stop_column - column_offset,
+                     row_offset, column_offset))
+
+        # For every Breakdown...
+        for breakdown in breakdowns:
+
+            # Get the row of column names, below the header if any
+            top_row = breakdown.start_row + \
+                (2 if breakdown.header != '' else 1)
+
+            # Add the Breakdown's cells
+            layout.setdefault(breakdown.sheet, []).append(
+                (breakdown, top_row, breakdown.start_column + 1,
+                 top_row + len(breakdown.data),
+                 breakdown.start_column + len(breakdown.data.columns),
+                 0, 0))
+
+        # For every Value...
+        for value in values:
+
+            # Get the row of the value, below the header if any
+            row = value.start_row + (2 if value.header != '' else 1)
+
+            # Add the Value's cell
+            layout.setdefault(value.sheet, []).append(
+                (value, row, value.start_column + 1,
+                 row, value.start_column + 1, 0, 0))
+
+        return layout
+
+    # Method to broadcast a result to every row of a column
+    @staticmethod
+    def _broadcast(result: Any, length: int) -> np.ndarray:
+
+        # If the result is a range, use its values
+        result = result.values if isinstance(result, _Range) else result
+
+        # If the result is a scalar, repeat it for every row
+        if not isinstance(result, np.ndarray):
+            return np.full(length, result,
+                           dtype=float if isinstance(result, float)
+                           else object)
+
+        # Otherwise, if the result has a different length, raise an error
+        elif len(result) != length:
+            raise ValueError('Formula result does not match the length'
+                             ' of its output column')
+
+        # Otherwise, return the result
+        else:
+            return result
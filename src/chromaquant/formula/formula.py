@@ -12,10 +12,28 @@ refer to any combination of individual cells or ranges of cells.
 """
 
 import logging
+import numpy as np
 import re
+from functools import lru_cache
+from itertools import repeat
+from types import MappingProxyType
 from typing import Any
 from ..logging_and_handling import setup_logger, setup_error_logging
 
+""" CONSTANTS """
+
+# Maximum number of parsed formula strings to keep in the parse cache
+FORMULA_PARSE_CACHE_SIZE = 1024
+
+# Conditional aggregates, which only accept ranges and not arrays
+CONDITIONAL_AGGREGATES = ['SUMIFS', 'COUNTIFS', 'AVERAGEIFS', 'MINIFS',
+                          'MAXIFS', 'SUMIF', 'COUNTIF', 'AVERAGEIF']
+
+# Regular expression matching the start of a conditional aggregate call
+CONDITIONAL_AGGREGATE_PATTERN = re.compile(
+    r'(?<![\w.])((?:_xlfn\.)?(?:' + '|'.join(CONDITIONAL_AGGREGATES) +
+    r'))\s*\(', re.IGNORECASE)
+
 """ LOGGING AND HANDLING """
 
 # Create a logger
@@ -27,6 +45,379 @@ logger = setup_logger(logger)
 # Get an error logging decorator
 error_logging = setup_error_logging(logger)
 
+""" FUNCTIONS """
+
+
+# Function to parse a formula string into inserts and literal segments
+@lru_cache(maxsize=FORMULA_PARSE_CACHE_SIZE)
+def _parse_formula_inserts(formula: str
+                           ) -> tuple[tuple[MappingProxyType, ...],
+                                      tuple[str, ...]]:
+    """
+    Parses a formula string into its inserts and the literal segments
+    around them. Results are cached by formula string, so they are
+    returned as read-only mappings and tuples shared between Formulas.
+
+    Parameters
+    ----------
+    formula : str
+        Formula string with or without inserts.
+
+    Returns
+    -------
+    tuple[tuple[MappingProxyType, ...], tuple[str, ...]]
+        Inserts, each with 'start', 'end', 'raw' and 'pointers' keys, and
+        literal segments. There is always one more segment than inserts.
+
+    Raises
+    ------
+    ValueError
+        If the formula contains a hanging pipe delimeter or a pointer
+        with an unexpected number of colons.
+
+    """
+
+    # Initialize a list to contain parsed pipe contents
+    insert_list = []
+
+    # If the formula contains at least one pipe character...
+    if '|' in formula:
+
+        # If the number of pipes is not divisible by two, raise an error
+        if formula.count('|') % 2 != 0:
+            raise ValueError('Formula contains at least'
+                             'one hanging pipe delimeter:'
+                             f' "{formula}"')
+
+        # Otherwise, pass
+        else:
+            pass
+
+        # For every substring within pipes...
+        for match in re.finditer(r'\|(.*?)\|', formula):
+
+            # Initialize a dictionary of pointers
+            pointers = {}
+
+            # For every comma-separated substring...
+            for pipe in match.group().split(','):
+
+                # If the substring contains one colon...
+                if pipe.count(':') == 1:
+
+                    # Split the substring by that colon, stripping the key
+                    # and value of pipes and whitespace
+                    key, value = [k.strip('|').strip()
+                                  for k in pipe.split(':')]
+
+                    # Add the key-value pair to the pointers dictionary
+                    pointers[key] = value
+
+                # Otherwise, raise error
+                else:
+                    raise ValueError('At least one pointer contains an'
+                                     ' unexpected number of colons')
+
+            # Add a read-only insert to the insert list
+            insert_list.append(
+                MappingProxyType({'start': match.start(),
+                                  'end': match.end(),
+                                  'raw': match.group(),
+                                  'pointers': MappingProxyType(pointers)}))
+
+    # Otherwise, pass
+    else:
+        pass
+
+    # Get the literal segments around every insert
+    bounds = [0] + [bound for insert in insert_list
+                    for bound in (insert['start'], insert['end'])] \
+        + [len(formula)]
+    segments = tuple(formula[bounds[i]:bounds[i + 1]]
+                     for i in range(0, len(bounds), 2))
+
+    return tuple(insert_list), segments
+
+
+# Function to split the arguments of a function call in a formula string
+def _split_formula_arguments(formula: str,
+                             start: int) -> tuple[list[str], int]:
+    """
+    Splits the arguments of a function call in a formula string, skipping
+    commas within nested calls, strings and inserts.
+
+    Parameters
+    ----------
+    formula : str
+        Formula string containing the call.
+    start : int
+        Position following the call's opening parenthesis.
+
+    Returns
+    -------
+    tuple[list[str], int]
+        Arguments, with their whitespace, and the position following the
+        call's closing parenthesis.
+
+    Raises
+    ------
+    ValueError
+        If the call's parenthesis is not closed.
+
+    """
+
+    # Initialize the arguments, the depth of nested parentheses and
+    # whether the position is within a string or insert
+    arguments = []
+    depth = 0
+    quoted = inserted = False
+
+    # Initialize the start of the current argument
+    argument_start = start
+
+    # For every character following the opening parenthesis...
+    for position in range(start, len(formula)):
+
+        # Get the character
+        character = formula[position]
+
+        # If the character starts or ends a string, toggle it
+        # NOTE: escaped quotes toggle twice
+        if character == '"' and not inserted:
+            quoted = not quoted
+
+        # Otherwise, if the character starts or ends an insert, toggle it
+        elif character == '|' and not quoted:
+            inserted = not inserted
+
+        # Otherwise, if within a string or insert, skip the character
+        elif quoted or inserted:
+            continue
+
+        # Otherwise, if the character opens a nested call, go deeper
+        elif character == '(':
+            depth += 1
+
+        # Otherwise, if the character closes a nested call, go back up
+        elif character == ')' and depth > 0:
+            depth -= 1
+
+        # Otherwise, if the character ends an argument of the call...
+        elif character in ',)' and depth == 0:
+
+            # Add the argument
+            arguments.append(formula[argument_start:position])
+            argument_start = position + 1
+
+            # If the call is closed, return its arguments
+            if character == ')':
+                return arguments, position + 1
+
+            # Otherwise, pass
+            else:
+                pass
+
+        # Otherwise, pass
+        else:
+            pass
+
+    raise ValueError(f'Formula "{formula}" has an unclosed parenthesis')
+
+
+# Function to expand conditional aggregates of Table columns split across
+# shards
+def _expand_sharded_aggregates(formula: str,
+                               dataset_references: dict[str, Any]) -> str:
+    """
+    Expands conditional aggregates (e.g., SUMIFS) of range inserts of Table
+    columns split across shards into one conditional aggregate per shard,
+    since conditional aggregates only accept ranges. The aggregates of
+    every shard are combined as Breakdowns combine them: summed for SUMIFS
+    and COUNTIFS, divided as sums by counts for AVERAGEIFS, and compared
+    with MIN or MAX over the shards with matches for MINIFS and MAXIFS.
+
+    Parameters
+    ----------
+    formula : str
+        Formula string with inserts.
+    dataset_references : dict[str, Any]
+        References of every DataSet.
+
+    Returns
+    -------
+    str
+        Formula string, with the range inserts of every expanded aggregate
+        pointing to one shard.
+
+    Raises
+    ------
+    ValueError
+        If a conditional aggregate refers to a column split across shards
+        alongside ranges split differently, or is a single-criterion
+        aggregate (e.g., SUMIF).
+
+    """
+
+    # Initialize the pieces of the expanded formula and the position
+    # following the last expanded call
+    pieces = []
+    position = 0
+
+    # For every conditional aggregate call...
+    for match in CONDITIONAL_AGGREGATE_PATTERN.finditer(formula):
+
+        # If the call is an argument of an expanded call, skip it
+        if match.start() < position:
+            continue
+
+        # Otherwise, pass
+        else:
+            pass
+
+        # Get the call's arguments, expanding calls within them
+        arguments, end = _split_formula_arguments(formula, match.end())
+        arguments = [_expand_sharded_aggregates(argument, dataset_references)
+                     for argument in arguments]
+
+        # Add the formula preceding the call and the expanded call
+        pieces.append(formula[position:match.start()])
+        pieces.append(_expand_sharded_aggregate(match.group(1), arguments,
+                                                dataset_references))
+        position = end
+
+    return ''.join(pieces) + formula[position:]
+
+
+# Function to expand one conditional aggregate over shards
+def _expand_sharded_aggregate(name: str,
+                              arguments: list[str],
+                              dataset_references: dict[str, Any]) -> str:
+    """
+    Expands one conditional aggregate call over the shards of the Table
+    columns its range arguments refer to (see _expand_sharded_aggregates).
+
+    Parameters
+    ----------
+    name : str
+        Name of the conditional aggregate, as written in the formula.
+    arguments : list[str]
+        Arguments of the call.
+    dataset_references : dict[str, Any]
+        References of every DataSet.
+
+    Returns
+    -------
+    str
+        Expanded call, or the call itself if no range argument is split
+        across shards.
+
+    Raises
+    ------
+    ValueError
+        If the aggregate refers to a column split across shards alongside
+        ranges split differently, or is a single-criterion aggregate.
+
+    """
+
+    # Function to get the shards of a range insert argument, if any
+    def get_shards(argument: str) -> list | None:
+
+        # Get the argument's inserts and literal segments
+        inserts, segments = _parse_formula_inserts(argument.strip())
+
+        # If the argument is not one range insert of a Table column,
+        # it has no shards
+        if len(inserts) != 1 or any(segments) \
+           or 'table' not in inserts[0]['pointers'] \
+           or 'key' not in inserts[0]['pointers'] \
+           or inserts[0]['pointers'].get('range', '').capitalize() \
+           != 'True':
+            return None
+
+        # Otherwise, pass
+        else:
+            pass
+
+        # Get the column's reference, if any
+        column_ref = dataset_references.get(
+            inserts[0]['pointers']['table'], {}).get(
+            inserts[0]['pointers']['key'], {})
+
+        return column_ref['shards'] if Formula.is_sharded(column_ref) \
+            else None
+
+    # Get the function without the prefix of newer functions
+    function = name.upper().removeprefix('_XLFN.')
+
+    # Get the positions of range arguments, every other argument after the
+    # first or, when counting, every other argument
+    positions = range(0, len(arguments), 2) \
+        if function.startswith('COUNTIF') \
+        else [0, *range(1, len(arguments), 2)]
+
+    # Get the shards of every range argument
+    shards = {i: get_shards(arguments[i]) for i in positions
+              if i < len(arguments)}
+
+    # If no range argument is split across shards, return the call
+    if not any(shards.values()):
+        return f'{name}(' + ','.join(arguments) + ')'
+
+    # Otherwise, if the aggregate has a single criterion, raise an error
+    elif not function.endswith('IFS'):
+        raise ValueError(f'{function} cannot refer to a column split across'
+                         f' sheets, use {function}S instead')
+
+    # Otherwise, if the ranges are not split the same way, raise an error
+    elif len({tuple(shard['length'] for shard in column_shards)
+              if column_shards else None
+              for column_shards in shards.values()}) != 1:
+        raise ValueError(f'{function} refers to a column split across'
+                         ' sheets alongside ranges split differently')
+
+    # Otherwise, pass
+    else:
+        pass
+
+    # Function to get the arguments of the call for one shard
+    def get_shard_arguments(i: int) -> list[str]:
+        return [argument.replace(argument.strip(),
+                                 argument.strip()[:-1] + f', shard: {i}|')
+                if j in shards else argument
+                for j, argument in enumerate(arguments)]
+
+    # Get the joined arguments of every shard, with and without the range
+    # to aggregate
+    # NOTE: COUNTIFS has no range to aggregate
+    templates = [','.join(get_shard_arguments(i))
+                 for i in range(len(next(iter(shards.values()))))]
+    count_templates = templates if function == 'COUNTIFS' \
+        else [','.join(get_shard_arguments(i)[1:]).lstrip()
+              for i in range(len(templates))]
+
+    # If the aggregates of every shard can be summed, sum them
+    if function in ['SUMIFS', 'COUNTIFS']:
+        return '(' + '+'.join(f'{name}({template})'
+                              for template in templates) + ')'
+
+    # Otherwise, if averaging, divide the sum by the count
+    elif function == 'AVERAGEIFS':
+        return ('((' + '+'.join(f'SUMIFS({template})'
+                                for template in templates) +
+                ')/(' + '+'.join(f'COUNTIFS({template})'
+                                 for template in count_templates) + '))')
+
+    # Otherwise, compare the aggregates of every shard with matches
+    # NOTE: Shards without matches are left out as blank text, since
+    # their aggregate is zero
+    else:
+        return (f'{function[:3]}(_xlfn.VSTACK(' +
+                ', '.join(f'IF(COUNTIFS({count_template}), '
+                          f'{name}({template}), "")'
+                          for template, count_template in
+                          zip(templates, count_templates)) + '))')
+
+
 """ CLASSES """
 
 
@@ -38,7 +429,8 @@ class Formula:
     def __init__(self,
                  formula: str = '',
                  key_pointer: str = '',
-                 table_pointer: str = ''):
+                 table_pointer: str = '',
+                 array: bool = False):
         """__init__ summary
 
         Parameters
@@ -48,9 +440,16 @@ class Formula:
         pointer: dict
             Dictionary with key and (optionally) table name where
             the formula will be located
+        array : bool, optional
+            Whether a formula output to a table is written as one
+            dynamic-array formula over the column instead of one formula
+            per row, by default False
 
         """
 
+        # Set whether the formula is written as one array formula
+        self.array = array
+
         # Extract the formula if passed
         if formula != '':
             self._formula = formula
@@ -68,6 +467,32 @@ class Formula:
         # Return formula string
         return self._formula
 
+    # Method to get the state to pickle or copy
+    def __getstate__(self):
+
+        # Get the attributes, leaving out the parsed inserts
+        # NOTE: parsed inserts are read-only mappings shared through the
+        # parse cache, which cannot be pickled
+        state = self.__dict__.copy()
+        state.pop('insert_list', None)
+        state.pop('_segments', None)
+
+        return state
+
+    # Method to restore a pickled or copied state
+    def __setstate__(self, state):
+
+        # Restore the attributes
+        self.__dict__.update(state)
+
+        # If there is a formula string, parse its inserts again
+        if getattr(self, '_formula', None) is not None:
+            self.get_formula_cell_inserts()
+
+        # Otherwise, pass
+        else:
+            pass
+
     """ PROPERTIES """
     # Formula properties
     # Formula getter
@@ -86,6 +511,7 @@ class Formula:
     def formula_string(self):
         del self._formula
         del self.insert_list
+        del self._segments
 
     """ METHODS """
     # Method to set formula pointer values
@@ -106,73 +532,16 @@ class Formula:
     @error_logging
     def get_formula_cell_inserts(self):
 
-        # Initialize a list to contain parsed pipe contents
-        insert_list = []
-
-        # If the formula contains at least one pipe character...
-        if '|' in self._formula:
-
-            # Get the number of pipes in the formula
-            pipe_count = self._formula.count('|')
-
-            # If the number of pipes is divisible by two...
-            if pipe_count % 2 == 0:
-
-                # Get a list of every substring within pipes
-                insert_list = [{'start': match.start(),
-                                'end': match.end(),
-                                'raw': match.group(),
-                                'pipe': [],
-                                'pointers': {}}
-                               for match in re.finditer(r'\|(.*?)\|',
-                                                        self._formula)]
-
-                # For each pipe substring...
-                for i in range(len(insert_list)):
-
-                    # Split each substring if it contains commas
-                    insert_list[i]['pipe'] = \
-                        insert_list[i]['raw'].split(',')
-
-                    # For each newly-split substring...
-                    for j in range(len(insert_list[i]['pipe'])):
-
-                        # If the substring contains one colon...
-                        if insert_list[i]['pipe'][j].count(':') == 1:
-
-                            # Split the substring by that colon
-                            key_value_list = \
-                                insert_list[i]['pipe'][j].split(':')
-
-                            # Strip the key and value of pipes and whitespace
-                            key_value_list = \
-                                [k.strip('|').strip() for k in key_value_list]
-
-                            # Add the key-value pair to the pointers dictionary
-                            insert_list[i]['pointers'][key_value_list[0]] = \
-                                key_value_list[1]
-
-                        # Otherwise, raise error
-                        else:
-                            raise ValueError('At least one pointer contains an'
-                                             ' unexpected number of colons')
-
-                    # Remove the pipe key-value pairs
-                    del insert_list[i]['pipe']
-
-            # Otherwise, raise an error
-            else:
-                raise ValueError('Formula contains at least'
-                                 'one hanging pipe delimeter:'
-                                 f' "{self._formula}"')
-
-        # Otherwise, pass
-        else:
-            pass
+        # Get the parsed inserts and literal segments, reusing a previous
+        # parse of the same formula string if there is one
+        insert_list, segments = _parse_formula_inserts(self._formula)
 
         # Save the insert list to a class attribute
         self.insert_list = insert_list
 
+        # Save the literal segments to a class attribute
+        self._segments = segments
+
         return None
 
     # Method to replace formula inserts with references
@@ -186,19 +555,24 @@ class Formula:
         # If the insert list is not None (i.e., there are inserts)...
         if self.insert_list is not None:
 
+            # Get the formula string to reference, with conditional
+            # aggregates of columns split across shards expanded
+            formula = _expand_sharded_aggregates(self._formula,
+                                                 dataset_references)
+
             # If function was passed a table to output to...
             if self.table_pointer != '' and self.key_pointer != '':
 
                 # Get the list of referenced formulas
                 self.referenced_formulas = \
-                    self.process_table_formula_inserts()
+                    self.process_table_formula_inserts(formula)
 
             # Otherwise, if the function was passed a value to output to...
             elif self.key_pointer != '':
 
                 # Get the list of referenced formulas
                 self.referenced_formulas = \
-                    self.process_value_formula_inserts()
+                    self.process_value_formula_inserts(formula)
 
             # Otherwise, raise an error
             else:
@@ -209,13 +583,15 @@ class Formula:
 
     # Method to process table formula inserts
     @error_logging
-    def process_table_formula_inserts(self):
+    def process_table_formula_inserts(self, formula: str | None = None):
         """
         process_table_formula_inserts
 
         Parameters
         ----------
-        None
+        formula : str | None, optional
+            Formula string to reference, by default None (the Formula's
+            string).
 
         Returns
         -------
@@ -232,6 +608,10 @@ class Formula:
             'Passed output pointers do not point to either a value or table'
         """
 
+        # Get the inserts and literal segments of the formula string
+        insert_list, segments = _parse_formula_inserts(
+            formula if formula is not None else self._formula)
+
         # Try...
         try:
 
@@ -241,7 +621,7 @@ class Formula:
                 self.dataset_references[
                     self.table_pointer
                     ][
-                    next(iter(self.table_pointer[self.table_pointer]))
+                    next(iter(self.dataset_references[self.table_pointer]))
                     ]['length']
 
             # If length is less than one, set to five
@@ -260,17 +640,20 @@ class Formula:
         # If there is at least one table among inserts...
         if any('table' in insert.get('pointers', {})
                 and 'key' in insert.get('pointers', {})
-                for insert in self.insert_list):
+                for insert in insert_list):
 
-            # Get the length of the longest named table
+            # Get the length of the longest named table, not counting
+            # inserts of one row
             max_table_length = max(
                 [self.dataset_references[
                     insert['pointers']['table']
                     ][
                     insert['pointers']['key']
                     ]['length']
-                    for insert in self.insert_list
-                    if 'table' in insert.get('pointers', {})]
+                    for insert in insert_list
+                    if 'table' in insert.get('pointers', {})
+                    and 'row' not in insert['pointers']],
+                default=0
             )
 
             # If the max_table_length is greater than 1, set
@@ -282,149 +665,176 @@ class Formula:
             else:
                 pass
 
-            # Initialize a new formula list
-            new_formula = \
-                [self._formula for i in range(output_table_length)]
+        # Otherwise, if there are only values among inserts...
+        elif all('key' in insert.get('pointers', {})
+                 for insert in insert_list):
+            pass
 
-            # For every insert...
-            for insert in self.insert_list:
+        # Otherwise, raise an exception
+        else:
+            raise ValueError(
+                'Insert list contains non-key or non-table elements'
+            )
 
-                # If the insert has a table and key pointer...
-                if 'table' in insert['pointers'] \
-                   and 'key' in insert['pointers']:
+        # Get whether the output or any inserted Table column is split
+        # across shards
+        sharded = any(
+            self.is_sharded(column_ref)
+            for table_id in [self.table_pointer] + [
+                insert['pointers']['table'] for insert in insert_list
+                if 'table' in insert['pointers']]
+            for column_ref in
+            self.dataset_references.get(table_id, {}).values())
 
-                    # Get the insert's table and key pointers
-                    table_id = insert['pointers']['table']
-                    column_name = insert['pointers']['key']
+        # Get whether the formula is written as one array formula
+        # NOTE: A sharded column does not fit in one range, so formulas
+        # with sharded columns are written once per row instead
+        array = self.array and not sharded
 
-                    # Get the current table reference
-                    table_ref = self.dataset_references[table_id]
+        # Initialize the compiled template with the first literal segment
+        template = [segments[0]]
 
-                    # If the insert has range pointer equal to true...
-                    if 'range' in insert['pointers'] and \
-                        insert['pointers']['range'].capitalize() \
-                       == 'True':
+        # For every insert and the literal segment following it...
+        for insert, segment in zip(insert_list, segments[1:]):
 
-                        # Get a range substring for each
-                        # new entry in the output table
-                        insert['reference'] = \
-                            table_ref[column_name]['range']
+            # If the insert has a table and key pointer...
+            if 'table' in insert['pointers'] \
+               and 'key' in insert['pointers']:
 
-                        # Replace the insert's raw substring
-                        # for every formula in the new formula list
-                        new_formula = \
-                            [self.replace_insert(one_formula,
-                                                 insert['raw'],
-                                                 insert['reference'])
-                                for one_formula in new_formula]
+                # Get the insert's table and key pointers
+                table_id = insert['pointers']['table']
+                column_name = insert['pointers']['key']
 
-                    # Otherwise...
+                # Get the current table reference
+                column_ref = self.dataset_references[table_id][column_name]
+
+                # If the insert points to one row...
+                if 'row' in insert['pointers']:
+
+                    # Add the row's cell reference, the same for every row
+                    self.add_template_piece(
+                        template,
+                        self.get_column_cell(column_ref,
+                                             insert['pointers']['row']))
+
+                # Otherwise, if the insert has range pointer equal to true...
+                elif 'range' in insert['pointers'] and \
+                    insert['pointers']['range'].capitalize() \
+                   == 'True':
+
+                    # Add the range reference covering every shard, the
+                    # same for every row
+                    self.add_template_piece(
+                        template,
+                        self.get_column_range(column_ref,
+                                              insert['pointers'].get('shard')))
+
+                # Otherwise, if the formula is written as one array formula...
+                elif array:
+
+                    # Get the last row covered by the output
+                    end_row = column_ref['start_row'] + output_table_length - 1
+
+                    # Add a range over every row covered by the output,
+                    # the same for the whole column
+                    self.add_template_piece(
+                        template,
+                        f"'{column_ref['sheet']}'!"
+                        f"${column_ref['column_letter']}"
+                        f"${column_ref['start_row']}:"
+                        f"${column_ref['column_letter']}${end_row}")
+
+                # Otherwise, if the column is split across shards...
+                elif self.is_sharded(column_ref):
+
+                    # Get the reference of every cell in every shard
+                    cells = [f"'{shard['sheet']}'!"
+                             f"${shard['column_letter']}${row}"
+                             for shard in column_ref['shards']
+                             for row in range(shard['start_row'],
+                                              shard['end_row'] + 1)]
+
+                    # If there are fewer cells than formulas, raise an error
+                    if len(cells) < output_table_length:
+                        raise ValueError(f'Column "{column_name}" of table'
+                                         f' "{table_id}" is shorter than'
+                                         ' the formula output')
+
+                    # Otherwise, pass
                     else:
+                        pass
 
-                        # Get the column letter
-                        column_letter = \
-                            table_ref[column_name]['column_letter']
-                        # Get the column sheet
-                        column_sheet = \
-                            table_ref[column_name]['sheet']
-
-                        # Get the start and end rows
-                        start_row = \
-                            table_ref[column_name]['start_row']
-                        end_row = \
-                            table_ref[column_name]['end_row']
-
-                        # Get a list of insert references for each
-                        # row iterated over, adjusted to ignore header
-                        insert['reference'] = \
-                            [
-                                f"'{column_sheet}'!"
-                                f"${column_letter}${row}"
-                                for row in
-                                range(start_row, end_row + 1)
-                                ]
-
-                        # Replace the insert's raw substring
-                        # for every formula in the new formula list
-                        new_formula = \
-                            [self.replace_insert(new_formula[i],
-                                                 insert['raw'],
-                                                 insert['reference'][i]
-                                                 )
-                                for i in range(output_table_length)]
-
-                # Otherwise, if the insert has a key pointer...
-                elif 'key' in insert['pointers']:
-
-                    # Get the key pointer
-                    key_id = insert['pointers']['key']
-
-                    # Get the value's data reference string
-                    insert['reference'] = \
-                        self.dataset_references[key_id]['data_cell']
-
-                    # Replace the insert's raw substring
-                    # for every formula in the new formula list
-                    new_formula = \
-                        [self.replace_insert(one_formula,
-                                             insert['raw'],
-                                             insert['reference'])
-                            for one_formula in new_formula]
+                    # Add the cell references as one string per output row
+                    self.add_template_piece(template,
+                                            cells[:output_table_length])
 
-                # Otherwise, raise an error
+                # Otherwise...
                 else:
-                    raise ValueError('Insert list contains '
-                                     'non-key or non-table elements')
 
-        # Otherwise, if there are only values among inserts...
-        elif all('key' in insert.get('pointers', {})
-                 for insert in self.insert_list):
+                    # Get the row numbers of every referenced cell
+                    rows = np.arange(column_ref['start_row'],
+                                     column_ref['end_row'] + 1)
+
+                    # If there are fewer rows than formulas, raise an error
+                    if len(rows) < output_table_length:
+                        raise ValueError(f'Column "{column_name}" of table'
+                                         f' "{table_id}" is shorter than'
+                                         ' the formula output')
 
-            # Initialize a new formula list
-            new_formula = \
-                [self._formula for i in range(output_table_length)]
+                    # Otherwise, pass
+                    else:
+                        pass
 
-            # Initialize a string formula to use in iterations
-            iterate_formula = self._formula
+                    # Add the sheet and column prefix, computed once
+                    self.add_template_piece(
+                        template,
+                        f"'{column_ref['sheet']}'!"
+                        f"${column_ref['column_letter']}$")
 
-            # For every insert...
-            for insert in self.insert_list:
+                    # Add the row numbers as one string per output row
+                    self.add_template_piece(
+                        template,
+                        rows[:output_table_length].astype(str).tolist())
 
-                # Get the key pointer
-                key_id = insert['pointers']['key']
+            # Otherwise, if the insert has a key pointer...
+            elif 'key' in insert['pointers']:
 
-                # Get the value's reference string
-                insert['reference'] = \
-                    self.dataset_references[key_id]['data_cell']
+                # Add the value's data reference, the same for every row
+                self.add_template_piece(
+                    template,
+                    self.dataset_references[
+                        insert['pointers']['key']]['data_cell'])
 
-                # Replace insert substring with value's reference
-                iterate_formula = \
-                    self.replace_insert(iterate_formula,
-                                        insert['raw'],
-                                        insert['reference'])
+            # Otherwise, raise an error
+            else:
+                raise ValueError('Insert list contains '
+                                 'non-key or non-table elements')
 
-            # Set the new formula list to be iterate_formula for
-            # every entry in the output_table's column
-            new_formula = [iterate_formula
-                           for row in range(output_table_length)]
+            # Add the literal segment following the insert
+            self.add_template_piece(template, segment)
 
-        # Otherwise, raise an exception
+        # If the formula is written as one array formula...
+        if array:
+            # Join the template into one formula for the whole column
+            new_formula = ''.join(template)
+
+        # Otherwise, join the template into one formula per output row
         else:
-            raise ValueError(
-                'Insert list contains non-key or non-table elements'
-            )
+            new_formula = self.join_template(template, output_table_length)
 
         return new_formula
 
     # Method to process value formula inserts
     @error_logging
-    def process_value_formula_inserts(self):
+    def process_value_formula_inserts(self, formula: str | None = None):
         """
         process_value_formula_inserts
 
         Parameters
         ----------
-        None
+        formula : str | None, optional
+            Formula string to reference, by default None (the Formula's
+            string).
 
         Returns
         -------
@@ -438,10 +848,10 @@ class Formula:
         """
 
         # Initialize a new formula
-        new_formula = self._formula
+        new_formula = formula if formula is not None else self._formula
 
         # For every insert...
-        for insert in self.insert_list:
+        for insert in _parse_formula_inserts(new_formula)[0]:
 
             # If the insert has a table and key pointer...
             if 'table' in insert['pointers'] \
@@ -454,15 +864,24 @@ class Formula:
                 # Get the table reference
                 table_ref = self.dataset_references[table_id]
 
-                # Get a range substring and save to insert['reference']
-                insert['reference'] = \
-                    table_ref[column_name]['range']
+                # If the insert points to one row, replace pointer
+                # substring with the row's cell
+                if 'row' in insert['pointers']:
+                    new_formula = \
+                        new_formula.replace(
+                            insert['raw'],
+                            self.get_column_cell(table_ref[column_name],
+                                                 insert['pointers']['row']))
 
-                # Replace pointer substring with range substring
-                new_formula = \
-                    new_formula.replace(
-                        insert['raw'],
-                        insert['reference'])
+                # Otherwise, replace pointer substring with range substring
+                # covering every shard, or the shard pointed to
+                else:
+                    new_formula = \
+                        new_formula.replace(
+                            insert['raw'],
+                            self.get_column_range(table_ref[column_name],
+                                                  insert['pointers'].get(
+                                                      'shard')))
 
             # Otherwise, if insert has a key pointer...
             elif 'key' in insert['pointers']:
@@ -470,15 +889,12 @@ class Formula:
                 # Get the key pointer
                 key_id = insert['pointers']['key']
 
-                # Get the value's reference string
-                insert['reference'] = \
-                    self.dataset_references[key_id]['data_cell']
-
                 # Replace insert substring with value's reference
                 new_formula = \
-                    self.replace_insert(new_formula,
-                                        insert['raw'],
-                                        insert['reference'])
+                    self.replace_insert(
+                        new_formula,
+                        insert['raw'],
+                        self.dataset_references[key_id]['data_cell'])
 
             # Otherwise, raise an error
             else:
@@ -487,6 +903,214 @@ class Formula:
         return new_formula
 
     """ STATIC METHODS """
+    # Method to get statistics of the formula parse cache
+    @staticmethod
+    def parse_cache_info():
+        """
+        Gets statistics of the cache of parsed formula strings, shared by
+        every Formula.
+
+        Returns
+        -------
+        CacheInfo
+            Named tuple with hits, misses, maxsize and currsize fields.
+
+        """
+
+        return _parse_formula_inserts.cache_info()
+
+    # Method to clear the formula parse cache
+    @staticmethod
+    def clear_parse_cache():
+        """
+        Clears the cache of parsed formula strings and its statistics.
+
+        Returns
+        -------
+        None
+
+        """
+
+        # Clear the cache
+        _parse_formula_inserts.cache_clear()
+
+        return None
+
+    # Method to check whether a Table column is split across shards
+    @staticmethod
+    def is_sharded(column_ref):
+        """
+        Checks whether a Table column reference is split across shards.
+
+        Parameters
+        ----------
+        column_ref : dict
+            Reference of a Table column.
+
+        Returns
+        -------
+        bool
+            Whether the column has more than one shard.
+
+        """
+
+        return len(column_ref.get('shards', [])) > 1
+
+    # Method to get a range reference covering every shard of a column
+    @staticmethod
+    def get_column_range(column_ref, shard=None):
+        """
+        Gets a range reference covering a Table column. Columns split
+        across shards are stacked with VSTACK.
+
+        Parameters
+        ----------
+        column_ref : dict
+            Reference of a Table column.
+        shard : str or None, optional
+            Position of the shard to cover alone, by default None (every
+            shard).
+
+        Returns
+        -------
+        str
+            Range reference, or VSTACK of the range of every shard.
+
+        """
+
+        # If a shard is given, return its range
+        if shard is not None:
+            return column_ref['shards'][int(shard)]['range']
+
+        # Otherwise, if the column is split across shards, stack their
+        # ranges
+        elif Formula.is_sharded(column_ref):
+            return ('_xlfn.VSTACK(' +
+                    ', '.join(shard['range']
+                              for shard in column_ref['shards']) + ')')
+
+        # Otherwise, return the column's range
+        else:
+            return column_ref['range']
+
+    # Method to get the cell reference of one row of a column
+    @staticmethod
+    def get_column_cell(column_ref, row):
+        """
+        Gets the absolute reference of the cell holding one row of a Table
+        column, in whichever shard holds the row.
+
+        Parameters
+        ----------
+        column_ref : dict
+            Reference of a Table column.
+        row : str or int
+            Position of the row.
+
+        Returns
+        -------
+        str
+            Cell reference, including the sheet.
+
+        Raises
+        ------
+        ValueError
+            If the position is out of the column's range.
+
+        """
+
+        # Get the position of the row
+        position = int(row)
+
+        # If the position is negative, raise an error
+        if position < 0:
+            raise ValueError(f'Row {row} is out of the column\'s range')
+
+        # Otherwise, pass
+        else:
+            pass
+
+        # For every shard of the column...
+        for shard in column_ref.get('shards', [column_ref]):
+
+            # If the row is in the shard, return its cell
+            if position < shard['length']:
+                return f"'{shard['sheet']}'!${shard['column_letter']}" \
+                       f"${shard['start_row'] + position}"
+
+            # Otherwise, move to the next shard
+            else:
+                position -= shard['length']
+
+        # If no shard holds the row, raise an error
+        raise ValueError(f'Row {row} is out of the column\'s range')
+
+    # Method to add a piece to a compiled formula template
+    @staticmethod
+    def add_template_piece(template, piece):
+        """
+        Adds a piece to a compiled formula template, merging it into the
+        previous piece if both are strings shared by every row.
+
+        Parameters
+        ----------
+        template : list
+            List of pieces, each either a string shared by every row or
+            a list with one string per row.
+        piece : str or list
+            Piece to add.
+
+        Returns
+        -------
+        None
+
+        """
+
+        # If both the piece and the last piece are shared strings...
+        if isinstance(piece, str) and isinstance(template[-1], str):
+            # Merge the piece into the last piece
+            template[-1] += piece
+
+        # Otherwise, add the piece
+        else:
+            template.append(piece)
+
+        return None
+
+    # Method to join a compiled formula template into per-row formulas
+    @staticmethod
+    def join_template(template, length):
+        """
+        Joins a compiled formula template into one formula per row.
+
+        Parameters
+        ----------
+        template : list
+            List of pieces, each either a string shared by every row or
+            a list with one string per row.
+        length : int
+            Number of formulas to return.
+
+        Returns
+        -------
+        new_formula : list
+            List of formulas, one per row.
+
+        """
+
+        # If every piece is shared, repeat the single joined formula
+        if all(isinstance(piece, str) for piece in template):
+            new_formula = [''.join(template)] * length
+
+        # Otherwise, join the pieces row by row
+        else:
+            new_formula = list(map(
+                ''.join,
+                zip(*[repeat(piece) if isinstance(piece, str) else piece
+                      for piece in template])))
+
+        return new_formula
+
     # Method to replace formula raw insert with reference
     @staticmethod
     def replace_insert(formula, raw, reference):
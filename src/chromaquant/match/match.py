@@ -11,11 +11,12 @@ related operations.
 """
 
 import logging
+import numpy as np
+import pandas as pd
 from .match_config import MatchConfig
-from .match_tools import match_dataframes
+from .match_tools import get_match_values
 from ..utils.file_tools import try_open_csv, export_to_csv
-from ..utils.dataframe_processing import column_adjust, \
-                                         row_filter
+from ..utils.dataframe_processing import compile_row_filter
 from ..logging_and_handling import setup_logger, setup_error_logging
 
 """ LOGGING AND HANDLING """
@@ -93,69 +94,88 @@ def match(first_DF,
         #    self.data[match_dict.local_data_key].copy()
         pass
 
-    # Create a copy of the first DF
-    match_data = \
-        first_DF.copy()
-
     """ FILTER ROWS """
-    # Adjust the dataframe according to match_config
+    # Get the positions of rows to keep according to match_config
     # Filter rows first in case desired filter includes a column
     # that will be renamed or removed
-    match_data = row_filter(
-                    match_data,
-                    match_config.local_filter_row
-    )
+    # NOTE: No copy of first_DF is made here, only an index array
+    if match_config.local_filter_row:
+        positions = np.flatnonzero(
+            compile_row_filter(match_config.local_filter_row)(first_DF)
+        )
 
-    # Add column headers for columns to include from import
-    match_data = column_adjust(
-                    dataframe=match_data,
-                    add_col=match_config.import_include_col
-    )
+    # Otherwise, keep every row
+    else:
+        positions = np.arange(len(first_DF))
 
     """ MATCH DATAFRAMES """
-    # Match the local and import data sets
-    match_data = \
-        match_dataframes(match_data,
+    # Get the values to add from the import data set for every kept row
+    match_values = \
+        get_match_values(first_DF,
                          second_DF,
-                         match_config)
+                         match_config,
+                         positions)
 
     """ ADJUST OUTPUT """
 
-    # Get the current columns in match_data
-    match_cols = match_data.columns.tolist()
+    # Get the columns in the matched data, where columns to include from
+    # the import are added after (or replace) the first DF's columns
+    match_cols = first_DF.columns.tolist() + \
+        [column for column in match_config.import_include_col
+         if column not in first_DF.columns]
 
     # If the output_cols_dict is not empty...
     if match_config.output_cols_dict:
 
-        # Get the keys for output_cols_dict as list of original columns
-        output_cols_keys = list(
-            match_config.output_cols_dict.keys()
-        )
-        # Get the values for output_cols_dict as list of new columns
-        output_cols_values = list(
-            match_config.output_cols_dict.values()
-        )
-
-        # Filter the dataframe according to output_cols
+        # Get the output columns as pairs of original and new columns
         # NOTE: This preserves the column order as seen in output_cols_dict
-        # First, add columns present in output_cols but not match_cols
-        # And then rename columns using output_cols_dict
-        columns_to_add = list(
-            set(output_cols_keys).difference(set(match_cols))
-        )
-        match_data = column_adjust(
-                        dataframe=match_data,
-                        add_col=columns_to_add,
-                        rename_dict=match_config.output_cols_dict
-        )
-        # Finally, filter
-        match_data = \
-            match_data[output_cols_values]
+        # Columns present in output_cols but not match_cols are left empty
+        output_cols = list(match_config.output_cols_dict.items())
+
+    # Otherwise, keep every column under its current name
+    else:
+        output_cols = [(column, column) for column in match_cols]
+
+    # Get the output columns taken from the first DF
+    first_cols = [(column, new_column) for column, new_column in output_cols
+                  if column in first_DF.columns
+                  and column not in match_values]
+
+    # Get the positions of those columns in the first DF
+    first_col_positions = [first_DF.columns.get_loc(column)
+                           for column, new_column in first_cols]
+
+    # Materialize the kept rows with one take
+    # NOTE: Selecting rows and columns together would copy every row first
+    match_data = first_DF.take(positions)
+
+    # If only some columns are output, select them from the (smaller) result
+    if first_col_positions != list(range(len(first_DF.columns))):
+        match_data = match_data.iloc[:, first_col_positions]
 
     # Otherwise, pass
     else:
         pass
 
+    # Rename the columns taken from the first DF
+    match_data.columns = [new_column for column, new_column in first_cols]
+
+    # For every output column...
+    for i, (column, new_column) in enumerate(output_cols):
+
+        # If the column was taken from the first DF, pass
+        if column in first_DF.columns and column not in match_values:
+            pass
+
+        # Otherwise, insert the matched values or an empty column in place
+        else:
+            match_data.insert(i,
+                              new_column,
+                              pd.Series(match_values.get(
+                                            column, [None] * len(positions)),
+                                        index=match_data.index,
+                                        dtype=object))
+
     """ (OPTIONAL) EXPORT TO FILE """
 
     # If the do_export value is True, export to output path
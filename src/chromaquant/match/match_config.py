@@ -66,11 +66,11 @@ class MatchConfig:
         List of columns to include in second DataFrame in addition to
         columns from first DataFrame, by default None.
 
-    local_filter_row : dict[str, str  |  bool  |  float  |  int] | None,
-                        optional
-
-        Dictonary containing name of column used to filter first dataframe
-        as key and row value to filter by as value, by default None
+    local_filter_row : dict[str, Any] | None, optional
+        Dictonary containing names of columns used to filter first dataframe
+        as keys and either row values to filter by or dictionaries of filter
+        operators (e.g., {'isin': [...]}, {'between': (1, 5)}) as values,
+        by default None (See Notes).
 
     match_conditions : list[dict[str, Any]] | None, optional
         List of conditions by which to match the dataframes (See Notes),
@@ -121,6 +121,24 @@ class MatchConfig:
     The condition can be replaced with GREATER_THAN, LESS_THAN, or any
     user-defined function with the same arguments and return pattern.
 
+    The expected structure of local_filter_row is as follows::
+
+        {
+            'column_one': Any,
+            'column_two': {
+                'isin': list[Any] (optional),
+                'notin': list[Any] (optional),
+                'between': tuple[Any, Any] (optional),
+                'gt' | 'ge' | 'lt' | 'le' | 'eq' | 'ne': Any (optional),
+                'isna' | 'notna': bool (optional),
+                'not': Any (optional)
+                },
+        ...}
+
+    Plain values are matched by equality and every operator must hold for
+    a row to be kept. All conditions are combined into a single row mask
+    (see utils.dataframe_processing.compile_row_filter).
+
     """
 
     # Create class instances of ConfigProperty for every property
@@ -137,8 +155,7 @@ class MatchConfig:
     def __init__(self,
                  do_export: bool = False,
                  import_include_col: list[str] | None = None,
-                 local_filter_row:
-                 dict[str, str | bool | float | int] | None = None,
+                 local_filter_row: dict[str, Any] | None = None,
                  match_conditions: list[dict[str, Any]] | None = None,
                  multiple_hits_rule:
                  Callable[[Any, pd.DataFrame, str, float | int, bool],
@@ -155,7 +172,7 @@ class MatchConfig:
         self.do_export: bool = do_export
         self.import_include_col: list[str] = import_include_col \
             if import_include_col is not None else []
-        self.local_filter_row: dict[str, str | bool | float | int] = \
+        self.local_filter_row: dict[str, Any] = \
             local_filter_row if local_filter_row is not None else {}
         self.match_conditions: list[Any] = match_conditions \
             if match_conditions is not None else []
@@ -2,12 +2,13 @@
 # -*- coding: utf-8 -*-
 """
 
-This submodule contains a function used in the match.py submodule
+This submodule contains functions used in the match.py submodule
 to match two DataFrames by comparing values from columns for each
 (see match.py).
 
 """
 
+import numpy as np
 from pandas import DataFrame, Series
 from typing import Any
 from .match_config import MatchConfig
@@ -15,28 +16,35 @@ from .match_config import MatchConfig
 """ FUNCTIONS """
 
 
-# Function that matches one DataFrame's values to another using some comparison
-def match_dataframes(main_DF: DataFrame,
+# Function that finds the values to add to each row of one DataFrame
+# from another using some comparison
+def get_match_values(main_DF: DataFrame,
                      second_DF: DataFrame,
-                     match_config: MatchConfig) -> DataFrame:
-    """Matches data from two DataFrames by following a passed MatchConfig
+                     match_config: MatchConfig,
+                     positions: np.ndarray | None = None
+                     ) -> dict[str, list[Any]]:
+    """Gets the values from second_DF to add to rows of main_DF
 
     Parameters
     ----------
     main_DF : DataFrame
-        A DataFrame with data to be matched,
-        will serve as basis for returned results
+        A DataFrame with data to be matched. It is only read, never copied.
     second_DF : DataFrame
-        Another DataFrame with data to be matched
+        Another DataFrame with data to be matched. It is only read, never
+        copied.
     match_config : MatchConfig
         A MatchConfig with parameters for matching, including information
         about columns to match by and columns to include in results
+    positions : numpy.ndarray | None, optional
+        Integer positions of the rows in main_DF to match, by default None
+        (every row).
 
     Returns
     -------
-    DataFrame
-        A DataFrame containing data from main_DF plus some added data
-        from second_DF as defined in match_config
+    dict[str, list[Any]]
+        A dictionary containing every column in match_config's
+        import_include_col as keys and lists of values to add, one per
+        matched row of main_DF, as values.
 
     Raises
     ------
@@ -46,65 +54,43 @@ def match_dataframes(main_DF: DataFrame,
 
     """
 
-    # Function that adds data from one row to another
-    def add_to_first(first: Series,
-                     second: Series,
-                     add_columns: list[str]):
+    # If no positions were passed, match every row
+    if positions is None:
+        positions = np.arange(len(main_DF))
 
-        # Create a copy of the passed first_row
-        new_first = first.copy()
-
-        # For every column in add_columns...
-        for column in add_columns:
-            # Set the first row's entry to the second row's entry
-            new_first.at[column] = second[column]
+    # Otherwise, pass
+    else:
+        pass
 
-        return new_first
+    # Get the columns to add from the second DataFrame
+    add_columns = match_config.import_include_col
 
-    # Function that finds all rows in a DataFrame that meet a condition
-    # with respect to some different row
-    def match_one_row_condition(row: Series,
-                                DF: DataFrame,
-                                match_condition: dict[str, Any]):
+    # Get the compared column of the main DataFrame for every condition
+    # NOTE: Only these columns are read, so rows are never materialized
+    condition_values = \
+        [main_DF[condition['first_DF_column']].to_numpy()
+         for condition in match_config.match_conditions]
 
-        # Create a copy of the passed main_row
-        new_row = row.copy()
+    # Initialize a list of values for every column to add
+    match_values = {column: [] for column in add_columns}
 
-        # Get the comparison value from the new row
-        row_value = new_row[match_condition['first_DF_column']]
+    # For every row position in the main dataframe...
+    for position in positions:
 
-        # Get a slice of DF that meets the condition
-        DF_slice = \
-            match_condition['condition'](row_value,
-                                         DF,
-                                         match_condition['second_DF_column'],
-                                         **match_condition['kwargs'])
-
-        return DF_slice
-
-    # Create a copy of the passed DataFrames
-    new_main_DF = main_DF.copy()
-    new_second_DF = second_DF.copy()
-
-    # For every row in the main dataframe...
-    for i, row in main_DF.iterrows():
-
-        # Get a copy of the second DataFrame
-        second_DF_slice = new_second_DF.copy()
-
-        # Initialize an index for number of conditions applied
-        j = 0
+        # Start from the whole second DataFrame
+        # NOTE: Conditions return new slices, so second_DF is never modified
+        second_DF_slice = second_DF
 
         # For every condition passed...
-        for condition in match_config.match_conditions:
+        for condition, values in zip(match_config.match_conditions,
+                                     condition_values):
 
             # Get a slice of the second DataFrame that meets the condition
-            second_DF_slice = match_one_row_condition(row,
-                                                      second_DF_slice,
-                                                      condition)
-
-            # Increment j
-            j += 1
+            second_DF_slice = \
+                condition['condition'](values[position],
+                                       second_DF_slice,
+                                       condition['second_DF_column'],
+                                       **condition['kwargs'])
 
         # If the slice is longer than one row...
         if len(second_DF_slice) > 1:
@@ -112,42 +98,78 @@ def match_dataframes(main_DF: DataFrame,
             # Get the name of the column used in selecting one hit of multiple
             column_name = match_config.multiple_hits_column
 
-            # Add the values of some row in the slice to the current row
-            # NOTE: uses the match_config's rule
+            # Get a row of the slice using the match_config's rule
             # on handling multiple row matches
-            new_main_row = \
-                add_to_first(row,
-                             match_config.multiple_hits_rule(
-                                 second_DF_slice,
-                                 column_name),
-                             match_config.import_include_col)
+            hit: Series | None = \
+                match_config.multiple_hits_rule(second_DF_slice, column_name)
 
         # Otherwise, if the slice is just one row...
         elif len(second_DF_slice) == 1:
 
-            # Add the values of the first row in the slice to the current row
-            new_main_row = \
-                add_to_first(row,
-                             second_DF_slice.loc[
-                              second_DF_slice.index.min()],
-                             match_config.import_include_col)
+            # Get the first row in the slice
+            hit = second_DF_slice.loc[second_DF_slice.index.min()]
 
         # Otherwise, if the slice is of length zero...
         elif len(second_DF_slice) == 0:
 
-            # Create a copy of the current row
-            new_main_row = row.copy()
-
-            # For every column to be added from the second DataFrame...
-            for column in match_config.import_include_col:
-                # Add a None entry to that column in the new row
-                new_main_row.at[column] = None
+            # There is no hit
+            hit = None
 
         # Otherwise, raise an error
         else:
             raise ValueError('Second slice of unexpected length.')
 
-        # Add the new row to the current index in the main DataFrame
-        new_main_DF.loc[i] = new_main_row
+        # For every column to be added from the second DataFrame...
+        for column in add_columns:
+            # Add the hit's entry, or None if there was no hit
+            match_values[column].append(
+                hit[column] if hit is not None else None)
+
+    return match_values
+
+
+# Function that matches one DataFrame's values to another using some comparison
+def match_dataframes(main_DF: DataFrame,
+                     second_DF: DataFrame,
+                     match_config: MatchConfig) -> DataFrame:
+    """Matches data from two DataFrames by following a passed MatchConfig
+
+    Parameters
+    ----------
+    main_DF : DataFrame
+        A DataFrame with data to be matched,
+        will serve as basis for returned results
+    second_DF : DataFrame
+        Another DataFrame with data to be matched
+    match_config : MatchConfig
+        A MatchConfig with parameters for matching, including information
+        about columns to match by and columns to include in results
+
+    Returns
+    -------
+    DataFrame
+        A DataFrame containing data from main_DF plus some added data
+        from second_DF as defined in match_config
+
+    Raises
+    ------
+    ValueError
+        If a DataFrame slice created from matching is of unexpected length,
+        specifically a negative value.
+
+    """
+
+    # Get the values to add to every row
+    match_values = get_match_values(main_DF, second_DF, match_config)
+
+    # Create the single output DataFrame
+    new_main_DF = main_DF.copy()
+
+    # For every column to add...
+    for column, values in match_values.items():
+        # Add the values, keeping None for rows without a hit
+        new_main_DF[column] = Series(values,
+                                     index=new_main_DF.index,
+                                     dtype=object)
 
     return new_main_DF
@@ -9,4 +9,24 @@ and reporting to Excel.
 
 """
 
+import importlib
 from .results import Results
+from .results_spec import ResultsSpec
+from typing import Any, TYPE_CHECKING
+if TYPE_CHECKING:
+    from .report_template import ReportTemplate
+
+
+# Function to import the ReportTemplate class when first used
+# NOTE: it imports xlsxwriter, which is otherwise only imported to report
+def __getattr__(name: str) -> Any:
+
+    # If the name is ReportTemplate, import it
+    if name == 'ReportTemplate':
+        return importlib.import_module('.report_template',
+                                       __name__).ReportTemplate
+
+    # Otherwise, raise an error
+    else:
+        raise AttributeError(f'module {__name__!r} has no attribute '
+                             f'{name!r}')
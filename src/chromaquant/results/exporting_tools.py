@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+
+This submodule contains functions used to export Results to columnar
+files, particularly by the Results class (see Results.export_results).
+
+"""
+
+from importlib.util import find_spec
+import numpy as np
+import os
+from pandas import DataFrame, Series
+from pandas.api.types import infer_dtype
+from typing import Any
+
+""" CONSTANTS """
+
+# Define the file extension of every export format
+EXPORT_FORMATS = {'parquet': '.parquet',
+                  'feather': '.feather',
+                  'csv': '.csv'}
+
+# Define the formats written and read with the optional pyarrow
+PYARROW_FORMATS = ('parquet', 'feather')
+
+""" FUNCTIONS """
+
+
+# Function to check that the dependencies of a file format are installed
+def check_file_format(file_format: str):
+    """
+    Checks that pyarrow is installed if a file format needs it, before any
+    file is written.
+
+    Parameters
+    ----------
+    file_format : str
+        Format of the files (e.g., 'parquet').
+
+    Returns
+    -------
+    None
+
+    Raises
+    ------
+    ImportError
+        If the format needs pyarrow and it is not installed.
+
+    """
+
+    # If the format needs pyarrow and it is not installed, raise an error
+    if file_format in PYARROW_FORMATS and find_spec('pyarrow') is None:
+        raise ImportError(f'{file_format.capitalize()} files need pyarrow,'
+                          ' install it with "pip install chromaquant[export]"'
+                          ' or use a format without pyarrow (e.g., "csv" for'
+                          ' exports or "pickle" for snapshots)')
+
+    # Otherwise, pass
+    else:
+        pass
+
+    return None
+
+
+# Function to get a DataFrame of computed columns to export
+def get_export_frame(columns: dict[Any, np.ndarray]) -> DataFrame:
+    """
+    Gets a DataFrame of computed columns to export, without copying
+    columns that already have a columnar type. Columns of Python objects
+    get their inferred type, with empty strings missing if they mix types,
+    or are written as strings if they still mix types.
+
+    Parameters
+    ----------
+    columns : dict[Any, np.ndarray]
+        Dictionary with column names as keys and computed columns as
+        values.
+
+    Returns
+    -------
+    DataFrame
+        DataFrame with the columns, named by strings, and a default index.
+
+    """
+
+    # For every column name and computed column...
+    for name, column in columns.items():
+
+        # If the column holds Python objects, infer its type
+        # NOTE: formula results are computed as objects
+        if column.dtype == object:
+
+            # Get the column with its inferred type
+            column = Series(column).infer_objects()
+
+            # If the column mixes types, treat empty strings as missing
+            # NOTE: formulas return empty strings for errors (IFERROR)
+            if infer_dtype(column, skipna=True).startswith('mixed'):
+                column = column.where(column != '', None).infer_objects()
+
+            # Otherwise, pass
+            else:
+                pass
+
+            # If the column still mixes types, write its values as strings
+            # NOTE: columnar files need one type per column
+            if infer_dtype(column, skipna=True).startswith('mixed'):
+                column = column.map(str, na_action='ignore')
+
+            # Otherwise, pass
+            else:
+                pass
+
+            # Replace the column
+            columns[name] = column.to_numpy()
+
+        # Otherwise, pass
+        else:
+            pass
+
+    # Get a DataFrame referencing the columns
+    # NOTE: columnar files need string column names and no index
+    return DataFrame({str(name): column for name, column in columns.items()},
+                     copy=False)
+
+
+# Function to write a DataFrame to an export file
+def write_export_frame(frame: DataFrame,
+                       path: str | os.PathLike,
+                       file_format: str):
+    """
+    Writes a DataFrame to a columnar file.
+
+    Parameters
+    ----------
+    frame : DataFrame
+        DataFrame to write, with a default index (see get_export_frame).
+    path : str | os.PathLike
+        Path of the file.
+    file_format : str
+        Format of the file, one of 'parquet', 'feather' or 'csv'.
+
+    Returns
+    -------
+    None
+
+    Raises
+    ------
+    ValueError
+        If the format is not supported.
+    ImportError
+        If writing Parquet or Feather files and pyarrow is not installed.
+
+    """
+
+    # If the format is Parquet, write a Parquet file
+    if file_format == 'parquet':
+        frame.to_parquet(path, index=False)
+
+    # If the format is Feather, write a Feather file
+    elif file_format == 'feather':
+        frame.to_feather(path)
+
+    # If the format is CSV, write a CSV file
+    elif file_format == 'csv':
+        frame.to_csv(path, index=False)
+
+    # Otherwise, raise an error
+    else:
+        raise ValueError(f'Unsupported export format "{file_format}", '
+                         f'expected one of {list(EXPORT_FORMATS)}')
+
+    return None
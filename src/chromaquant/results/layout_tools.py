@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+
+This submodule contains functions used to embed the layout of Results
+in reports, to read reports back and to save and load snapshots of
+Results, particularly by the Results class (see Results.layout_manifest,
+Results.from_report and Results.save_snapshot).
+
+"""
+
+from __future__ import annotations
+import json
+import numpy as np
+import os
+from pandas import DataFrame, read_parquet, read_pickle
+from typing import Any, TYPE_CHECKING
+if TYPE_CHECKING:
+    from openpyxl import Workbook as openWorkbook
+    from openpyxl.worksheet._read_only import ReadOnlyWorksheet
+    from xlsxwriter import Workbook as xlsxWorkbook
+
+""" CONSTANTS """
+
+# Define the prefix of the custom document properties holding the layout
+LAYOUT_PROPERTY = 'chromaquant_layout_'
+
+# Define the length of every chunk of the layout
+# NOTE: Excel limits custom document properties to 255 characters
+LAYOUT_CHUNK_LENGTH = 255
+
+# Define the file extension of Table data in every snapshot format
+SNAPSHOT_FORMATS = {'parquet': '.parquet',
+                    'pickle': '.pkl'}
+
+# Define the name of a snapshot's structure file
+SNAPSHOT_FILE = 'snapshot.json'
+
+""" FUNCTIONS """
+
+
+# Function to embed a layout manifest in an xlsxwriter workbook
+def embed_layout(workbook: xlsxWorkbook, layout: dict[str, Any]):
+    """
+    Embeds a layout manifest in a workbook's custom document properties,
+    split into chunks named by LAYOUT_PROPERTY and their position.
+
+    Parameters
+    ----------
+    workbook : Workbook
+        Xlsx workbook to embed the layout in.
+    layout : dict[str, Any]
+        Layout manifest (see Results.layout_manifest).
+
+    Returns
+    -------
+    None
+
+    """
+
+    # Get the layout as compact JSON
+    layout_json = json.dumps(layout, separators=(',', ':'))
+
+    # For every chunk of the layout...
+    for index, start in enumerate(range(0, len(layout_json),
+                                        LAYOUT_CHUNK_LENGTH)):
+        # Add the chunk as a custom document property
+        workbook.set_custom_property(
+            f'{LAYOUT_PROPERTY}{index:05d}',
+            layout_json[start:start + LAYOUT_CHUNK_LENGTH])
+
+    return None
+
+
+# Function to read an embedded layout manifest from a workbook
+def read_layout(workbook: openWorkbook) -> dict[str, Any] | None:
+    """
+    Reads the layout manifest embedded in a workbook (see embed_layout).
+
+    Parameters
+    ----------
+    workbook : Workbook
+        Openpyxl workbook, which may be opened in read-only mode.
+
+    Returns
+    -------
+    dict[str, Any] | None
+        Layout manifest, or None if the workbook has none.
+
+    """
+
+    # Get the chunks of the layout, ordered by their names
+    chunks = sorted((prop.name, prop.value)
+                    for prop in workbook.custom_doc_props.props
+                    if prop.name.startswith(LAYOUT_PROPERTY))
+
+    # If there are no chunks, return None
+    if not chunks:
+        return None
+
+    # Otherwise, pass
+    else:
+        pass
+
+    return json.loads(''.join(chunk for _, chunk in chunks))
+
+
+# Function to read rectangular regions of a worksheet in one pass
+def read_regions(sheet: ReadOnlyWorksheet,
+                 regions: list[tuple[int, int, int, int]]
+                 ) -> list[list[tuple]]:
+    """
+    Reads the values of rectangular regions of a worksheet, streaming its
+    rows once so memory only holds the regions' values.
+
+    Parameters
+    ----------
+    sheet : ReadOnlyWorksheet
+        Openpyxl worksheet opened in read-only mode.
+    regions : list[tuple[int, int, int, int]]
+        Regions to read as (min_row, max_row, min_col, max_col), with
+        1-based and inclusive bounds.
+
+    Returns
+    -------
+    list[list[tuple]]
+        Rows of values of every region, in order. Missing cells are None.
+
+    """
+
+    # Initialize the rows of every region
+    region_rows = [[] for _ in regions]
+
+    # Get the regions with at least one cell
+    regions_to_read = [(index, region) for index, region in enumerate(regions)
+                       if region[1] >= region[0] and region[3] >= region[2]]
+
+    # If no region has cells, return the empty regions
+    if not regions_to_read:
+        return region_rows
+
+    # Otherwise, pass
+    else:
+        pass
+
+    # Get the rows and columns spanned by every region
+    min_row = min(region[0] for _, region in regions_to_read)
+    max_row = max(region[1] for _, region in regions_to_read)
+    max_col = max(region[3] for _, region in regions_to_read)
+
+    # For every streamed row...
+    for row_number, row in enumerate(
+            sheet.iter_rows(min_row=min_row, max_row=max_row, min_col=1,
+                            max_col=max_col, values_only=True),
+            start=min_row):
+
+        # For every region containing the row...
+        for index, (first_row, last_row, first_col, last_col) in \
+                regions_to_read:
+
+            # If the row is in the region, add its part of the row
+            if first_row <= row_number <= last_row:
+                region_rows[index].append(row[first_col - 1:last_col])
+
+            # Otherwise, pass
+            else:
+                pass
+
+    return region_rows
+
+
+# Function to write the data of a Table to a snapshot
+def write_snapshot_frame(data: DataFrame,
+                         path: str | os.PathLike,
+                         file_format: str):
+    """
+    Writes the data of a Table to a snapshot file.
+
+    Parameters
+    ----------
+    data : DataFrame
+        Data of the Table.
+    path : str | os.PathLike
+        Path of the file.
+    file_format : str
+        Format of the file, one of 'parquet' or 'pickle'.
+
+    Returns
+    -------
+    None
+
+    Raises
+    ------
+    ImportError
+        If writing Parquet files and pyarrow is not installed.
+
+    """
+
+    # If the format is Parquet, write a Parquet file
+    if file_format == 'parquet':
+        data.to_parquet(path)
+
+    # Otherwise, pickle the data
+    else:
+        data.to_pickle(path)
+
+    return None
+
+
+# Function to read the data of a Table from a snapshot
+def read_snapshot_frame(path: str | os.PathLike,
+                        file_format: str,
+                        object_columns: list[str]) -> DataFrame:
+    """
+    Reads the data of a Table from a snapshot file.
+
+    Parameters
+    ----------
+    path : str | os.PathLike
+        Path of the file.
+    file_format : str
+        Format of the file, one of 'parquet' or 'pickle'.
+    object_columns : list[str]
+        Names of the columns that held Python objects when saved.
+
+    Returns
+    -------
+    DataFrame
+        Data of the Table.
+
+    """
+
+    # If the format is Parquet, read a Parquet file
+    if file_format == 'parquet':
+
+        # Read the data
+        data = read_parquet(path)
+
+        # For every column that held Python objects...
+        for column in object_columns:
+            # Restore the column's objects, with missing values as None
+            # NOTE: Parquet reads missing values as NaN in typed columns
+            data[column] = data[column].astype(object).where(
+                data[column].notna(), None)
+
+    # Otherwise, unpickle the data
+    else:
+        data = read_pickle(path)
+
+    return data
+
+
+# Function to convert a value to JSON
+def to_json_value(value: Any) -> Any:
+    """
+    Converts a value json cannot serialize, used as json's default.
+
+    Parameters
+    ----------
+    value : Any
+        Value to convert.
+
+    Returns
+    -------
+    Any
+        Python scalar of NumPy scalars, or the value's string otherwise.
+
+    """
+
+    return value.item() if isinstance(value, np.generic) else str(value)
@@ -0,0 +1,373 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+
+This submodule contains an xlsxwriter workbook that renders the XML of
+its worksheets in a process pool, used by the Results class when
+reporting with several processes (see Results.report_results).
+
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from io import StringIO
+import logging
+import multiprocessing
+from typing import Any
+import xlsxwriter
+from xlsxwriter.format import Format as xlsxFormat
+from xlsxwriter.packager import Packager
+from xlsxwriter.worksheet import Worksheet as xlsxWorksheet
+from ..logging_and_handling import setup_logger
+
+""" LOGGING AND HANDLING """
+
+# Create a logger
+logger = logging.getLogger(__name__)
+
+# Format the logger
+logger = setup_logger(logger)
+
+""" CONSTANTS """
+
+# Define the worksheet attributes changed while rendering its XML and
+# read back when writing the worksheet's relationships
+RENDERED_ATTRIBUTES = ('rel_count', 'hlink_refs', 'external_hyper_links')
+
+# Define the private xlsxwriter internals used to render worksheets apart,
+# by the class they belong to
+# NOTE: checked before rendering in a process pool, since private names
+# may change in any xlsxwriter release
+REQUIRED_INTERNALS = \
+    {Packager: ('_write_worksheet_files',),
+     xlsxWorksheet: ('_set_xml_writer', '_assemble_xml_file',
+                     'constant_memory', 'is_chartsheet',
+                     *RENDERED_ATTRIBUTES),
+     xlsxFormat: ('_get_xf_index', 'dxf_index')}
+
+# Define the worksheets inherited by forked processes
+# NOTE: set by the packager just before forking, so worksheets are never
+# pickled; only their index and rendered XML cross processes
+_FORKED_WORKSHEETS: list[xlsxWorksheet] = []
+
+""" FUNCTIONS """
+
+
+# Function to get the missing xlsxwriter internals, if any
+def get_missing_internals() -> list[str]:
+    """
+    Gets the private xlsxwriter internals used to render worksheets in a
+    process pool that the installed xlsxwriter lacks.
+
+    Returns
+    -------
+    list[str]
+        Names of the missing internals, as 'Class.attribute'.
+
+    """
+
+    # Initialize a list of missing internals
+    missing_internals = []
+
+    # For every class and the internals it must have...
+    for internal_class, attributes in REQUIRED_INTERNALS.items():
+
+        # Create an instance of the class
+        # NOTE: some internals are only set on instances
+        instance = internal_class()
+
+        # Add every internal the instance lacks
+        missing_internals.extend(
+            f'{internal_class.__name__}.{attribute}'
+            for attribute in attributes
+            if not hasattr(instance, attribute))
+
+    return missing_internals
+
+
+# Function to render the XML of a worksheet inherited from the parent
+def render_worksheet(index: int,
+                     path: str | None = None) -> tuple[str | None,
+                                                       dict[str, Any]]:
+    """
+    Renders the XML of a worksheet inherited by a forked process.
+
+    Parameters
+    ----------
+    index : int
+        Index of the worksheet among the forked worksheets.
+    path : str | None, optional
+        Path of the file to render the XML to, by default None (render
+        the XML to a string)
+
+    Returns
+    -------
+    str | None
+        XML of the worksheet, or None if rendered to a file.
+    dict[str, Any]
+        Worksheet attributes changed while rendering its XML
+        (see RENDERED_ATTRIBUTES).
+
+    """
+
+    # Get the worksheet
+    worksheet = _FORKED_WORKSHEETS[index]
+
+    # Get the XML file to render to
+    xml_file = StringIO() if path is None else path
+
+    # Render the worksheet's XML
+    worksheet._set_xml_writer(xml_file)
+    worksheet._assemble_xml_file()
+
+    return None if path is not None else xml_file.getvalue(), \
+        {attribute: getattr(worksheet, attribute)
+         for attribute in RENDERED_ATTRIBUTES}
+
+
+""" CLASSES """
+
+
+# Define a packager rendering worksheets in a process pool
+class ParallelPackager(Packager):
+    """
+    Xlsxwriter packager rendering the XML of worksheets in a pool of
+    forked processes, then adding every part to the xlsx container in
+    this process.
+
+    Parameters
+    ----------
+    processes : int
+        Number of processes rendering worksheets.
+
+    Notes
+    -----
+    Strings are indexed into the workbook's shared strings table when
+    written, before worksheets are rendered, so workers only write the
+    indices and the table itself is written in this process.
+
+    Worksheets are inherited by forking, so they are rendered in this
+    process where forking is unavailable (e.g., on Windows), or if some
+    worksheet is written in constant memory mode.
+
+    The XML file of every worksheet is the one xlsxwriter assigns it,
+    recorded by running xlsxwriter's own method with rendering skipped.
+
+    """
+
+    def __init__(self, processes: int):
+
+        # Initialize the packager
+        super().__init__()
+
+        # Save the number of processes
+        self.processes = processes
+
+    # Method to write the XML of every worksheet
+    def _write_worksheet_files(self):
+
+        # Get every worksheet
+        # NOTE: chartsheets are written separately by the packager
+        worksheets = [worksheet for worksheet in self.workbook.worksheets()
+                      if not worksheet.is_chartsheet]
+
+        # If fewer than two worksheets, or a worksheet in constant memory
+        # mode, render them in this process
+        # NOTE: in constant memory mode, rows are rendered while written
+        if len(worksheets) < 2 \
+           or any(worksheet.constant_memory for worksheet in worksheets):
+            super()._write_worksheet_files()
+
+            return None
+
+        # If processes cannot be forked, render worksheets in this process
+        elif 'fork' not in multiprocessing.get_all_start_methods():
+            logger.warning('Processes cannot be forked on this platform, '
+                           'rendering worksheets in one process.')
+            super()._write_worksheet_files()
+
+            return None
+
+        # Otherwise, pass
+        else:
+            pass
+
+        # For every cell Format of the workbook...
+        # NOTE: Formats get their style index when first rendered, which
+        # would otherwise happen in the workers
+        for cell_format in self.workbook.formats:
+
+            # If the Format is not a conditional format, index it
+            if cell_format.dxf_index is None:
+                cell_format._get_xf_index()
+
+            # Otherwise, pass
+            else:
+                pass
+
+        # Get the XML file xlsxwriter assigns every worksheet
+        xml_files = self._get_worksheet_xml_files(worksheets)
+
+        # If some worksheet was not assigned a file, render them in this
+        # process
+        if xml_files is None:
+            logger.warning('Xlsxwriter assigned worksheet files in an '
+                           'unexpected way, rendering worksheets in one '
+                           'process.')
+            super()._write_worksheet_files()
+
+            return None
+
+        # Otherwise, pass
+        else:
+            pass
+
+        # Share the worksheets with the forked processes
+        _FORKED_WORKSHEETS[:] = worksheets
+
+        # Render every worksheet in a pool of forked processes
+        try:
+            with ProcessPoolExecutor(
+                    max_workers=min(self.processes, len(worksheets)),
+                    mp_context=multiprocessing.get_context('fork')) \
+                    as executor:
+
+                # For every worksheet, its XML file and its rendered XML...
+                for worksheet, xml_file, (xml, attributes) in zip(
+                        worksheets, xml_files,
+                        executor.map(render_worksheet,
+                                     range(len(worksheets)),
+                                     [None if isinstance(xml_file, StringIO)
+                                      else xml_file
+                                      for xml_file in xml_files])):
+
+                    # If the XML was rendered to a string, write it
+                    if xml is not None:
+                        xml_file.write(xml)
+
+                    # Otherwise, pass
+                    else:
+                        pass
+
+                    # For every attribute changed while rendering...
+                    for attribute, value in attributes.items():
+                        # Set the attribute of this process' worksheet
+                        setattr(worksheet, attribute, value)
+
+        # Stop sharing the worksheets
+        finally:
+            _FORKED_WORKSHEETS.clear()
+
+        return None
+
+    # Method to get the XML file xlsxwriter assigns every worksheet
+    def _get_worksheet_xml_files(self,
+                                 worksheets: list[xlsxWorksheet]
+                                 ) -> list[Any] | None:
+        """
+        Gets the XML file xlsxwriter assigns every worksheet, by running
+        xlsxwriter's own method with rendering skipped.
+
+        Parameters
+        ----------
+        worksheets : list[Worksheet]
+            Worksheets to render, in order.
+
+        Returns
+        -------
+        list[Any] | None
+            XML file of every worksheet, or None if some worksheet was not
+            assigned exactly one file.
+
+        """
+
+        # Initialize the XML files assigned to every worksheet
+        assigned_files: dict[int, list[Any]] = \
+            {id(worksheet): [] for worksheet in worksheets}
+
+        # Function to record the XML file assigned to a worksheet
+        def record_xml_file(worksheet: xlsxWorksheet):
+            return lambda xml_file: \
+                assigned_files[id(worksheet)].append(xml_file)
+
+        # For every worksheet...
+        for worksheet in worksheets:
+
+            # Record its XML file instead of setting it, and skip rendering
+            worksheet._set_xml_writer = record_xml_file(worksheet)
+            worksheet._assemble_xml_file = lambda: None
+
+        # Run xlsxwriter's method to assign the XML files
+        try:
+            super()._write_worksheet_files()
+
+        # Restore the worksheets' methods
+        finally:
+            for worksheet in worksheets:
+                del worksheet._set_xml_writer
+                del worksheet._assemble_xml_file
+
+        # If some worksheet was not assigned exactly one file, return None
+        if any(len(xml_files) != 1 for xml_files in assigned_files.values()):
+            return None
+
+        # Otherwise, pass
+        else:
+            pass
+
+        return [assigned_files[id(worksheet)][0] for worksheet in worksheets]
+
+
+# Define a workbook rendering worksheets in a process pool
+class ParallelWorkbook(xlsxwriter.Workbook):
+    """
+    Xlsxwriter workbook rendering the XML of its worksheets in a process
+    pool when closed (see ParallelPackager). If the installed xlsxwriter
+    lacks some private internals the packager uses (see
+    REQUIRED_INTERNALS), it warns and renders worksheets in one process.
+
+    Parameters
+    ----------
+    filename : Any
+        Path or writable binary file-like object to write to.
+    options : dict[str, Any] | None, optional
+        Xlsxwriter workbook options, by default None
+    processes : int, optional
+        Number of processes rendering worksheets, by default 2
+
+    """
+
+    def __init__(self,
+                 filename: Any,
+                 options: dict[str, Any] | None = None,
+                 processes: int = 2):
+
+        # Initialize the workbook
+        super().__init__(filename, options)
+
+        # Get the xlsxwriter internals the packager needs but are missing
+        missing_internals = get_missing_internals()
+
+        # If some internals are missing, render worksheets in one process
+        if missing_internals:
+            logger.warning('The installed xlsxwriter lacks '
+                           f'{", ".join(missing_internals)}, rendering '
+                           'worksheets in one process.')
+            processes = 1
+
+        # Otherwise, pass
+        else:
+            pass
+
+        # Save the number of processes
+        self.processes = processes
+
+    # Method to get the workbook's packager
+    def _get_packager(self) -> Packager:
+
+        # If using more than one process, get a parallel packager
+        if self.processes > 1:
+            return ParallelPackager(self.processes)
+
+        # Otherwise, get xlsxwriter's packager
+        else:
+            return super()._get_packager()
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+
+This submodule contains the ReportTemplate class definition. Report
+templates compile the layout of a Results instance once, so reports of
+many samples sharing that layout only write their data.
+
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+from pandas import DataFrame
+from typing import Any, IO, TYPE_CHECKING
+if TYPE_CHECKING:
+    from .results import Results
+from xlsxwriter import Workbook as xlsxWorkbook
+from xlsxwriter.format import Format as xlsxFormat
+from .reporting_tools import add_cell_format, get_cell_format_properties, \
+                             get_xlsx_chart_layout
+from ..chart import Chart
+from ..logging_and_handling import setup_logger, setup_error_logging
+
+""" LOGGING AND HANDLING """
+
+# Create a logger
+logger = logging.getLogger(__name__)
+
+# Format the logger
+logger = setup_logger(logger)
+
+# Get an error logging decorator
+error_logging = setup_error_logging(logger)
+
+""" CLASS """
+
+
+# Define the ReportTemplate class
+class ReportTemplate:
+    """
+    Compiled layout of a Results instance, used to report new data with
+    the same sheets, start cells, headers, themes, Breakdowns and Charts.
+    The Format properties of every theme and the options of every Chart
+    are translated once when compiled, so each report only writes data.
+
+    Parameters
+    ----------
+    results : Results
+        Results whose layout is compiled.
+
+    Raises
+    ------
+    ValueError
+        If some Chart cannot be written with xlsxwriter.
+
+    Notes
+    -----
+    Themes and Charts are compiled as they are when the template is
+    created. Compile a new template after changing them.
+
+    """
+
+    def __init__(self, results: Results):
+
+        # Save the Results
+        self._results = results
+
+        # Get the xlsxwriter layout of every Chart
+        self._chart_layouts: dict[Chart, dict[str, Any]] = \
+            {chart: get_xlsx_chart_layout(chart)
+             for chart in results._charts}
+
+        # Initialize a dictionary of Format properties by CellStyle
+        self._style_properties = {}
+
+        # For every DataSet in Results...
+        for dataset in [*results._tables, *results._breakdowns,
+                        *results._values]:
+
+            # For every style of the DataSet's theme...
+            for group in (dataset.active_theme.header,
+                          dataset.active_theme.subheader,
+                          dataset.active_theme.body):
+
+                # If the style was not translated, translate it
+                if group not in self._style_properties:
+                    self._style_properties[group] = \
+                        get_cell_format_properties(group)
+
+                # Otherwise, pass
+                else:
+                    pass
+
+    """ METHODS """
+    # Method to report the Results with new data
+    @error_logging
+    def report(self,
+               path: str | os.PathLike | IO[bytes] = 'report.xlsx',
+               data: dict[str, DataFrame] | None = None,
+               cache_values: bool = True,
+               constant_memory: bool = False,
+               processes: int = 1):
+        """
+        Reports the Results to an Excel file in one pass with xlsxwriter,
+        reusing the compiled layout.
+
+        Parameters
+        ----------
+        path : str | os.PathLike | IO[bytes], optional
+            Path to report, or a writable binary file-like object (see
+            Results.report_results), by default 'report.xlsx'
+        data : dict[str, DataFrame] | None, optional
+            Dictionary with Table ids as keys and the Tables' new data as
+            values. Formulas, Breakdowns and Charts are updated for the new
+            data before reporting, by default None (report current data).
+        cache_values : bool, optional
+            Whether to write the computed value of every formula as its
+            cached result (see Results.report_results), by default True
+        constant_memory : bool, optional
+            Whether to use xlsxwriter's constant memory mode,
+            by default False
+        processes : int, optional
+            Number of processes rendering the XML of worksheets (see
+            Results.report_results), by default 1
+
+        Returns
+        -------
+        None
+
+        """
+
+        # If new data was passed...
+        if data is not None:
+
+            # Set the data of every Table, recomputing every formula and
+            # Breakdown once
+            with self._results.batch():
+
+                # For every Table id and its new data...
+                for table_id, data_frame in data.items():
+                    # Set the Table's data
+                    self._results._datasets[table_id].data = data_frame
+
+                # Recompute every formula and Breakdown
+                self._results.update_datasets()
+
+            # For every Chart, update its series to the new data
+            for chart in self._results._charts:
+                chart._update_series()
+
+        # Otherwise, pass
+        else:
+            pass
+
+        # Get the computed values to cache, if any
+        cached_values = \
+            self._results._get_cached_values() if cache_values else {}
+
+        # Report the Results with the compiled layout
+        self._results._report_single_pass(path, cached_values,
+                                          constant_memory, self, processes)
+
+        # Write the layout of sharded Tables, if any
+        self._results._write_shard_manifest(path)
+
+        return None
+
+    # Method to get the Formats of every compiled style
+    def get_formats(self, workbook: xlsxWorkbook) -> dict[Any, xlsxFormat]:
+        """
+        Adds the Format of every compiled style to a workbook.
+
+        Parameters
+        ----------
+        workbook : Workbook
+            Xlsx workbook to add the Formats to.
+
+        Returns
+        -------
+        dict[Any, Format]
+            Cache of Formats keyed by their properties and by compiled
+            CellStyles (see get_cell_format).
+
+        """
+
+        # Initialize the cache of Formats
+        formats = {}
+
+        # For every compiled style and its properties...
+        for group, properties in self._style_properties.items():
+            # Add the style's Format
+            formats[group] = add_cell_format(properties, workbook, formats)
+
+        return formats
+
+    # Method to get the compiled layout of a Chart
+    def get_chart_layout(self, chart: Chart) -> dict[str, Any] | None:
+        """
+        Gets the compiled xlsxwriter layout of a Chart (see
+        get_xlsx_chart_layout).
+
+        Parameters
+        ----------
+        chart : Chart
+            Chart to get the layout of.
+
+        Returns
+        -------
+        dict[str, Any] | None
+            Compiled layout, or None if the Chart was added after the
+            template was compiled.
+
+        """
+
+        return self._chart_layouts.get(chart)
@@ -7,15 +7,71 @@ by the Results class (see Results).
 
 """
 
+from collections.abc import Iterable, Iterator
+import heapq
+import numpy as np
+from operator import itemgetter
+from zlib import crc32
 from openpyxl import Workbook as openWorkbook
+from openpyxl.styles import NamedStyle
 from openpyxl.utils import get_column_letter
 from openpyxl.worksheet.worksheet import Worksheet
 from openpyxl.cell.cell import Cell
+from pandas import DataFrame
+from typing import Any
 from xlsxwriter import Workbook as xlsxWorkbook
+from xlsxwriter.format import Format as xlsxFormat
+from xlsxwriter.worksheet import Worksheet as xlsxWorksheet
 from ..chart import Chart
 from ..data import Breakdown, Table, Value
+from ..formula.evaluation import get_error_code
 from ..theme.theme import CellStyle
 
+""" CONSTANTS """
+
+# Define the number of rows of data converted at once for writing
+WRITE_CHUNK_ROWS = 10000
+
+# Define the xlsxwriter indices of openpyxl border styles
+XLSX_BORDER_STYLES = {'thin': 1, 'medium': 2, 'dashed': 3, 'dotted': 4,
+                      'thick': 5, 'double': 6, 'hair': 7,
+                      'mediumDashed': 8, 'dashDot': 9, 'mediumDashDot': 10,
+                      'dashDotDot': 11, 'mediumDashDotDot': 12,
+                      'slantDashDot': 13}
+
+# Define the xlsxwriter indices of openpyxl fill patterns
+# NOTE: gradient fills ('path' and 'linear') have no xlsxwriter pattern
+XLSX_FILL_PATTERNS = {'solid': 1, 'mediumGray': 2, 'darkGray': 3,
+                      'lightGray': 4, 'darkHorizontal': 5, 'darkVertical': 6,
+                      'darkDown': 7, 'darkUp': 8, 'darkGrid': 9,
+                      'darkTrellis': 10, 'lightHorizontal': 11,
+                      'lightVertical': 12, 'lightDown': 13, 'lightUp': 14,
+                      'lightGrid': 15, 'lightTrellis': 16, 'gray125': 17,
+                      'gray0625': 18}
+
+# Define the xlsxwriter indices of openpyxl underline styles
+XLSX_UNDERLINE_STYLES = {'single': 1, 'double': 2, 'singleAccounting': 33,
+                         'doubleAccounting': 34}
+
+# Define the xlsxwriter names of openpyxl alignments
+XLSX_ALIGNMENTS = {'left': 'left', 'center': 'center', 'right': 'right',
+                   'fill': 'fill', 'justify': 'justify',
+                   'centerContinuous': 'center_across',
+                   'distributed': 'distributed'}
+
+# Define the xlsxwriter names of openpyxl vertical alignments
+XLSX_VERTICAL_ALIGNMENTS = {'top': 'top', 'center': 'vcenter',
+                            'justify': 'vjustify',
+                            'distributed': 'vdistributed'}
+
+# Define the xlsxwriter names of openpyxl tick marks
+XLSX_TICK_MARKS = {'in': 'inside', 'out': 'outside', 'cross': 'cross',
+                   None: 'none'}
+
+# Define the xlsxwriter names of openpyxl legend positions
+XLSX_LEGEND_POSITIONS = {'r': 'right', 'l': 'left', 't': 'top',
+                         'b': 'bottom', 'tr': 'top_right'}
+
 """ FUNCTIONS """
 
 
@@ -89,7 +145,7 @@ def format_multicell_dataset(dataset: Table | Breakdown,
 
         # Format the header range using the dataset's theme attribute's header
         # style
-        format_range(sheet, footprint['header'], dataset.theme.header)
+        format_range(sheet, footprint['header'], dataset.active_theme.header)
 
         # Get the number of columns in the DataSet's data
         num_cols = dataset.data.shape[1]
@@ -106,42 +162,658 @@ def format_multicell_dataset(dataset: Table | Breakdown,
         pass
 
     # Format the subheader range using the subheader style
-    format_range(sheet, footprint['subheader'], dataset.theme.subheader)
+    format_range(sheet, footprint['subheader'], dataset.active_theme.subheader)
 
     # For every column in the body footprint...
     for column, range in footprint['body'].items():
         # Format the column range using the body theme
-        format_range(sheet, range, dataset.theme.body)
+        format_range(sheet, range, dataset.active_theme.body)
 
     return None
 
 
+# Function to get the named style of a CellStyle in a workbook
+def get_named_style(workbook: openWorkbook, group: CellStyle) -> str:
+    """
+    Get the name of a workbook's named style matching a CellStyle,
+    registering it in the workbook once per distinct style.
+
+    Parameters
+    ----------
+    workbook : Workbook
+        Active openpyxl workbook.
+    group : CellStyle
+        Style to get the named style of.
+
+    Returns
+    -------
+    str
+        Name of the named style, derived from the style's properties.
+
+    """
+
+    # Get the style's properties
+    properties = (group.font, group.fill, group.border, group.alignment,
+                  group.protection, group.number_format)
+
+    # Get a name identifying the properties
+    name = f'ChromaQuant {crc32(repr(properties).encode()):08X}'
+
+    # If the workbook has no named style with the name, register it
+    if name not in workbook.named_styles:
+        workbook.add_named_style(
+            NamedStyle(name=name, font=group.font, fill=group.fill,
+                       border=group.border, alignment=group.alignment,
+                       protection=group.protection,
+                       number_format=group.number_format))
+
+    # Otherwise, pass
+    else:
+        pass
+
+    return name
+
+
 # Function to format a range of cells
 def format_range(sheet: Worksheet,
                  cell_range: str,
                  group: CellStyle):
+    """
+    Format a range of cells in Excel. The style is built and registered in
+    the workbook once, as a named style shared by every cell.
+
+    Parameters
+    ----------
+    sheet : Worksheet
+        Active openpyxl worksheet.
+    cell_range : str
+        Range of cells to format.
+    group : CellStyle
+        Style to format the cells by.
+
+    Returns
+    -------
+    None
+
+    """
+
+    # Get the rows of cells in the range
+    rows = sheet[cell_range]
+
+    # If the range is a single cell, get it as a row
+    rows = ((rows,),) if isinstance(rows, Cell) else rows
+
+    # Get the named style of the style, registering it once
+    name = get_named_style(sheet.parent, group)
+
+    # For every row in the range...
+    for row in rows:
+
+        # For every cell in the row...
+        for cell in row:
+            # Give the cell the named style
+            cell.style = name
+
+    return None
+
+
+# Function to get a cell's cached formula result as written by xlsxwriter
+def get_cached_value(value: Any, errors: bool = True) -> Any:
+    """
+    Converts a computed value to a cached formula result for xlsxwriter.
+
+    Parameters
+    ----------
+    value : Any
+        Computed value, with errors as NaN (see FormulaEvaluator).
+    errors : bool, optional
+        Whether to cache errors as their error codes, by default True.
+        xlsxwriter only writes error codes as the result of a single cell
+        formula, so array formulas cache errors as blanks.
+
+    Returns
+    -------
+    Any
+        Number, boolean or string to cache. Errors are cached as their
+        error code (e.g., '#DIV/0!'). Blanks, and errors of unknown kind,
+        are cached as empty strings, which Excel recalculates.
+
+    """
+
+    # If the value is a numpy scalar, convert it to Python
+    value = value.item() if isinstance(value, np.generic) else value
+
+    # If the value is an error, cache its code or a blank
+    if isinstance(value, float) and value != value:
+        code = get_error_code(value) if errors else None
+        return code if code is not None else ''
+
+    # Otherwise, if the value can be cached directly, return it
+    elif isinstance(value, (bool, int, float, str)):
+        return value
+
+    # Otherwise, cache a blank
+    else:
+        return ''
+
 
-    # If the total number of cells exceeds 10000...
-    if len(sheet[cell_range])*len(sheet[cell_range][0]) >= 10000:
-        # Do not format the cells
+# Function to get the xlsxwriter Format of a CellStyle
+def get_cell_format(group: CellStyle,
+                    workbook: xlsxWorkbook,
+                    formats: dict[Any, xlsxFormat]) -> xlsxFormat:
+    """
+    Translates a CellStyle into an xlsxwriter Format.
+
+    Parameters
+    ----------
+    group : CellStyle
+        Style to translate.
+    workbook : Workbook
+        Xlsx workbook to add the Format to.
+    formats : dict[Any, Format]
+        Cache of Formats already added to the workbook, keyed by their
+        properties and by the CellStyles translated into them. Styles with
+        the same properties share one Format.
+
+    Returns
+    -------
+    Format
+        Format with the properties of the CellStyle.
+
+    """
+
+    # If the style was already translated, return its Format
+    if group in formats:
+        return formats[group]
+
+    # Otherwise, pass
+    else:
         pass
-    # Otherwise...
+
+    # Get the Format with the style's properties, keeping it for the style
+    formats[group] = \
+        add_cell_format(get_cell_format_properties(group), workbook, formats)
+
+    return formats[group]
+
+
+# Function to get the xlsxwriter Format properties of a CellStyle
+def get_cell_format_properties(group: CellStyle) -> dict[str, Any]:
+    """
+    Translates a CellStyle into xlsxwriter Format properties.
+
+    Parameters
+    ----------
+    group : CellStyle
+        Style to translate.
+
+    Returns
+    -------
+    dict[str, Any]
+        Dictionary of the set Format properties.
+
+    """
+
+    # Get the openpyxl style objects
+    font = group.font
+    fill = group.fill
+    border = group.border
+    alignment = group.alignment
+    protection = group.protection
+
+    # Get the font properties
+    properties = {'font_name': font.name,
+                  'font_size': font.sz,
+                  'bold': bool(font.b),
+                  'italic': bool(font.i),
+                  'font_strikeout': bool(font.strike),
+                  'font_color': get_xlsx_color(font.color),
+                  'font_script': {'superscript': 1, 'subscript': 2}.get(
+                      font.vertAlign, 0),
+                  'underline': XLSX_UNDERLINE_STYLES.get(font.u, 0)}
+
+    # If the fill has a pattern, get the fill properties
+    if fill.fill_type in XLSX_FILL_PATTERNS:
+        properties |= {'pattern': XLSX_FILL_PATTERNS[fill.fill_type],
+                       'fg_color': get_xlsx_color(fill.fgColor),
+                       'bg_color': get_xlsx_color(fill.bgColor)}
+
+    # Otherwise, pass
+    else:
+        pass
+
+    # For every cell side...
+    for side in ('left', 'right', 'top', 'bottom'):
+        # Get the side's border style and color
+        properties[side] = \
+            XLSX_BORDER_STYLES.get(getattr(border, side).style, 0)
+        properties[f'{side}_color'] = \
+            get_xlsx_color(getattr(border, side).color)
+
+    # If the border has a diagonal, get the diagonal properties
+    if border.diagonalUp or border.diagonalDown:
+        properties |= {'diag_type': (1 if border.diagonalUp else 0) +
+                       (2 if border.diagonalDown else 0),
+                       'diag_border':
+                       XLSX_BORDER_STYLES.get(border.diagonal.style, 0),
+                       'diag_color': get_xlsx_color(border.diagonal.color)}
+
+    # Otherwise, pass
+    else:
+        pass
+
+    # Get the alignment properties
+    # NOTE: openpyxl rotations from 91 to 180 are angles below horizontal
+    properties |= {'align': XLSX_ALIGNMENTS.get(alignment.horizontal),
+                   'valign':
+                   XLSX_VERTICAL_ALIGNMENTS.get(alignment.vertical),
+                   'rotation':
+                   int(alignment.textRotation)
+                   if alignment.textRotation <= 90
+                   else 90 - int(alignment.textRotation),
+                   'text_wrap': bool(alignment.wrap_text),
+                   'shrink': bool(alignment.shrink_to_fit),
+                   'indent': int(alignment.indent)}
+
+    # Get the protection properties
+    properties |= {'locked': bool(protection.locked),
+                   'hidden': bool(protection.hidden)}
+
+    # Get the number format if not the default, otherwise pass
+    properties['num_format'] = \
+        group.number_format if group.number_format != 'General' else None
+
+    # Remove unset properties
+    properties = {key: value for key, value in properties.items()
+                  if value is not None}
+
+    return properties
+
+
+# Function to add an xlsxwriter Format with passed properties
+def add_cell_format(properties: dict[str, Any],
+                    workbook: xlsxWorkbook,
+                    formats: dict[Any, xlsxFormat]) -> xlsxFormat:
+    """
+    Adds an xlsxwriter Format to a workbook, unless one with the same
+    properties was already added.
+
+    Parameters
+    ----------
+    properties : dict[str, Any]
+        Format properties (see get_cell_format_properties).
+    workbook : Workbook
+        Xlsx workbook to add the Format to.
+    formats : dict[Any, Format]
+        Cache of Formats already added to the workbook (see
+        get_cell_format).
+
+    Returns
+    -------
+    Format
+        Format with the passed properties.
+
+    """
+
+    # Get a key of the properties
+    key = tuple(sorted(properties.items()))
+
+    # If there is no Format with these properties, add one
+    if key not in formats:
+        formats[key] = workbook.add_format(properties)
+
+    # Otherwise, pass
+    else:
+        pass
+
+    return formats[key]
+
+
+# Function to get the xlsxwriter Formats of a Table or Breakdown
+def get_dataset_formats(dataset: Table | Breakdown,
+                        workbook: xlsxWorkbook,
+                        formats: dict[Any, xlsxFormat] | None
+                        ) -> tuple[xlsxFormat | None, ...]:
+    """
+    Get the xlsxwriter Formats of a Table or Breakdown's theme.
+
+    Parameters
+    ----------
+    dataset : Table | Breakdown
+        Dataset to format.
+    workbook : Workbook
+        Xlsx workbook to add the Formats to.
+    formats : dict[Any, Format] | None
+        Cache of Formats (see get_cell_format), or None to not format.
+
+    Returns
+    -------
+    tuple[Format | None, ...]
+        Header, subheader and body Formats, or None if not formatting.
+
+    """
+
+    # If not formatting, return no Formats
+    if formats is None:
+        return None, None, None
+
+    # Otherwise, pass
+    else:
+        pass
+
+    # Get the header, subheader and body Formats
+    header_format = \
+        get_cell_format(dataset.active_theme.header, workbook, formats)
+    subheader_format = \
+        get_cell_format(dataset.active_theme.subheader, workbook, formats)
+    body_format = get_cell_format(dataset.active_theme.body, workbook, formats)
+
+    return header_format, subheader_format, body_format
+
+
+# Function to get the write of the header of a Table or Breakdown
+def get_header_write(dataset: Table | Breakdown,
+                     cell_format: xlsxFormat | None = None
+                     ) -> tuple[int, str, tuple]:
+    """
+    Get the write of the header of a Table or Breakdown, merged across the
+    dataset's columns.
+
+    Parameters
+    ----------
+    dataset : Table | Breakdown
+        Dataset with a header.
+    cell_format : Format | None, optional
+        Format of the header, by default None.
+
+    Returns
+    -------
+    tuple[int, str, tuple]
+        Row of the header, xlsxwriter Worksheet method and its arguments
+        (see write_rows).
+
+    """
+
+    # Get the number of columns in the DataSet's data
+    num_cols = dataset.data.shape[1]
+
+    # If the header covers more than one cell...
+    if num_cols > 1:
+
+        # Merge the header cell with adjacent cells
+        # to center the header across the DataFrame
+        return (dataset.start_row, 'merge_range',
+                (dataset.start_row, dataset.start_column,
+                 dataset.start_row, dataset.start_column + num_cols - 1,
+                 dataset.header, cell_format))
+
+    # Otherwise, write the header to its cell
+    # NOTE: Excel does not merge single cells
+    else:
+        return (dataset.start_row, 'write',
+                (dataset.start_row, dataset.start_column,
+                 dataset.header, cell_format))
+
+
+# Function to get the xlsxwriter color of an openpyxl Color
+def get_xlsx_color(color: Any) -> str | None:
+    """
+    Translates an openpyxl Color into an xlsxwriter color.
+
+    Parameters
+    ----------
+    color : Color
+        Color to translate.
+
+    Returns
+    -------
+    str | None
+        Color as '#RRGGBB', or None if the color is unset or not an RGB
+        color.
+
+    """
+
+    # Get the RGB string, if any
+    rgb = getattr(color, 'rgb', None)
+
+    # If the color is an RGB string, return its last six digits
+    if isinstance(rgb, str):
+        return '#' + rgb[-6:]
+
+    # Otherwise, return None
+    else:
+        return None
+
+
+# Function to get the writes of the body of a Table or Breakdown
+def iter_body_writes(first_row: int,
+                     first_column: int,
+                     data: DataFrame,
+                     cached_values: DataFrame | None = None,
+                     array_formulas: dict[str, str] | None = None,
+                     cell_format: xlsxFormat | None = None
+                     ) -> Iterator[tuple[int, str, tuple]]:
+    """
+    Get the writes of the body of a Table or Breakdown, in row order.
+
+    Parameters
+    ----------
+    first_row : int
+        0-based index of the first row of the body.
+    first_column : int
+        0-based index of the first column of the body.
+    data : DataFrame
+        Data to write.
+    cached_values : DataFrame | None, optional
+        Computed values of the data, written as the cached result of every
+        formula cell, by default None (no cached results).
+    array_formulas : dict[str, str] | None, optional
+        Dictionary with column names as keys and formulas as values. Each
+        column is written as one dynamic-array formula over its rows,
+        by default None.
+    cell_format : Format | None, optional
+        Format of every cell, by default None (unformatted).
+
+    Yields
+    ------
+    tuple[int, str, tuple]
+        Row, xlsxwriter Worksheet method and its arguments (see
+        write_rows). Data is converted for writing in chunks of
+        WRITE_CHUNK_ROWS rows.
+
+    """
+
+    # Get the positions of array formula columns
+    array_positions = [data.columns.get_loc(column)
+                       for column in (array_formulas or {})]
+
+    # Get the positions of other columns containing formulas, if caching
+    formula_positions = \
+        [j for j in range(data.shape[1]) if j not in array_positions
+         and data.iloc[:, j].dtype == object
+         and any(isinstance(cell, str) and cell.startswith('=')
+                 for cell in data.iloc[:, j])] \
+        if cached_values is not None else []
+
+    # Get the cells and computed values of every column containing formulas
+    formula_columns = {j: (data.iloc[:, j].tolist(),
+                           cached_values.iloc[:, j].tolist())
+                       for j in formula_positions}
+
+    # Get the computed values of every array formula column, if caching
+    array_columns = {j: cached_values.iloc[:, j].tolist()
+                     if cached_values is not None else None
+                     for j in array_positions}
+
+    # For every chunk of rows...
+    for start in range(0, len(data), WRITE_CHUNK_ROWS):
+
+        # Get the chunk's data
+        chunk = data.iloc[start:start + WRITE_CHUNK_ROWS]
+
+        # If there are no columns to write separately, get the data
+        if not array_positions and not formula_positions:
+            values = chunk.values
+
+        # Otherwise, blank out those columns
+        # NOTE: xlsxwriter skips blank cells without a format, and writes
+        # blank formatted cells that are overwritten below
+        else:
+            values = chunk.to_numpy(dtype=object, copy=True)
+            values[:, array_positions + formula_positions] = None
+
+        # For every row in the chunk...
+        for i, row_values in enumerate(values, start=start):
+
+            # Get the row's index in the worksheet
+            row = first_row + i
+
+            # Write the row's data
+            yield row, 'write_row', (row, first_column, row_values,
+                                     cell_format)
+
+            # For every column containing formulas...
+            for j, (cells, column_values) in formula_columns.items():
+
+                # If the cell is a formula, write it with its cached result
+                if isinstance(cells[i], str) and cells[i].startswith('='):
+                    yield row, 'write_formula', \
+                        (row, first_column + j, cells[i], cell_format,
+                         get_cached_value(column_values[i]))
+
+                # Otherwise, write the cell
+                else:
+                    yield row, 'write', (row, first_column + j, cells[i],
+                                         cell_format)
+
+            # For every array formula column...
+            for column, j in zip(array_formulas or {}, array_positions):
+
+                # If the row is the first, write the formula once over
+                # every row of the column, caching the row's computed value
+                if i == 0:
+                    yield row, 'write_dynamic_array_formula', \
+                        (row, first_column + j,
+                         first_row + len(data) - 1, first_column + j,
+                         array_formulas[column], cell_format,
+                         get_cached_value(array_columns[j][0], errors=False)
+                         if array_columns[j] is not None else 0)
+
+                # Otherwise, if caching, write the row's computed value
+                # NOTE: Excel stores the results of an array formula in
+                # its range
+                elif array_columns[j] is not None:
+                    yield row, 'write', \
+                        (row, first_column + j,
+                         get_cached_value(array_columns[j][i], errors=False),
+                         cell_format)
+
+                # Otherwise, pass
+                else:
+                    pass
+
+
+# Function to get the writes of a Table or Breakdown
+def iter_dataset_writes(dataset: Table | Breakdown,
+                        workbook: xlsxWorkbook,
+                        cached_values: DataFrame | None = None,
+                        array_formulas: dict[str, str] | None = None,
+                        formats: dict[Any, xlsxFormat] | None = None
+                        ) -> Iterator[tuple[int, str, tuple]]:
+    """
+    Get the writes of a Table or Breakdown, in row order.
+
+    Parameters
+    ----------
+    dataset : Table | Breakdown
+        Dataset to write.
+    workbook : Workbook
+        Xlsx workbook to add Formats to.
+    cached_values : DataFrame | None, optional
+        Computed values of the dataset, written as the cached result of
+        every formula cell, by default None (no cached results).
+    array_formulas : dict[str, str] | None, optional
+        Dictionary with column names as keys and formulas as values, each
+        written as one dynamic-array formula, by default None.
+    formats : dict[Any, Format] | None, optional
+        Cache of xlsxwriter Formats (see get_cell_format). If passed, the
+        dataset is written with its header and formatted using its theme,
+        by default None (unformatted, without header).
+
+    Yields
+    ------
+    tuple[int, str, tuple]
+        Row, xlsxwriter Worksheet method and its arguments (see
+        write_rows).
+
+    """
+
+    # Get the start row based on whether there is a header or not
+    start_row = \
+        dataset.start_row if dataset.header == '' \
+        else dataset.start_row + 1
+
+    # Get the header, subheader and body Formats, if formatting
+    header_format, subheader_format, body_format = \
+        get_dataset_formats(dataset, workbook, formats)
+
+    # If formatting and there is a header, write it
+    if formats is not None and dataset.header != '':
+        yield get_header_write(dataset, header_format)
+
+    # Otherwise, pass
     else:
-        # For every row in the range...
-        for row in sheet[cell_range]:
+        pass
+
+    # Write the headers
+    yield start_row, 'write_row', (start_row, dataset.start_column,
+                                   dataset.data.columns.tolist(),
+                                   subheader_format)
+
+    # Write the data
+    yield from iter_body_writes(start_row + 1, dataset.start_column,
+                                dataset.data, cached_values,
+                                array_formulas, body_format)
+
+
+# Function to write streams of writes to a worksheet in row order
+def write_rows(sheet: xlsxWorksheet,
+               streams: list[Iterable[tuple[int, str, tuple]]]):
+    """
+    Merges streams of writes targeting a worksheet into one stream ordered
+    by row, and applies each write. Rows are written in order, as needed
+    by xlsxwriter's constant memory mode.
 
-            # For every cell in the row...
-            for cell in row:
+    Parameters
+    ----------
+    sheet : Worksheet
+        Xlsx worksheet to write to.
+    streams : list[Iterable[tuple[int, str, tuple]]]
+        Streams of writes, each in row order. A write is a tuple of its
+        row, the name of the Worksheet method to call, and the method's
+        arguments. Writes to the same row are applied in stream order,
+        so later streams overwrite earlier ones.
+
+    Returns
+    -------
+    None
+
+    """
 
-                # Format the cell
-                format_cell(cell, group)
+    # For every write, in row order...
+    for _, method, arguments in heapq.merge(*streams,
+                                            key=itemgetter(0)):
+        # Apply the write
+        getattr(sheet, method)(*arguments)
 
     return None
 
 
 # Function to write a Breakdown to Excel
 def report_breakdown(breakdown: Breakdown,
-                     workbook: xlsxWorkbook):
+                     workbook: xlsxWorkbook,
+                     cached_values: DataFrame | None = None,
+                     formats: dict[Any, xlsxFormat] | None = None):
     """
     Writes a Pandas Breakdown to Excel using passed writer.
 
@@ -151,6 +823,13 @@ def report_breakdown(breakdown: Breakdown,
         Pandas Breakdown to export.
     workbook : Workbook
         Xlsx workbook to export to.
+    cached_values : DataFrame | None, optional
+        Computed values of the Breakdown, written as the cached result of
+        every formula cell, by default None (no cached results).
+    formats : dict[Any, Format] | None, optional
+        Cache of xlsxwriter Formats (see get_cell_format). If passed, the
+        Breakdown is written with its header and formatted using its theme,
+        by default None (unformatted, without header).
 
     Returns
     ----------
@@ -158,11 +837,6 @@ def report_breakdown(breakdown: Breakdown,
 
     """
 
-    # Get the start row based on whether there is a header or not
-    start_row = \
-        breakdown.start_row if breakdown.header == '' \
-        else breakdown.start_row + 1
-
     # If the sheet name is not in the workbook...
     if breakdown.sheet not in [worksheet.get_name()
                                for worksheet in workbook.worksheets()]:
@@ -175,14 +849,10 @@ def report_breakdown(breakdown: Breakdown,
     # Get the worksheet
     sheet = workbook.get_worksheet_by_name(breakdown.sheet)
 
-    # Write the headers
-    sheet.write_row(start_row,
-                    breakdown.start_column,
-                    breakdown.data.columns.tolist())
-
-    # Write the data
-    for i, row in enumerate(breakdown.data.values):
-        sheet.write_row(i + start_row + 1, breakdown.start_column, row)
+    # Write the Breakdown
+    write_rows(sheet,
+               [iter_dataset_writes(breakdown, workbook, cached_values,
+                                    formats=formats)])
 
     return None
 
@@ -224,9 +894,407 @@ def report_chart(chart: Chart,
     return None
 
 
+# Function to get the xlsxwriter chart type of a Chart
+def get_xlsx_chart_options(chart: Chart) -> dict[str, str] | None:
+    """
+    Translates the openpyxl chart type of a Chart into xlsxwriter options.
+
+    Parameters
+    ----------
+    chart : Chart
+        Chart to translate.
+
+    Returns
+    -------
+    dict[str, str] | None
+        Dictionary with the xlsxwriter chart type and subtype, or None if
+        xlsxwriter cannot write the chart type.
+
+    """
+
+    # Get the Chart's base chart
+    base = chart.base
+
+    # Get the xlsxwriter subtype of the chart's grouping, if any
+    subtype = {'stacked': 'stacked', 'percentStacked': 'percent_stacked'
+               }.get(getattr(base, 'grouping', None))
+
+    # If the chart is a scatter chart, get the subtype of its style
+    # NOTE: Excel draws unstyled scatter series as lines with markers
+    if base.tagname == 'scatterChart':
+        options = {'type': 'scatter',
+                   'subtype': {'marker': 'marker_only',
+                               'line': 'straight',
+                               'smooth': 'smooth',
+                               'smoothMarker': 'smooth_with_markers'
+                               }.get(base.scatterStyle,
+                                     'straight_with_markers')}
+
+    # Otherwise, if the chart is a bar chart, get its direction
+    elif base.tagname == 'barChart':
+        options = {'type': 'column' if base.barDir == 'col' else 'bar',
+                   'subtype': subtype}
+
+    # Otherwise, if the chart is a line or area chart...
+    elif base.tagname in ('lineChart', 'areaChart'):
+        options = {'type': base.tagname.removesuffix('Chart'),
+                   'subtype': subtype}
+
+    # Otherwise, if the chart is a pie or doughnut chart...
+    elif base.tagname in ('pieChart', 'doughnutChart'):
+        options = {'type': base.tagname.removesuffix('Chart')}
+
+    # Otherwise, if the chart is a radar chart, get its style
+    elif base.tagname == 'radarChart':
+        options = {'type': 'radar',
+                   'subtype': {'marker': 'with_markers',
+                               'filled': 'filled'}.get(base.radarStyle)}
+
+    # Otherwise, the chart type cannot be written
+    else:
+        return None
+
+    # Remove an unset subtype
+    options = {key: value for key, value in options.items()
+               if value is not None}
+
+    return options
+
+
+# Function to get the xlsxwriter options of an openpyxl chart title
+def get_xlsx_title_options(title: Any) -> dict[str, Any]:
+    """
+    Translates an openpyxl chart or axis Title into xlsxwriter options.
+
+    Parameters
+    ----------
+    title : Title | None
+        Title to translate.
+
+    Returns
+    -------
+    dict[str, Any]
+        Dictionary with the title's name, font and overlay, or an empty
+        dictionary if there is no rich text title.
+
+    """
+
+    # If there is no rich text title, return no options
+    if title is None or title.tx is None or title.tx.rich is None:
+        return {}
+
+    # Otherwise, pass
+    else:
+        pass
+
+    # Get the title's paragraphs
+    paragraphs = title.tx.rich.p
+
+    # Get the title's text, with one line per paragraph
+    options = {'name': '\n'.join(''.join(run.t for run in paragraph.r or [])
+                                 for paragraph in paragraphs)}
+
+    # Get the character properties of the first paragraph, if any
+    properties = \
+        paragraphs[0].pPr.defRPr \
+        if paragraphs and paragraphs[0].pPr is not None else None
+
+    # If there are character properties...
+    if properties is not None:
+
+        # Get the font name, size and weight, if set
+        font = {'name': properties.latin.typeface
+                if properties.latin is not None else None,
+                'size': properties.sz / 100
+                if properties.sz is not None else None,
+                'bold': properties.b}
+
+        # Add the set font properties
+        options['name_font'] = {key: value for key, value in font.items()
+                                if value is not None}
+
+    # Otherwise, pass
+    else:
+        pass
+
+    # Set the overlay if drawn over the chart, otherwise pass
+    options |= {'overlay': True} if title.overlay else {}
+
+    return options
+
+
+# Function to get the xlsxwriter options of an openpyxl chart axis
+def get_xlsx_axis_options(axis: Any) -> dict[str, Any]:
+    """
+    Translates an openpyxl chart axis into xlsxwriter options.
+
+    Parameters
+    ----------
+    axis : _BaseAxis
+        Axis to translate.
+
+    Returns
+    -------
+    dict[str, Any]
+        Dictionary with the axis' title, visibility, gridlines, tick marks
+        and units.
+
+    """
+
+    # Get the axis' visibility, gridlines and tick marks
+    options = {'visible': not axis.delete,
+               'major_gridlines':
+               {'visible': axis.majorGridlines is not None},
+               'minor_gridlines':
+               {'visible': axis.minorGridlines is not None},
+               'major_tick_mark':
+               XLSX_TICK_MARKS.get(axis.majorTickMark, 'none'),
+               'minor_tick_mark':
+               XLSX_TICK_MARKS.get(axis.minorTickMark, 'none')}
+
+    # Get the axis' title name and font, if any
+    # NOTE: xlsxwriter has no overlay setting for axis titles
+    options |= {key: value for key, value
+                in get_xlsx_title_options(axis.title).items()
+                if key != 'overlay'}
+
+    # For every tick unit...
+    for unit, option in (('majorUnit', 'major_unit'),
+                         ('minorUnit', 'minor_unit')):
+
+        # Get the unit if set
+        # NOTE: only numeric axes have units
+        if getattr(axis, unit, None) is not None:
+            options[option] = getattr(axis, unit)
+
+        # Otherwise, pass
+        else:
+            pass
+
+    return options
+
+
+# Function to get the formula of an openpyxl series data source
+def get_xlsx_series_formula(source: Any) -> str | None:
+    """
+    Get the range formula of an openpyxl series data source.
+
+    Parameters
+    ----------
+    source : NumDataSource | AxDataSource | SeriesLabel | None
+        Data source of a series' values, categories or title.
+
+    Returns
+    -------
+    str | None
+        Range formula starting with '=', or None if there is no range.
+
+    """
+
+    # For every kind of reference...
+    for reference in ('numRef', 'strRef'):
+
+        # If the source has a reference of this kind, return its formula
+        if getattr(getattr(source, reference, None), 'f', None):
+            return '=' + getattr(source, reference).f
+
+        # Otherwise, pass
+        else:
+            pass
+
+    return None
+
+
+# Function to get the xlsxwriter layout of a Chart
+def get_xlsx_chart_layout(chart: Chart) -> dict[str, Any]:
+    """
+    Translates the parts of a Chart's openpyxl chart that do not depend on
+    its data into xlsxwriter options (see report_xlsx_chart).
+
+    Parameters
+    ----------
+    chart : Chart
+        Chart to translate.
+
+    Returns
+    -------
+    dict[str, Any]
+        Dictionary with the chart's type 'options', and the options of
+        every xlsxwriter Chart method to call, keyed by the method's name
+        (e.g., 'set_title').
+
+    Raises
+    ------
+    ValueError
+        If xlsxwriter cannot write the Chart's chart type.
+
+    """
+
+    # Get the xlsxwriter chart type
+    options = get_xlsx_chart_options(chart)
+
+    # If the chart type cannot be written, raise an error
+    if options is None:
+        raise ValueError('xlsxwriter cannot write charts of type '
+                         f'{chart.base.tagname}.')
+
+    # Otherwise, pass
+    else:
+        pass
+
+    # Get the Chart's base chart
+    base = chart.base
+
+    # Get the chart type and title
+    layout = {'options': options,
+              'set_title': get_xlsx_title_options(base.title)}
+
+    # If the chart has axes, get them
+    if hasattr(base, 'x_axis'):
+        layout['set_x_axis'] = get_xlsx_axis_options(base.x_axis)
+        layout['set_y_axis'] = get_xlsx_axis_options(base.y_axis)
+
+    # Otherwise, pass
+    else:
+        pass
+
+    # If there is no legend, remove it
+    if base.legend is None:
+        layout['set_legend'] = {'none': True}
+
+    # Otherwise, get its position
+    # NOTE: xlsxwriter only overlays legends on the left or right
+    else:
+        position = XLSX_LEGEND_POSITIONS.get(base.legend.position, 'right')
+        layout['set_legend'] = \
+            {'position': 'overlay_' + position
+             if base.legend.overlay
+             and position in ('left', 'right', 'top_right')
+             else position}
+
+    # Get the plot area outline, if any
+    line = base.plot_area.spPr.ln \
+        if base.plot_area.spPr is not None else None
+
+    # If there is a plot area outline, get its width and color
+    # NOTE: openpyxl line widths are in EMU, 12700 per point
+    if line is not None:
+        layout['set_plotarea'] = \
+            {'border': {key: value for key, value in
+                        {'width': line.w / 12700 if line.w else None,
+                         'color': '#' + line.solidFill.srgbClr
+                         if line.solidFill is not None
+                         and isinstance(line.solidFill.srgbClr, str)
+                         else None}.items()
+                        if value is not None}}
+
+    # Otherwise, pass
+    else:
+        pass
+
+    # If the chart has no outline, remove it
+    if base.graphical_properties is not None \
+            and base.graphical_properties.line is not None \
+            and base.graphical_properties.line.noFill:
+        layout['set_chartarea'] = {'border': {'none': True}}
+
+    # Otherwise, pass
+    else:
+        pass
+
+    # Get the chart style if any, otherwise pass
+    if base.style is not None:
+        layout['set_style'] = base.style
+    else:
+        pass
+
+    # Get the chart size
+    # NOTE: openpyxl sizes are in centimetres, and xlsxwriter sizes in pixels
+    layout['set_size'] = {'width': round(base.width / 2.54 * 96),
+                          'height': round(base.height / 2.54 * 96)}
+
+    return layout
+
+
+# Function to report a Chart with xlsxwriter
+def report_xlsx_chart(chart: Chart,
+                      workbook: xlsxWorkbook,
+                      layout: dict[str, Any] | None = None):
+    """
+    Writes a Chart to Excel with xlsxwriter, translating its openpyxl chart
+    (see get_xlsx_chart_options).
+
+    Parameters
+    ----------
+    chart : Chart
+        Chart to report.
+    workbook : Workbook
+        Xlsx workbook to export to.
+    layout : dict[str, Any] | None, optional
+        Previously translated layout of the Chart (see
+        get_xlsx_chart_layout), by default None (translated again).
+
+    Returns
+    -------
+    None
+
+    Raises
+    ------
+    ValueError
+        If xlsxwriter cannot write the Chart's chart type.
+
+    """
+
+    # Get the Chart's layout, if not passed
+    layout = get_xlsx_chart_layout(chart) if layout is None else layout
+
+    # Add an xlsxwriter chart
+    xlsx_chart = workbook.add_chart(layout['options'])
+
+    # For every series in the base chart...
+    for series in chart.base.series:
+
+        # Get the series' values, categories and title
+        # NOTE: scatter series have x and y values instead
+        series_options = \
+            {'values': get_xlsx_series_formula(
+                series.yVal if series.yVal is not None else series.val),
+             'categories': get_xlsx_series_formula(
+                series.xVal if series.xVal is not None else series.cat),
+             'name': get_xlsx_series_formula(series.tx)}
+
+        # Add the series with its set options
+        xlsx_chart.add_series({key: value for key, value
+                               in series_options.items()
+                               if value is not None})
+
+    # For every other part of the layout, set it
+    for method, options in layout.items():
+        if method != 'options':
+            getattr(xlsx_chart, method)(options)
+
+    # If Chart's sheet does not exist in workbook...
+    if workbook.get_worksheet_by_name(chart.sheet) is None:
+        # Create it
+        workbook.add_worksheet(chart.sheet)
+
+    # Otherwise, pass
+    else:
+        pass
+
+    # Insert the chart at its anchor
+    workbook.get_worksheet_by_name(chart.sheet).insert_chart(
+        chart.start_row, chart.start_column, xlsx_chart)
+
+    return None
+
+
 # Function to write a Table to Excel
 def report_table(table: Table,
-                 workbook: xlsxWorkbook):
+                 workbook: xlsxWorkbook,
+                 array_formulas: dict[str, str] | None = None,
+                 cached_values: DataFrame | None = None,
+                 formats: dict[Any, xlsxFormat] | None = None):
     """
     Writes a Table to Excel.
 
@@ -236,6 +1304,17 @@ def report_table(table: Table,
         Table to export.
     workbook : Workbook
         Xlsx workbook to export to.
+    array_formulas : dict[str, str] | None, optional
+        Dictionary with column names as keys and formulas as values. Each
+        column is written as one dynamic-array formula over its rows instead
+        of cell by cell, by default None.
+    cached_values : DataFrame | None, optional
+        Computed values of the Table, written as the cached result of
+        every formula cell, by default None (no cached results).
+    formats : dict[Any, Format] | None, optional
+        Cache of xlsxwriter Formats (see get_cell_format). If passed, the
+        Table is written with its header and formatted using its theme,
+        by default None (unformatted, without header).
 
     Returns
     -------
@@ -243,11 +1322,6 @@ def report_table(table: Table,
 
     """
 
-    # Get the start row based on whether there is a header or not
-    start_row = \
-        table.start_row if table.header == '' \
-        else table.start_row + 1
-
     # If the sheet name is not in the workbook...
     if table.sheet not in [worksheet.get_name()
                            for worksheet in workbook.worksheets()]:
@@ -260,14 +1334,10 @@ def report_table(table: Table,
     # Get the worksheet
     sheet = workbook.get_worksheet_by_name(table.sheet)
 
-    # Write the headers
-    sheet.write_row(start_row,
-                    table.start_column,
-                    table.data.columns.tolist())
-
-    # Write the data
-    for i, row in enumerate(table.data.values):
-        sheet.write_row(i + start_row + 1, table.start_column, row)
+    # Write the Table
+    write_rows(sheet,
+               [iter_dataset_writes(table, workbook, cached_values,
+                                    array_formulas, formats=formats)])
 
     return None
 
@@ -312,24 +1382,203 @@ def report_value(value: Value,
         # Write the header to the start cell
         sheet[start_cell] = value.header
         # Format the cell using the value's theme's header style
-        format_cell(sheet[start_cell], value.theme.header)
+        format_cell(sheet[start_cell], value.active_theme.header)
         # Write the value to the second cell
         sheet[second_cell] = value.data
         # Format the cell using the value's theme's body style
-        format_cell(sheet[second_cell], value.theme.body)
+        format_cell(sheet[second_cell], value.active_theme.body)
 
     # Otherwise...
     else:
         # Write the value to the start cell
         sheet[start_cell] = value.data
         # Format the cell using the value's theme's body style
-        format_cell(sheet[start_cell], value.theme.body)
+        format_cell(sheet[start_cell], value.active_theme.body)
+
+    return None
+
+
+# Function to get the writes of a Value
+def iter_value_writes(value: Value,
+                      workbook: xlsxWorkbook,
+                      formats: dict[Any, xlsxFormat],
+                      cached_value: Any = None
+                      ) -> Iterator[tuple[int, str, tuple]]:
+    """
+    Get the writes of a Value, in row order.
+
+    Parameters
+    ----------
+    value: Value
+        Value to write.
+    workbook : Workbook
+        Xlsx workbook to add Formats to.
+    formats : dict[Any, Format]
+        Cache of xlsxwriter Formats (see get_cell_format).
+    cached_value : Any, optional
+        Computed value, written as the cached result of a formula,
+        by default None (no cached result).
+
+    Yields
+    ------
+    tuple[int, str, tuple]
+        Row, xlsxwriter Worksheet method and its arguments (see
+        write_rows).
+
+    """
+
+    # Get the row of the value, below the header if any
+    row = value.start_row if value.header == '' else value.start_row + 1
+
+    # If there is a header...
+    if value.header != '':
+        # Write the header using the value's theme's header style
+        yield value.start_row, 'write', \
+            (value.start_row, value.start_column, value.header,
+             get_cell_format(value.active_theme.header, workbook, formats))
+
+    # Otherwise, pass
+    else:
+        pass
+
+    # Get the value's theme's body style
+    body_format = get_cell_format(value.active_theme.body, workbook, formats)
+
+    # If the value is a formula with a computed value, write both
+    if isinstance(value.data, str) and value.data.startswith('=') \
+            and cached_value is not None:
+        yield row, 'write_formula', (row, value.start_column, value.data,
+                                     body_format,
+                                     get_cached_value(cached_value))
+
+    # Otherwise, write the value
+    else:
+        yield row, 'write', (row, value.start_column, value.data,
+                             body_format)
+
+
+# Function to write a Value to Excel with xlsxwriter
+def report_xlsx_value(value: Value,
+                      workbook: xlsxWorkbook,
+                      formats: dict[Any, xlsxFormat],
+                      cached_value: Any = None):
+    """
+    Writes a Value to Excel with xlsxwriter.
+
+    Parameters
+    ----------
+    value: Value
+        Value to export.
+    workbook : Workbook
+        Xlsx workbook to export to.
+    formats : dict[Any, Format]
+        Cache of xlsxwriter Formats (see get_cell_format).
+    cached_value : Any, optional
+        Computed value, written as the cached result of a formula,
+        by default None (no cached result).
+
+    Returns
+    -------
+    None
+
+    """
+
+    # If Value's sheet does not exist in workbook...
+    if workbook.get_worksheet_by_name(value.sheet) is None:
+        # Create it
+        workbook.add_worksheet(value.sheet)
+
+    # Otherwise, pass
+    else:
+        pass
+
+    # Write the Value to its sheet
+    write_rows(workbook.get_worksheet_by_name(value.sheet),
+               [iter_value_writes(value, workbook, formats, cached_value)])
 
     return None
 
 
+# Function to get column widths fitting the values of DataSets
+def get_col_widths(datasets: list[Table | Breakdown | Value]
+                   ) -> dict[str, dict[int, int]]:
+    """
+    Get the width of every column needed to fit the values of DataSets,
+    computed from their data before writing.
+
+    Parameters
+    ----------
+    datasets : list[Table | Breakdown | Value]
+        DataSets to report.
+
+    Returns
+    -------
+    dict[str, dict[int, int]]
+        Dictionary with worksheet names as keys and dictionaries of column
+        widths by 0-based column index as values. Every column up to the
+        last one written has a width between 8 and 25.
+
+    """
+
+    # Create a dictionary of the maximum length of values by column index,
+    # for every worksheet name
+    lengths: dict[str, dict[int, int]] = {}
+
+    # For every DataSet...
+    for dataset in datasets:
+
+        # Get the lengths for the DataSet's worksheet
+        sheet_lengths = lengths.setdefault(dataset.sheet, {})
+
+        # If the DataSet is a Value, get the length of its header and data
+        if isinstance(dataset, Value):
+            dataset_lengths = \
+                [max(len(str(dataset.header)), len(str(dataset.data)))]
+
+        # Otherwise...
+        else:
+
+            # Get the maximum length of every column's values
+            # NOTE: mapping str over each column's list of values is faster
+            # than pandas' string methods, which convert every value first
+            dataset_lengths = \
+                [max(map(len, map(str, column.tolist())), default=0)
+                 for _, column in dataset.data.items()]
+
+            # Get the length of every column's name if longer
+            dataset_lengths = \
+                [max(length, len(str(column))) for length, column
+                 in zip(dataset_lengths, dataset.data.columns)]
+
+            # Get the length of the header in the first column if longer
+            if dataset_lengths:
+                dataset_lengths[0] = \
+                    max(dataset_lengths[0], len(str(dataset.header)))
+
+            # Otherwise, pass
+            else:
+                pass
+
+        # For every column of the DataSet and its length...
+        for column, length in enumerate(dataset_lengths,
+                                        start=dataset.start_column):
+            # Get the maximum length of all values in the column
+            sheet_lengths[column] = max(sheet_lengths.get(column, 0), length)
+
+    # Get the width of every column up to the last one written, limiting
+    # each width to between 8 and 25
+    widths = {sheet_name:
+              {column: min(max(sheet_lengths.get(column, 0), 8), 25)
+               for column in range(max(sheet_lengths, default=-1) + 1)}
+              for sheet_name, sheet_lengths in lengths.items()}
+
+    return widths
+
+
 # Function to set all columns to a default width
-def set_default_col_widths(workbook: openWorkbook):
+def set_default_col_widths(workbook: openWorkbook,
+                           datasets: list[Table | Breakdown | Value]
+                           | None = None):
     """
     Sets all columns in an active openpyxl workbook to a default width.
 
@@ -337,6 +1586,10 @@ def set_default_col_widths(workbook: openWorkbook):
     ----------
     workbook : Workbook
         Active openpyxl workbook.
+    datasets : list[Table | Breakdown | Value] | None, optional
+        DataSets written to the workbook. If passed, widths are computed
+        from their data (see get_col_widths) instead of reading every
+        cell of the workbook, by default None.
 
     Returns
     -------
@@ -344,6 +1597,23 @@ def set_default_col_widths(workbook: openWorkbook):
 
     """
 
+    # If DataSets are passed...
+    if datasets is not None:
+
+        # For every worksheet name and its column widths...
+        for sheet_name, widths in get_col_widths(datasets).items():
+            # For every column and its width...
+            for column, column_width in widths.items():
+                # Set the column's width
+                workbook[sheet_name].column_dimensions[
+                    get_column_letter(column + 1)].width = column_width
+
+        return None
+
+    # Otherwise, pass
+    else:
+        pass
+
     # For every worksheet in the workbook...
     for sheet in workbook.worksheets:
         # For every column in the sheet...
@@ -361,3 +1631,34 @@ def set_default_col_widths(workbook: openWorkbook):
                 column_width
 
     return None
+
+
+# Function to set column widths fitting the written DataSets
+def set_xlsx_col_widths(workbook: xlsxWorkbook,
+                        datasets: list[Table | Breakdown | Value]):
+    """
+    Sets the width of every column in an xlsxwriter workbook to fit the
+    values written from passed DataSets (see get_col_widths).
+
+    Parameters
+    ----------
+    workbook : Workbook
+        Xlsx workbook.
+    datasets : list[Table | Breakdown | Value]
+        DataSets written to the workbook.
+
+    Returns
+    -------
+    None
+
+    """
+
+    # For every worksheet name and its column widths...
+    for sheet_name, widths in get_col_widths(datasets).items():
+        # For every column and its width...
+        for column, column_width in widths.items():
+            # Set the column's width
+            workbook.get_worksheet_by_name(sheet_name).set_column(
+                column, column, column_width)
+
+    return None
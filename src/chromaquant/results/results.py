@@ -6,17 +6,33 @@ This submodule contains the Results class definition.
 
 """
 
+from __future__ import annotations
+from collections.abc import Iterator
+from contextlib import contextmanager
+from io import BytesIO
+import json
 import logging
+import numpy as np
 import openpyxl
+from openpyxl.utils import column_index_from_string, \
+                           coordinate_to_tuple
+import os
+from pandas import DataFrame, concat
 from pandas.io.formats import excel
-import xlsxwriter
+from typing import Any, IO, TYPE_CHECKING
 from ..data import Table, Value, Breakdown
-from .reporting_tools import report_breakdown, report_chart, report_table, \
-                             report_value, set_default_col_widths, \
-                             format_multicell_dataset
+from .exporting_tools import EXPORT_FORMATS, check_file_format, \
+                             get_export_frame, write_export_frame
+from .layout_tools import SNAPSHOT_FILE, SNAPSHOT_FORMATS, embed_layout, \
+                          read_layout, read_regions, read_snapshot_frame, \
+                          to_json_value, write_snapshot_frame
 from ..chart import Chart
 from ..logging_and_handling import setup_logger, setup_error_logging
-from ..formula import Formula
+from ..formula import Formula, FormulaEvaluator
+from .results_spec import ResultsSpec
+if TYPE_CHECKING:
+    import xlsxwriter
+    from .report_template import ReportTemplate
 
 """ LOGGING AND HANDLING """
 
@@ -54,13 +70,103 @@ class Results():
         # Initialize the charts list
         self._charts: list[Chart] = []
 
+        # Initialize a dictionary of DataSets by their ids
+        self._datasets: dict[str, Table | Value | Breakdown] = {}
+
         # Initialize the DataSet references dictionary
         self._dataset_references = {}
 
         # Create an empty cache for added formulas
         self._formula_cache = []
 
+        # Initialize the depth of nested batch contexts
+        self._batch_depth = 0
+
+        # Initialize the ids of DataSets whose updates were deferred while
+        # batching, and a flag for deferred updates of every DataSet
+        self._pending_ids: set[str] = set()
+        self._pending_all = False
+
     """ METHODS """
+    # Method to defer dataset updates until the end of a block
+    @contextmanager
+    def batch(self) -> Iterator['Results']:
+        """
+        Context manager that defers updates triggered by changes to DataSets
+        (e.g., setting a sheet, start_cell or header) until the block exits,
+        so formulas and breakdowns are recomputed once.
+
+        Yields
+        ------
+        results : Results
+            The current Results.
+
+        Examples
+        --------
+        >>> with results.batch():
+        ...     table.sheet = 'Some Sheet'
+        ...     value.start_cell = '$B$2'
+
+        Notes
+        -----
+        Batches may be nested, in which case updates are applied when the
+        outermost block exits. If the block raises an exception, deferred
+        updates are kept until the next call to flush or update_datasets.
+
+        """
+
+        # Increase the batch depth
+        self._batch_depth += 1
+
+        # Try to run the block
+        try:
+            yield self
+
+        # Decrease the batch depth whether or not the block succeeded
+        finally:
+            self._batch_depth -= 1
+
+        # If this is the outermost batch, apply deferred updates
+        if self._batch_depth == 0:
+            self.flush()
+
+        # Otherwise, pass
+        else:
+            pass
+
+        return None
+
+    # Method to apply deferred dataset updates
+    @error_logging
+    def flush(self):
+        """
+        Apply any dataset updates deferred by batch. Does nothing if no
+        updates are pending.
+
+        Returns
+        -------
+        None
+        """
+
+        # If an update is pending...
+        if self._pending_all or self._pending_ids:
+
+            # Get the changed DataSet ids, or None if all changed
+            changed_ids = None if self._pending_all else self._pending_ids
+
+            # Clear the pending updates
+            self._pending_ids = set()
+            self._pending_all = False
+
+            # Recompute affected formulas and breakdowns
+            self._recompute_datasets(changed_ids)
+
+        # Otherwise, pass
+        else:
+            pass
+
+        return None
+
     # Method to add a new Breakdown to the results
     @error_logging
     def add_breakdown(self, breakdown: Breakdown):
@@ -83,6 +189,9 @@ class Results():
         # Add the breakdown to the breakdowns list
         self._breakdowns.append(breakdown)
 
+        # Add the breakdown to the DataSets dictionary
+        self._datasets[breakdown.id] = breakdown
+
         return None
 
     # Method to add a new Chart to the results
@@ -131,48 +240,73 @@ class Results():
         None
         """
 
-        # Update dataset references
-        self.update_references()
-
         # Add a formula to the cache
         self._formula_cache.append(formula)
 
+        # Insert references and write the formulas to the pointed DataSet
+        self._apply_formula(formula)
+
+        return None
+
+    # Method to insert references into a Formula and write the results
+    @error_logging
+    def _apply_formula(self, formula: Formula):
+        """
+        Inserts references into a Formula's strings and writes the results
+        to the DataSet pointed to in the Formula.
+
+        Parameters
+        ----------
+        formula : Formula
+            A Formula instance previously added to Results.
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        KeyError
+            If the Formula has no defined output location.
+        """
+
+        # Update dataset references
+        self.update_references()
+
         # Get the new formulas
         formula.insert_references(self._dataset_references)
 
         # If there is a 'table' and 'key' in the formula's attributes...
         if formula.table_pointer != '' and formula.key_pointer != '':
 
-            # For every table...
-            for i in range(len(self._tables)):
+            # Get the pointed table, if it is in Results
+            table = self._datasets.get(formula.table_pointer)
 
-                # If the table id is equal to the formula's...
-                if self._tables[i].id == formula.table_pointer:
+            # If the table is in Results...
+            if table is not None:
+                # Add the new formulas to the pointed column
+                # NOTE: An array formula is one string, repeated in every row
+                table.data[formula.key_pointer] = \
+                    formula.referenced_formulas
 
-                    # Add the new formulas to the pointed column
-                    self._tables[i].data[formula.key_pointer] = \
-                        formula.referenced_formulas
-
-                # Otherwise, pass
-                else:
-                    pass
+            # Otherwise, pass
+            else:
+                pass
 
         # Otherwise, if there is a 'key' in the formula's pointer...
         elif formula.key_pointer != '':
 
-            # For every key...
-            for i in range(len(self._values)):
+            # Get the pointed value, if it is in Results
+            value = self._datasets.get(formula.key_pointer)
 
-                # If the table id is equal to the formula's...
-                if self._values[i].id == formula.key_pointer:
+            # If the value is in Results...
+            if value is not None:
+                # Add the new formulas to the value
+                value.data = formula.referenced_formulas
 
-                    # Add the new formulas to the pointed column
-                    self._values[i].data = \
-                        formula.referenced_formulas
-
-                # Otherwise, pass
-                else:
-                    pass
+            # Otherwise, pass
+            else:
+                pass
 
         # Otherwise, raise an error
         else:
@@ -202,6 +336,9 @@ class Results():
         # Add the table to the tables list
         self._tables.append(table)
 
+        # Add the table to the DataSets dictionary
+        self._datasets[table.id] = table
+
         return None
 
     # Method to add a new value to the results
@@ -225,56 +362,1248 @@ class Results():
         # Add the value to the values list
         self._values.append(value)
 
+        # Add the value to the DataSets dictionary
+        self._datasets[value.id] = value
+
         return None
 
     # Method to write passed Results to Excel
     @error_logging
     def report_results(self,
-                       path: str = 'report.xlsx'):
+                       path: str | os.PathLike | IO[bytes] = 'report.xlsx',
+                       cache_values: bool = True,
+                       single_pass: bool = True,
+                       constant_memory: bool = False,
+                       processes: int = 1):
         """
         Reports Results to an Excel file.
 
         Parameters
         ----------
-        path : str, optional
-            Path to report, by default 'report.xlsx'
+        path : str | os.PathLike | IO[bytes], optional
+            Path to report, or a writable binary file-like object (e.g.,
+            a BytesIO) to report to without using the filesystem, by
+            default 'report.xlsx'. File-like objects are left open, with
+            their position after the report.
+        cache_values : bool, optional
+            Whether to compute the value of every formula cell in Tables
+            and Breakdowns (see evaluate) and write it as the formula's
+            cached result, by default True
+        single_pass : bool, optional
+            Whether to write the whole report in one pass with xlsxwriter,
+            translating themes and Charts. If False, or if some Chart
+            cannot be translated, Tables and Breakdowns are written with
+            xlsxwriter and the file is reopened with openpyxl to write
+            everything else, by default True
+        constant_memory : bool, optional
+            Whether to use xlsxwriter's constant memory mode when reporting
+            in one pass, flushing every row to disk once written instead of
+            keeping the whole workbook in memory, by default False
+        processes : int, optional
+            Number of processes rendering the XML of worksheets written
+            with xlsxwriter when the workbook is closed, by default 1. Use
+            more than one process for reports with several large sheets.
+            Ignored in constant memory mode, where rows are rendered as
+            they are written.
 
         Returns
         -------
         None
+
+        Examples
+        --------
+        >>> output = BytesIO()
+        >>> results.report_results(output)
+        >>> report_bytes = output.getvalue()
+
         """
+        # Import the reporting tools
+        # NOTE: imported when first reporting, so importing Results does not
+        # import xlsxwriter
+        from .reporting_tools import get_xlsx_chart_options
+
         # Set the ExcelFormatter to have no header style for pandas
         excel.ExcelFormatter.header_style = None
 
+        # Get the computed values to cache, if any
+        cached_values = self._get_cached_values() if cache_values else {}
+
+        # Get whether xlsxwriter can write every Chart
+        charts_translatable = \
+            all(get_xlsx_chart_options(chart) is not None
+                for chart in self._charts)
+
+        # If reporting in one pass is possible, report with xlsxwriter
+        if single_pass and charts_translatable:
+            self._report_single_pass(path, cached_values, constant_memory,
+                                     processes=processes)
+
+        # Otherwise, report in two passes
+        else:
+
+            # If reporting in one pass was asked for, warn why it is not
+            if single_pass:
+                logger.warning('Some Charts cannot be written with '
+                               'xlsxwriter, reporting with openpyxl.')
+
+            # Otherwise, pass
+            else:
+                pass
+
+            # Report with xlsxwriter then openpyxl
+            self._report_two_pass(path, cached_values, processes)
+
+        # Write the layout of sharded Tables, if any
+        self._write_shard_manifest(path)
+
+        return None
+
+    # Method to compile the layout of Results into a report template
+    @error_logging
+    def compile_template(self) -> ReportTemplate:
+        """
+        Compiles the layout of Results into a template reused to report new
+        data (see ReportTemplate). The Format properties of every theme and
+        the options of every Chart are translated once, so reports of many
+        samples sharing the layout only write their data.
+
+        Returns
+        -------
+        ReportTemplate
+            Compiled template of the Results' layout.
+
+        Raises
+        ------
+        ValueError
+            If some Chart cannot be written with xlsxwriter.
+
+        Examples
+        --------
+        >>> template = results.compile_template()
+        >>> for i, data_frame in enumerate(samples):
+        ...     template.report(f'report_{i}.xlsx', {table.id: data_frame})
+
+        """
+
+        # Import the ReportTemplate class
+        # NOTE: imported when first used, since it imports xlsxwriter
+        from .report_template import ReportTemplate
+
+        return ReportTemplate(self)
+
+    # Method to export Results to columnar files
+    @error_logging
+    def export_results(self,
+                       directory: str | os.PathLike = 'export',
+                       file_format: str = 'parquet'
+                       ) -> dict[str, Any]:
+        """
+        Exports every Table, Breakdown and Value to columnar files, with
+        formulas resolved to their computed values (see evaluate), and a
+        'manifest.json' file describing where each DataSet is reported and
+        the formula of every column.
+
+        Every Table and Breakdown is written to a file named by its id, and
+        every Value to one 'values' file with 'id' and 'value' columns.
+        Computed columns are written without copying where possible.
+
+        Parameters
+        ----------
+        directory : str | os.PathLike, optional
+            Directory to export to, created if needed, by default 'export'
+        file_format : str, optional
+            Format of the files, one of 'parquet', 'feather' or 'csv',
+            by default 'parquet'. Parquet and Feather files need pyarrow
+            (installed with the 'export' extra), while CSV files always
+            work.
+
+        Returns
+        -------
+        dict[str, Any]
+            Manifest of the export, with the 'format' of the files and
+            lists of exported 'tables', 'breakdowns' and 'values'. Tables
+            and Breakdowns list their 'id', 'sheet', 'start_cell',
+            'header', 'file' and 'columns', each with its 'name' and
+            'formula' (None if not output by a Formula). The formula of a
+            Breakdown column is that of its first cell, which the column's
+            other cells repeat with relative references moved down a row
+            (None if the column holds no formulas). Values list their
+            'id', 'sheet', 'start_cell', 'header' and 'formula', with the
+            'values_file' holding them.
+
+        Raises
+        ------
+        ValueError
+            If the format is not supported, or if some formula cannot be
+            evaluated.
+        ImportError
+            If the format needs pyarrow and it is not installed.
+
+        Examples
+        --------
+        >>> manifest = results.export_results('export', 'parquet')
+        >>> data = pandas.read_parquet(f"export/{manifest['tables'][0]"
+        ...                            "['file']}")
+
+        """
+
+        # If the format is not supported, raise an error
+        if file_format not in EXPORT_FORMATS:
+            raise ValueError(f'Unsupported export format "{file_format}", '
+                             f'expected one of {list(EXPORT_FORMATS)}')
+
+        # Otherwise, pass
+        else:
+            pass
+
+        # Check that the format's dependencies are installed
+        check_file_format(file_format)
+
+        # Get the extension of exported files
+        extension = EXPORT_FORMATS[file_format]
+
+        # Create the export directory, if needed
+        os.makedirs(directory, exist_ok=True)
+
+        # Get an evaluator of every DataSet
+        # NOTE: columns are evaluated one at a time, so computed columns
+        # reference the Tables' data where they hold no formulas
+        evaluator = FormulaEvaluator(self._tables,
+                                     self._values,
+                                     self._breakdowns,
+                                     self._formula_cache)
+
+        # Get the Formula output to every Table column and Value
+        formulas = {(formula.table_pointer, formula.key_pointer):
+                    formula.formula_string
+                    for formula in self._formula_cache
+                    if formula.formula_string}
+
+        # Initialize the manifest
+        manifest = {'format': file_format,
+                    'tables': [],
+                    'breakdowns': [],
+                    'values': []}
+
+        # For every Table in Results...
+        for table in self._tables:
+
+            # Write the Table's computed columns
+            write_export_frame(
+                get_export_frame({column:
+                                  evaluator.evaluate_column(table, column)
+                                  for column in table.data.columns}),
+                os.path.join(directory, f'{table.id}{extension}'),
+                file_format)
+
+            # Add the Table to the manifest
+            manifest['tables'].append(
+                {'id': table.id,
+                 'sheet': table.sheet,
+                 'start_cell': table.start_cell,
+                 'header': table.header,
+                 'file': f'{table.id}{extension}',
+                 'columns': [{'name': str(column),
+                              'formula': formulas.get((table.id, column))}
+                             for column in table.data.columns]})
+
+        # For every Breakdown in Results...
+        for breakdown in self._breakdowns:
+
+            # Get the Breakdown's computed values
+            breakdown_values = evaluator.evaluate_breakdown(breakdown)
+
+            # Write the Breakdown's computed columns
+            write_export_frame(
+                get_export_frame({column:
+                                  breakdown_values.iloc[:, position]
+                                  .to_numpy()
+                                  for position, column
+                                  in enumerate(breakdown_values.columns)}),
+                os.path.join(directory, f'{breakdown.id}{extension}'),
+                file_format)
+
+            # Get the first cell of every Breakdown column, if any
+            first_cells = breakdown.data.iloc[0].tolist() \
+                if len(breakdown.data) else [None] * breakdown.data.shape[1]
+
+            # Add the Breakdown to the manifest, with the formula of every
+            # column's first cell
+            # NOTE: the other cells of a column repeat it, with relative
+            # references moved down a row as when filling down in Excel
+            manifest['breakdowns'].append(
+                {'id': breakdown.id,
+                 'sheet': breakdown.sheet,
+                 'start_cell': breakdown.start_cell,
+                 'header': breakdown.header,
+                 'file': f'{breakdown.id}{extension}',
+                 'columns': [{'name': str(column),
+                              'formula': cell if isinstance(cell, str)
+                              and cell.startswith('=') else None}
+                             for column, cell
+                             in zip(breakdown_values.columns, first_cells)]})
+
+        # For every Value in Results...
+        for value in self._values:
+            # Add the Value to the manifest
+            manifest['values'].append(
+                {'id': value.id,
+                 'sheet': value.sheet,
+                 'start_cell': value.start_cell,
+                 'header': value.header,
+                 'formula': formulas.get(('', value.id))})
+
+        # Write every Value's computed value to one file
+        write_export_frame(
+            get_export_frame({'id': np.array([value.id
+                                              for value in self._values],
+                                             dtype=object),
+                              'value': np.array([evaluator.evaluate_value(
+                                                 value)
+                                                 for value in self._values],
+                                                dtype=object)}),
+            os.path.join(directory, f'values{extension}'),
+            file_format)
+
+        # Add the Values' file to the manifest
+        manifest['values_file'] = f'values{extension}'
+
+        # Write the manifest
+        with open(os.path.join(directory, 'manifest.json'), 'w') \
+                as manifest_file:
+            json.dump(manifest, manifest_file, indent=2)
+
+        return manifest
+
+    # Method to write the layout of sharded Tables next to a report
+    def _write_shard_manifest(self, path: str | os.PathLike | IO[bytes]):
+        """
+        Writes the layout of sharded Tables (see shard_manifest) to a JSON
+        file next to a report, if any Table is sharded and the report was
+        written to a path. Otherwise, a manifest left next to the report by
+        a previous report is deleted.
+
+        Parameters
+        ----------
+        path : str | os.PathLike | IO[bytes]
+            Path of the report, or the file-like object it was written to.
+
+        Returns
+        -------
+        None
+        """
+
+        # Get the layout of sharded Tables
+        shard_manifest = self.shard_manifest()
+
+        # If the report has no path, there is no manifest to write
+        if hasattr(path, 'write'):
+            return None
+
+        # Otherwise, pass
+        else:
+            pass
+
+        # Get the manifest's path
+        manifest_path = \
+            f'{os.path.splitext(os.fspath(path))[0]}.shards.json'
+
+        # If any Table is sharded, write the manifest next to the report
+        if shard_manifest['tables']:
+
+            # Write the manifest
+            with open(manifest_path, 'w') as manifest_file:
+                json.dump(shard_manifest, manifest_file, indent=2)
+
+            logger.info('Tables exceed worksheet limits and were split'
+                        f' across sheets, see {manifest_path}')
+
+        # Otherwise, if a previous report left a manifest, delete it
+        elif os.path.exists(manifest_path):
+            os.remove(manifest_path)
+
+        # Otherwise, pass
+        else:
+            pass
+
+        return None
+
+    # Method to get the layout of every DataSet and Formula
+    def layout_manifest(self) -> dict[str, Any]:
+        """
+        Gets the layout of Results, embedded in reports to read them back
+        (see from_report).
+
+        Returns
+        -------
+        dict[str, Any]
+            Dictionary with lists of 'tables', 'values', 'breakdowns' and
+            'formulas'. Every DataSet lists its 'id', 'sheet', 'start_cell'
+            and 'header'. Tables also list their 'columns', their
+            'text_columns' holding only text, and 'regions', the [min_row,
+            max_row, min_col, max_col] cells of every shard's data
+            (1-based, inclusive) with the 'sheet' and the 'rows' and
+            'columns' of the data it holds. Values list the 'row' and
+            'column' of their cell. Breakdowns list their
+            'conditional_aggregate' and the 'function' and 'arguments' used
+            to create them, with DataSets replaced by their ids. Formulas
+            list their 'formula', 'key_pointer', 'table_pointer' and
+            'array'.
+
+        """
+
+        # Initialize the layout
+        layout = {'tables': [], 'values': [], 'breakdowns': [],
+                  'formulas': []}
+
+        # For every Table in Results...
+        for table in self._tables:
+
+            # Initialize the regions of the Table's shards
+            regions = []
+
+            # If the Table has columns, get the region of every shard
+            if table.columns:
+
+                # Get the reference of the first column's first shard
+                first_reference = \
+                    table.reference[table.columns[0]]['shards'][0]
+
+                # Get the first row and column of data
+                # NOTE: every shard starts at the Table's start cell
+                first_row = first_reference['start_row']
+                first_column = \
+                    column_index_from_string(
+                        first_reference['column_letter'])
+
+                # For every shard of the Table...
+                for shard in table.shard_layout:
+
+                    # Get the shard's rows and columns
+                    rows, columns = shard['rows'], shard['columns']
+
+                    # Add the region of the shard's data
+                    regions.append(
+                        {'sheet': shard['sheet'],
+                         'cells': [first_row,
+                                   first_row + rows[1] - rows[0] - 1,
+                                   first_column,
+                                   first_column + columns[1] - columns[0]
+                                   - 1],
+                         'rows': list(rows),
+                         'columns': list(columns)})
+
+            # Otherwise, pass
+            else:
+                pass
+
+            # Get the columns holding only text
+            # NOTE: empty text is written as an empty cell, so these
+            # columns read empty cells back as empty text
+            text_columns = \
+                [column for column in table.columns
+                 if table.data[column].dtype == object
+                 and all(isinstance(cell, str)
+                         for cell in table.data[column])]
+
+            # Add the Table's layout
+            layout['tables'].append({'id': table.id,
+                                     'sheet': table.sheet,
+                                     'start_cell': table.start_cell,
+                                     'header': table.header,
+                                     'columns': table.columns,
+                                     'text_columns': text_columns,
+                                     'regions': regions})
+
+        # For every Value in Results...
+        for value in self._values:
+
+            # Get the Value's data cell
+            row, column = coordinate_to_tuple(
+                value.reference['data_cell'].split('!')[-1]
+                .replace('$', ''))
+
+            # Add the Value's layout
+            layout['values'].append({'id': value.id,
+                                     'sheet': value.sheet,
+                                     'start_cell': value.start_cell,
+                                     'header': value.header,
+                                     'row': row,
+                                     'column': column})
+
+        # For every Breakdown in Results...
+        for breakdown in self._breakdowns:
+
+            # Get the Breakdown's cache, if any
+            breakdown_cache = breakdown._breakdown_cache
+
+            # Add the Breakdown's layout, replacing DataSets by their ids
+            layout['breakdowns'].append(
+                {'id': breakdown.id,
+                 'sheet': breakdown.sheet,
+                 'start_cell': breakdown.start_cell,
+                 'header': breakdown.header,
+                 'conditional_aggregate': breakdown.conditional_aggregate,
+                 'function': breakdown_cache['function'].__name__
+                 if breakdown_cache else None,
+                 'arguments':
+                 {argument: value.id if argument == 'table'
+                  else [merged.id for merged in value]
+                  if argument == 'breakdown_list' else value
+                  for argument, value in breakdown_cache['arguments'].items()}
+                 if breakdown_cache else {}})
+
+        # For every Formula in Results...
+        for formula in self._formula_cache:
+            # Add the Formula's layout
+            layout['formulas'].append({'formula': formula.formula_string,
+                                       'key_pointer': formula.key_pointer,
+                                       'table_pointer': formula.table_pointer,
+                                       'array': formula.array})
+
+        return layout
+
+    # Method to save a snapshot of Results
+    @error_logging
+    def save_snapshot(self,
+                      directory: str | os.PathLike = 'snapshot',
+                      file_format: str = 'parquet'):
+        """
+        Saves a snapshot of Results to a directory, to load them back with
+        load_snapshot. The data of every Table is written to a file named
+        by its id, and the structure of Results (see layout_manifest) with
+        the data of every Value to a 'snapshot.json' file.
+
+        Parameters
+        ----------
+        directory : str | os.PathLike, optional
+            Directory to save to, created if needed, by default 'snapshot'
+        file_format : str, optional
+            Format of Table data, one of 'parquet' or 'pickle', by default
+            'parquet'. Parquet files need pyarrow (installed with the
+            'export' extra), while pickle files always work.
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        ValueError
+            If the format is not supported.
+        ImportError
+            If the format needs pyarrow and it is not installed.
+
+        Notes
+        -----
+        Themes and Charts are not saved; loaded DataSets use the default
+        theme.
+
+        Examples
+        --------
+        >>> results.save_snapshot('snapshot')
+        >>> results = Results.load_snapshot('snapshot')
+
+        """
+
+        # If the format is not supported, raise an error
+        if file_format not in SNAPSHOT_FORMATS:
+            raise ValueError(f'Unsupported snapshot format "{file_format}", '
+                             f'expected one of {list(SNAPSHOT_FORMATS)}')
+
+        # Otherwise, pass
+        else:
+            pass
+
+        # Check that the format's dependencies are installed
+        check_file_format(file_format)
+
+        # Create the snapshot directory, if needed
+        os.makedirs(directory, exist_ok=True)
+
+        # Initialize the files of every Table by id
+        table_files = {}
+
+        # For every Table in Results...
+        for table in self._tables:
+
+            # Get the Table's file
+            file_name = f'{table.id}{SNAPSHOT_FORMATS[file_format]}'
+
+            # Write the Table's data
+            write_snapshot_frame(table.data,
+                                 os.path.join(directory, file_name),
+                                 file_format)
+
+            # Add the Table's file and the columns holding Python objects
+            table_files[table.id] = \
+                {'file': file_name,
+                 'object_columns': [column for column, dtype
+                                    in table.data.dtypes.items()
+                                    if dtype == object]}
+
+        # Write the structure of Results and the data of every Value
+        with open(os.path.join(directory, SNAPSHOT_FILE), 'w') \
+                as snapshot_file:
+            json.dump({'format': file_format,
+                       'layout': self.layout_manifest(),
+                       'tables': table_files,
+                       'values': {value.id: value.data
+                                  for value in self._values}},
+                      snapshot_file, default=to_json_value)
+
+        return None
+
+    # Method to load a snapshot of Results
+    @classmethod
+    def load_snapshot(cls, directory: str | os.PathLike = 'snapshot'
+                      ) -> 'Results':
+        """
+        Loads Results from a snapshot saved with save_snapshot. Formulas
+        are added again and Breakdowns are recreated from their Tables.
+
+        Parameters
+        ----------
+        directory : str | os.PathLike, optional
+            Directory of the snapshot, by default 'snapshot'
+
+        Returns
+        -------
+        Results
+            Loaded Results, with DataSets keeping their ids.
+
+        Raises
+        ------
+        ImportError
+            If the snapshot's format needs pyarrow and it is not installed.
+
+        """
+
+        # Read the structure of Results and the data of every Value
+        with open(os.path.join(directory, SNAPSHOT_FILE), 'r') \
+                as snapshot_file:
+            snapshot = json.load(snapshot_file)
+
+        # Check that the format's dependencies are installed
+        check_file_format(snapshot['format'])
+
+        # Read the data of every Table
+        table_data = \
+            {table_id: read_snapshot_frame(
+                os.path.join(directory, table_file['file']),
+                snapshot['format'], table_file['object_columns'])
+             for table_id, table_file in snapshot['tables'].items()}
+
+        return cls._from_layout(snapshot['layout'], table_data,
+                                snapshot['values'])
+
+    # Method to get a picklable spec of Results
+    def to_spec(self) -> ResultsSpec:
+        """
+        Gets a picklable spec of Results without live references, to send
+        to other processes and build back with ResultsSpec.build (see
+        ResultsSpec).
+
+        Returns
+        -------
+        ResultsSpec
+            Spec of the Results.
+
+        Examples
+        --------
+        >>> spec = results.to_spec()
+        >>> same_results = spec.build()
+
+        """
+
+        return ResultsSpec.from_results(self)
+
+    # Method to recreate Results from a report
+    @classmethod
+    def from_report(cls, path: str | os.PathLike | IO[bytes]) -> 'Results':
+        """
+        Recreates Results from a report written by report_results, using
+        the layout embedded in the report (see layout_manifest). The report
+        is streamed with openpyxl's read-only mode, one pass per worksheet,
+        so memory only holds the DataSets' data.
+
+        Tables and Values are read from their recorded cells, Formulas are
+        added again and Breakdowns are recreated from their Tables. DataSets
+        keep their ids and use the default theme; Charts are not recreated.
+
+        Parameters
+        ----------
+        path : str | os.PathLike | IO[bytes]
+            Path or binary file-like object of the report.
+
+        Returns
+        -------
+        Results
+            Recreated Results.
+
+        Raises
+        ------
+        ValueError
+            If the report has no embedded layout.
+
+        Examples
+        --------
+        >>> results = Results.from_report('report.xlsx')
+        >>> results.report_results('report_rethemed.xlsx')
+
+        """
+
+        # Open the report in read-only mode
+        workbook = openpyxl.load_workbook(path, read_only=True)
+
+        # Try to read the report
+        try:
+
+            # Get the embedded layout
+            layout = read_layout(workbook)
+
+            # If there is no layout, raise an error
+            if layout is None:
+                raise ValueError('Report has no embedded layout, it was not '
+                                 'written by Results.report_results')
+
+            # Otherwise, pass
+            else:
+                pass
+
+            # Initialize the regions to read by sheet, as pairs of keys and
+            # regions
+            sheet_regions: dict[str, list[tuple[Any, tuple]]] = {}
+
+            # For every Table...
+            for table_layout in layout['tables']:
+                # For every region of the Table's shards...
+                for index, region in enumerate(table_layout['regions']):
+                    # Add the region to read
+                    sheet_regions.setdefault(region['sheet'], []).append(
+                        ((table_layout['id'], index),
+                         tuple(region['cells'])))
+
+            # For every Value...
+            for value_layout in layout['values']:
+                # Add the Value's cell to read
+                sheet_regions.setdefault(value_layout['sheet'], []).append(
+                    ((value_layout['id'], None),
+                     (value_layout['row'], value_layout['row'],
+                      value_layout['column'], value_layout['column'])))
+
+            # Initialize the rows read by key
+            read_rows = {}
+
+            # For every sheet and its regions...
+            for sheet_name, regions in sheet_regions.items():
+                # Read the sheet's regions in one pass
+                read_rows.update(zip(
+                    [key for key, _ in regions],
+                    read_regions(workbook[sheet_name],
+                                 [region for _, region in regions])))
+
+        # Close the report whether or not it was read
+        finally:
+            workbook.close()
+
+        # Initialize the data of every Table and Value by id
+        table_data, value_data = {}, {}
+
+        # For every Table...
+        for table_layout in layout['tables']:
+
+            # Initialize the blocks of data by row range
+            row_blocks: dict[tuple[int, int], list[DataFrame]] = {}
+
+            # For every region of the Table's shards...
+            for index, region in enumerate(table_layout['regions']):
+                # Add the region's data to its row range
+                # NOTE: read as objects, so empty cells stay None
+                row_blocks.setdefault(tuple(region['rows']), []).append(
+                    DataFrame(read_rows[(table_layout['id'], index)],
+                              columns=table_layout['columns'][
+                                  slice(*region['columns'])],
+                              dtype=object))
+
+            # Get the Table's data, joining shards by columns then rows
+            data = concat([concat(blocks, axis=1)
+                           for _, blocks in sorted(row_blocks.items())],
+                          ignore_index=True) if row_blocks \
+                else DataFrame(columns=table_layout['columns'])
+
+            # For every column holding only text...
+            for column in table_layout.get('text_columns', []):
+                # Read its empty cells back as empty text
+                data[column] = data[column].fillna('')
+
+            # Infer the type of every column without empty cells
+            # NOTE: empty cells would become NaN, which is not written
+            data = data.apply(lambda column: column.infer_objects()
+                              if column.notna().all() else column)
+
+            # Add the Table's data
+            table_data[table_layout['id']] = data
+
+        # For every Value...
+        for value_layout in layout['values']:
+
+            # Get the Value's rows
+            value_rows = read_rows[(value_layout['id'], None)]
+
+            # Add the Value's data
+            value_data[value_layout['id']] = \
+                value_rows[0][0] if value_rows else None
+
+        return cls._from_layout(layout, table_data, value_data)
+
+    # Method to recreate Results from their layout and data
+    @classmethod
+    def _from_layout(cls,
+                     layout: dict[str, Any],
+                     table_data: dict[str, DataFrame],
+                     value_data: dict[str, Any]) -> 'Results':
+        """
+        Recreates Results from their layout (see layout_manifest) and the
+        data of their Tables and Values. Formulas are added again and
+        Breakdowns are recreated from their Tables.
+
+        Parameters
+        ----------
+        layout : dict[str, Any]
+            Layout of the Results.
+        table_data : dict[str, DataFrame]
+            Data of every Table by id.
+        value_data : dict[str, Any]
+            Data of every Value by id.
+
+        Returns
+        -------
+        Results
+            Recreated Results, with DataSets keeping their ids.
+
+        """
+
+        # Create an instance of Results
+        results = cls()
+
+        # Recreate DataSets without updating references until all are added
+        with results.batch():
+
+            # For every Table...
+            for table_layout in layout['tables']:
+
+                # Create the Table with its id
+                table = Table(table_data[table_layout['id']],
+                              start_cell=table_layout['start_cell'],
+                              sheet=table_layout['sheet'],
+                              header=table_layout['header'])
+                table.id = table_layout['id']
+
+                # Add the Table
+                results.add_table(table)
+
+            # For every Value...
+            for value_layout in layout['values']:
+
+                # Create the Value with its id
+                value = Value(value_data[value_layout['id']],
+                              start_cell=value_layout['start_cell'],
+                              sheet=value_layout['sheet'],
+                              header=value_layout['header'])
+                value.id = value_layout['id']
+
+                # Add the Value
+                results.add_value(value)
+
+            # For every Breakdown...
+            for breakdown_layout in layout['breakdowns']:
+
+                # Create the Breakdown with its id
+                breakdown = Breakdown(
+                    breakdown_layout['start_cell'],
+                    breakdown_layout['sheet'],
+                    breakdown_layout['conditional_aggregate'],
+                    breakdown_layout['header'])
+                breakdown.id = breakdown_layout['id']
+
+                # Get the arguments creating the Breakdown
+                arguments = dict(breakdown_layout['arguments'])
+
+                # If the Breakdown was created from a Table, get it
+                if 'table' in arguments:
+                    arguments['table'] = results._datasets[arguments['table']]
+
+                # If the Breakdown merged Breakdowns, get them
+                elif 'breakdown_list' in arguments:
+                    arguments['breakdown_list'] = \
+                        [results._datasets[breakdown_id]
+                         for breakdown_id in arguments['breakdown_list']]
+
+                # Otherwise, pass
+                else:
+                    pass
+
+                # If the Breakdown was created by a method, create it again
+                if breakdown_layout['function'] is not None:
+                    getattr(breakdown, breakdown_layout['function'])(
+                        **arguments)
+
+                # Otherwise, warn that it is empty
+                else:
+                    logger.warning(f'Breakdown {breakdown.id} was not created '
+                                   'with a Breakdown method, and is empty.')
+
+                # Add the Breakdown
+                results.add_breakdown(breakdown)
+
+            # For every Formula...
+            for formula_layout in layout['formulas']:
+                # Add the Formula again
+                results.add_formula(
+                    Formula(formula_layout['formula'],
+                            formula_layout['key_pointer'],
+                            formula_layout['table_pointer'],
+                            formula_layout['array']))
+
+        return results
+
+    # Method to get the sheets DataSets and Charts are reported to
+    def get_sheets(self) -> set[str]:
+        """
+        Gets the names of the sheets every DataSet and Chart in Results is
+        reported to, not counting the continuation sheets of sharded
+        Tables.
+
+        Returns
+        -------
+        set[str]
+            Names of the sheets.
+        """
+
+        return {dataset.sheet for dataset in
+                [*self._datasets.values(), *self._charts]}
+
+    # Method to get the layout of Tables split across sheets
+    def shard_manifest(self) -> dict[str, list[dict[str, Any]]]:
+        """
+        Gets the layout of every Table split across sheets because it
+        exceeds Excel's worksheet limits (see Table.shard_layout).
+
+        Returns
+        -------
+        dict[str, list[dict[str, Any]]]
+            Dictionary with a 'tables' list, containing the 'id', 'sheet',
+            'start_cell', 'header', 'length' and 'columns' of every sharded
+            Table, and its 'shards', each with the 'sheet' it is reported
+            to and the 'rows' and 'columns' of the data it holds, as
+            [start, stop] positions.
+        """
+
+        # Initialize the list of sharded Tables
+        tables = []
+
+        # For every Table in Results...
+        for table in self._tables:
+
+            # Get the Table's shard layout
+            shard_layout = table.shard_layout
+
+            # If the Table is sharded, add its layout
+            if len(shard_layout) > 1:
+                tables.append(
+                    {'id': table.id,
+                     'sheet': table.sheet,
+                     'start_cell': table.start_cell,
+                     'header': table.header,
+                     'length': table.length,
+                     'columns': table.columns,
+                     'shards': [{'sheet': shard['sheet'],
+                                 'rows': list(shard['rows']),
+                                 'columns': list(shard['columns'])}
+                                for shard in shard_layout]})
+
+            # Otherwise, pass
+            else:
+                pass
+
+        return {'tables': tables}
+
+    # Method to get the shards of a Table with their computed values
+    def _get_table_shards(self,
+                          table: Table,
+                          cached_values: dict[str, DataFrame | Any]
+                          ) -> list[tuple[Table, DataFrame | None]]:
+        """
+        Get the shards of a Table (see Table.get_shards), each with its
+        part of the Table's computed values.
+
+        Parameters
+        ----------
+        table : Table
+            Table to get the shards of.
+        cached_values : dict[str, DataFrame | Any]
+            Computed values to cache by DataSet id (see evaluate).
+
+        Returns
+        -------
+        list[tuple[Table, DataFrame | None]]
+            List of shards and their computed values, if any.
+
+        """
+
+        # Get the Table's computed values
+        table_values = cached_values.get(table.id)
+
+        # If the Table is not sharded, return it with its values
+        if len(table.shard_layout) == 1:
+            return [(table, table_values)]
+
+        # Otherwise, pass
+        else:
+            pass
+
+        # Get every shard with its part of the computed values, if any
+        return [(shard_table,
+                 table_values.iloc[slice(*shard['rows']),
+                                   slice(*shard['columns'])]
+                 if table_values is not None else None)
+                for shard_table, shard in zip(table.get_shards(),
+                                              table.shard_layout)]
+
+    # Method to open an xlsxwriter workbook
+    @staticmethod
+    def _open_xlsx_workbook(path: str | os.PathLike | IO[bytes],
+                            options: dict[str, Any],
+                            processes: int = 1) -> xlsxwriter.Workbook:
+        """
+        Opens an xlsxwriter workbook, rendering its worksheets in a
+        process pool when closed if more than one process is used (see
+        ParallelWorkbook).
+
+        Parameters
+        ----------
+        path : str | os.PathLike | IO[bytes]
+            Path or writable binary file-like object to report to.
+        options : dict[str, Any]
+            Xlsxwriter workbook options.
+        processes : int, optional
+            Number of processes rendering worksheets, by default 1
+
+        Returns
+        -------
+        Workbook
+            Xlsx workbook.
+        """
+
+        # Import xlsxwriter and the parallel workbook
+        # NOTE: imported when first reporting
+        import xlsxwriter
+        from .parallel_writer import ParallelWorkbook
+
+        # If using more than one process, open a parallel workbook
+        if processes > 1:
+            return ParallelWorkbook(path, options, processes)
+
+        # Otherwise, open a workbook
+        else:
+            return xlsxwriter.Workbook(path, options)
+
+    # Method to write Results to Excel in one xlsxwriter pass
+    def _report_single_pass(self,
+                            path: str | os.PathLike | IO[bytes],
+                            cached_values: dict[str, DataFrame | Any],
+                            constant_memory: bool = False,
+                            template: ReportTemplate | None = None,
+                            processes: int = 1):
+        """
+        Reports Results to an Excel file in one pass with xlsxwriter.
+        Every DataSet targeting a worksheet is merged into one stream of
+        writes ordered by row, so rows are written in order.
+
+        Parameters
+        ----------
+        path : str | os.PathLike | IO[bytes]
+            Path or writable binary file-like object to report to.
+        cached_values : dict[str, DataFrame | Any]
+            Computed values to cache by DataSet id (see evaluate).
+        constant_memory : bool, optional
+            Whether to use xlsxwriter's constant memory mode,
+            by default False
+        template : ReportTemplate | None, optional
+            Compiled layout of Results, reused instead of translating
+            themes and Charts, by default None
+        processes : int, optional
+            Number of processes rendering worksheets, by default 1
+
+        Returns
+        -------
+        None
+        """
+        # Import the tools writing DataSets with xlsxwriter
+        # NOTE: imported when first reporting
+        from .reporting_tools import iter_dataset_writes, iter_value_writes, \
+            report_xlsx_chart, set_xlsx_col_widths, write_rows
+
+        # Open a new workbook, assembling it in memory if reporting to a
+        # file-like object
+        # NOTE: constant memory mode flushes rows to temporary files
+        workbook = self._open_xlsx_workbook(
+            path, {'constant_memory': constant_memory,
+                   'in_memory': hasattr(path, 'write')
+                   and not constant_memory}, processes)
+
+        # Create a cache of Formats shared by every DataSet, starting from
+        # the template's Formats if any
+        formats = {} if template is None else template.get_formats(workbook)
+
+        # Create a dictionary of streams of writes by worksheet name
+        # NOTE: later streams overwrite earlier ones in the same row, so
+        # Values are written over Tables and Breakdowns
+        streams: dict[str, list] = {}
+
+        # Initialize a list of Tables and their shards
+        shard_tables = []
+
+        # For every Table in Results...
+        for table in self._tables:
+
+            # For every shard of the Table...
+            for shard_table, shard_values in \
+                    self._get_table_shards(table, cached_values):
+
+                # Plan the writes of the shard, with its array formula
+                # columns
+                streams.setdefault(shard_table.sheet, []).append(
+                    iter_dataset_writes(shard_table, workbook,
+                                        shard_values,
+                                        self._get_array_formulas(table.id),
+                                        formats))
+
+                # Add the shard
+                shard_tables.append(shard_table)
+
+        # For every Breakdown in Results...
+        for breakdown in self._breakdowns:
+            # Plan the writes of the Breakdown
+            streams.setdefault(breakdown.sheet, []).append(
+                iter_dataset_writes(breakdown, workbook,
+                                    cached_values.get(breakdown.id),
+                                    formats=formats))
+
+        # For every Value in Results...
+        for value in self._values:
+            # Plan the writes of the Value
+            streams.setdefault(value.sheet, []).append(
+                iter_value_writes(value, workbook, formats,
+                                  cached_values.get(value.id)))
+
+        # For every worksheet name and its streams of writes...
+        for sheet_name, sheet_streams in streams.items():
+            # Write every DataSet on the worksheet in row order
+            write_rows(workbook.add_worksheet(sheet_name), sheet_streams)
+
+        # For every Chart in Results...
+        for chart in self._charts:
+            # Report the Chart, with its compiled layout if any
+            report_xlsx_chart(chart, workbook,
+                              None if template is None
+                              else template.get_chart_layout(chart))
+
+        # Set the width of all columns to fit their values
+        set_xlsx_col_widths(workbook,
+                            [*shard_tables, *self._breakdowns, *self._values])
+
+        # Embed the layout of Results, to read the report back
+        embed_layout(workbook, self.layout_manifest())
+
+        # Close the workbook
+        workbook.close()
+
+        return None
+
+    # Method to write Results to Excel with xlsxwriter then openpyxl
+    def _report_two_pass(self,
+                         path: str | os.PathLike | IO[bytes],
+                         cached_values: dict[str, DataFrame | Any],
+                         processes: int = 1):
+        """
+        Reports Results to an Excel file, writing Tables and Breakdowns
+        with xlsxwriter to memory then reopening the workbook with openpyxl
+        to write Values, formatting and Charts.
+
+        Parameters
+        ----------
+        path : str | os.PathLike | IO[bytes]
+            Path or writable binary file-like object to report to.
+        cached_values : dict[str, DataFrame | Any]
+            Computed values to cache by DataSet id (see evaluate).
+        processes : int, optional
+            Number of processes rendering the worksheets written with
+            xlsxwriter, by default 1
+
+        Returns
+        -------
+        None
+        """
+        # Import the tools writing DataSets with xlsxwriter and openpyxl
+        # NOTE: imported when first reporting
+        from .reporting_tools import report_breakdown, report_chart, \
+            report_table, report_value, set_default_col_widths, \
+            format_multicell_dataset
+
         # Write Tables and Breakdowns
-        # Open a new workbook with constant memory option
-        workbook = xlsxwriter.Workbook(path)
+        # Create a buffer holding the workbook between passes
+        buffer = BytesIO()
+
+        # Open a new workbook, assembled in memory
+        workbook = self._open_xlsx_workbook(buffer, {'in_memory': True},
+                                            processes)
+
+        # Initialize a list of Tables and their shards
+        shard_tables = []
 
         # For every Table in Results...
         for table in self._tables:
-            # Write the Table to Excel
-            report_table(table, workbook)
+
+            # For every shard of the Table...
+            for shard_table, shard_values in \
+                    self._get_table_shards(table, cached_values):
+
+                # Write the shard to Excel, with its array formula columns
+                report_table(shard_table, workbook,
+                             self._get_array_formulas(table.id),
+                             shard_values)
+
+                # Add the shard
+                shard_tables.append(shard_table)
 
         # For every Breakdown in Results...
         for breakdown in self._breakdowns:
             # Write the Breakdown to Excel
-            report_breakdown(breakdown, workbook)
+            report_breakdown(breakdown, workbook,
+                             cached_values.get(breakdown.id))
+
+        # Embed the layout of Results, to read the report back
+        # NOTE: openpyxl keeps custom document properties when saving
+        embed_layout(workbook, self.layout_manifest())
 
         # Close the workbook
         workbook.close()
 
         # Write Values
         # NOTE: Uses custom openpyxl writer
-        # Reopen the Excel workbook
-        workbook = openpyxl.load_workbook(filename=path)
+        # Reopen the Excel workbook from the buffer
+        buffer.seek(0)
+        workbook = openpyxl.load_workbook(filename=buffer)
 
         # For every Value in Results...
         for value in self._values:
             # Write the Value to Excel
             report_value(value, workbook)
 
-        # For every Table in Results...
-        for table in self._tables:
+        # For every Table in Results and their shards...
+        for table in shard_tables:
             # Format the Table
             format_multicell_dataset(table, workbook)
 
@@ -288,45 +1617,286 @@ class Results():
             # Report the Chart
             report_chart(chart, workbook)
 
-        # Set the default width for all columns
-        set_default_col_widths(workbook)
+        # Set the width of all columns to fit their values
+        set_default_col_widths(workbook,
+                               [*shard_tables, *self._breakdowns,
+                                *self._values])
 
         # Save and close the Excel workbook
         workbook.save(path)
 
         return None
 
-    # Method to update all datasets
+    # Method to compute the values of every DataSet without Excel
+    @error_logging
+    def evaluate(self) -> dict[str, DataFrame | Any]:
+        """
+        Computes the values of every DataSet in Results without Excel,
+        evaluating formulas with NumPy (see FormulaEvaluator).
+
+        Returns
+        -------
+        dict[str, DataFrame | Any]
+            Dictionary with DataSet ids as keys. Tables and Breakdowns map
+            to DataFrames of computed values, and Values to their computed
+            value.
+
+        Raises
+        ------
+        ValueError
+            If a formula uses syntax or functions the evaluator does not
+            support, or formulas refer to each other in a cycle.
+
+        """
+
+        # Create an evaluator for every DataSet and cached Formula
+        evaluator = FormulaEvaluator(self._tables,
+                                     self._values,
+                                     self._breakdowns,
+                                     self._formula_cache)
+
+        return evaluator.evaluate()
+
+    # Method to get the computed values cached in reports
+    def _get_cached_values(self) -> dict[str, DataFrame | Any]:
+        """
+        Get the computed values of every DataSet to cache in reports.
+
+        Returns
+        -------
+        dict[str, DataFrame | Any]
+            Computed values by DataSet id (see evaluate), or an empty
+            dictionary if some formula cannot be evaluated.
+
+        """
+
+        # Try to compute the values of every DataSet
+        try:
+            cached_values = FormulaEvaluator(self._tables,
+                                             self._values,
+                                             self._breakdowns,
+                                             self._formula_cache).evaluate()
+
+        # If a formula cannot be evaluated, cache no values
+        # NOTE: any error is caught, so evaluation never stops the report
+        except Exception as e:
+            logger.warning(f'Formula results will not be cached: {e}')
+            cached_values = {}
+
+        return cached_values
+
+    # Method to get the array formulas output to a Table
+    def _get_array_formulas(self, table_id: str) -> dict[str, str]:
+        """
+        Get the array formulas output to a Table.
+
+        Parameters
+        ----------
+        table_id : str
+            Id of the Table.
+
+        Returns
+        -------
+        dict[str, str]
+            Dictionary with column names as keys and the referenced array
+            formula written over each column as values.
+
+        """
+
+        # Get the referenced formula of every array formula in the cache
+        # that is output to the Table
+        # NOTE: Array formulas with sharded columns are referenced once per
+        # row, and are written like other formulas
+        array_formulas = {formula.key_pointer: formula.referenced_formulas
+                          for formula in self._formula_cache
+                          if formula.array
+                          and formula.table_pointer == table_id
+                          and formula.key_pointer != ''
+                          and isinstance(formula.referenced_formulas, str)}
+
+        return array_formulas
+
+    # Method to update datasets following a change to one DataSet
     @error_logging
-    def update_datasets(self):
+    def update_datasets(self,
+                        dataset: Table | Value | Breakdown | None = None):
         """
-        Update all datasets, used if one DataSet is changed.
+        Update formulas and breakdowns, used if one DataSet is changed.
+        Inside a batch block, the update is deferred until the block exits.
+
+        Parameters
+        ----------
+        dataset : Table | Value | Breakdown | None, optional
+            The DataSet that changed. Only formulas and breakdowns that
+            depend on it, directly or transitively, are recomputed. By
+            default None, which recomputes every formula and breakdown.
 
         Returns
         -------
         None
         """
 
-        # Get a shallow copy of the formula cache
-        formula_cache_copy = self._formula_cache[:]
+        # If a batch is active...
+        if self._batch_depth > 0:
 
-        # Clear the formula cache
-        self._formula_cache = []
+            # If a DataSet was passed, defer an update for it
+            if dataset is not None:
+                self._pending_ids.add(dataset.id)
 
-        # For every formula in the formula cache...
-        for formula in formula_cache_copy:
-            # Add a formula to results
-            self.add_formula(formula)
+            # Otherwise, defer an update for every DataSet
+            else:
+                self._pending_all = True
 
-        # For every breakdown...
-        for breakdown in self._breakdowns:
-            # Get the method used to construct the breakdown
-            breakdown_constructor = breakdown._breakdown_cache['function']
-            # Reformulate the breakdown based on its cache
-            breakdown_constructor(**breakdown._breakdown_cache['arguments'])
+        # Otherwise, recompute affected formulas and breakdowns now
+        else:
+            self._recompute_datasets(None if dataset is None
+                                     else {dataset.id})
+
+        return None
+
+    # Method to recompute formulas and breakdowns affected by changes
+    @error_logging
+    def _recompute_datasets(self, changed_ids: set[str] | None = None):
+        """
+        Re-add cached formulas and reconstruct breakdowns that depend on
+        the changed DataSets, in dependency order.
+
+        Parameters
+        ----------
+        changed_ids : set[str] | None, optional
+            Ids of DataSets that changed, by default None (every formula
+            and breakdown is recomputed).
+
+        Returns
+        -------
+        None
+        """
+
+        # For every formula and breakdown, in order of dependency...
+        for node in self._get_recompute_order(changed_ids):
+
+            # If the node is a Formula...
+            if isinstance(node, Formula):
+                # Insert references and write the formulas again
+                self._apply_formula(node)
+
+            # Otherwise, the node is a Breakdown...
+            else:
+                # Get the method used to construct the breakdown
+                breakdown_constructor = node._breakdown_cache['function']
+                # Reformulate the breakdown based on its cache
+                breakdown_constructor(**node._breakdown_cache['arguments'])
 
         return None
 
+    # Method to get the formulas and breakdowns to recompute, in order
+    @error_logging
+    def _get_recompute_order(self,
+                             changed_ids: set[str] | None = None
+                             ) -> list[Formula | Breakdown]:
+        """
+        Get the formulas and breakdowns that depend on changed DataSets,
+        directly or transitively, sorted so that every node comes after
+        the nodes whose output it reads.
+
+        Parameters
+        ----------
+        changed_ids : set[str] | None, optional
+            Ids of DataSets that changed, by default None (every formula
+            and breakdown is returned).
+
+        Returns
+        -------
+        order : list[Formula | Breakdown]
+            Formulas and breakdowns in the order to recompute them. Ties
+            keep the order formulas and breakdowns were added in.
+
+        Raises
+        ------
+        ValueError
+            If the formulas and breakdowns to recompute depend on each
+            other in a cycle.
+        """
+
+        # Get every formula and every constructed breakdown
+        nodes = self._formula_cache + \
+            [breakdown for breakdown in self._breakdowns
+             if breakdown._breakdown_cache]
+
+        # Get the DataSet locations each node reads and writes
+        dependencies = [self._get_formula_dependencies(node)
+                        if isinstance(node, Formula)
+                        else self._get_breakdown_dependencies(node)
+                        for node in nodes]
+
+        # Get a dictionary of the nodes reading each DataSet id
+        readers: dict[str, list[tuple[int, str | None]]] = {}
+        for i, (reads, writes) in enumerate(dependencies):
+            for dataset_id, column in reads:
+                readers.setdefault(dataset_id, []).append((i, column))
+
+        # Get the nodes reading each node's output (edges of the graph)
+        dependents: list[set[int]] = \
+            [{j for dataset_id, column in writes
+              for j, read_column in readers.get(dataset_id, [])
+              if column is None or read_column is None
+              or column == read_column}
+             for reads, writes in dependencies]
+
+        # If every DataSet changed, every node is affected
+        if changed_ids is None:
+            affected = set(range(len(nodes)))
+
+        # Otherwise, get the nodes directly affected by the changes: nodes
+        # reading a changed DataSet and breakdowns that were changed
+        else:
+            affected = {i for dataset_id in changed_ids
+                        for i, column in readers.get(dataset_id, [])} | \
+                {i for i, node in enumerate(nodes)
+                 if isinstance(node, Breakdown) and node.id in changed_ids}
+
+            # Add the transitive dependents of affected nodes
+            stack = list(affected)
+            while stack:
+                for j in dependents[stack.pop()]:
+                    if j not in affected:
+                        affected.add(j)
+                        stack.append(j)
+
+        # Count the affected nodes each affected node waits on
+        waiting = {i: 0 for i in affected}
+        for i in affected:
+            for j in dependents[i]:
+                if j in affected:
+                    waiting[j] += 1
+
+        # Sort affected nodes topologically, keeping the added order
+        # among nodes that are ready at the same time
+        ready = sorted(i for i in affected if waiting[i] == 0)
+        order = []
+        while ready:
+            i = ready.pop(0)
+            order.append(nodes[i])
+            for j in sorted(dependents[i]):
+                if j in affected:
+                    waiting[j] -= 1
+                    if waiting[j] == 0:
+                        ready.append(j)
+            ready.sort()
+
+        # If some affected nodes were never ready, they form a cycle
+        if len(order) < len(affected):
+            raise ValueError('Formulas or breakdowns depend on each other '
+                             'in a cycle: ' +
+                             ', '.join(repr(nodes[i]) for i in affected
+                                       if waiting[i] > 0))
+
+        # Otherwise, pass
+        else:
+            pass
+
+        return order
+
     # Method to update all dataset references
     @error_logging
     def update_references(self):
@@ -351,3 +1921,82 @@ class Results():
             self._dataset_references[breakdown.id] = breakdown.reference
 
         return None
+
+    """ STATIC METHODS """
+    # Static method to get the DataSet locations a Formula reads and writes
+    @staticmethod
+    def _get_formula_dependencies(formula: Formula
+                                  ) -> tuple[set[tuple[str, str | None]],
+                                             set[tuple[str, str | None]]]:
+        """
+        Static method that returns the DataSet locations a Formula reads
+        from its inserts and writes through its pointers.
+
+        Parameters
+        ----------
+        formula : Formula
+            A Formula instance.
+
+        Returns
+        -------
+        reads : set[tuple[str, str | None]]
+            Pairs of DataSet ids and Table column names (None for Values)
+            read by the Formula.
+        writes : set[tuple[str, str | None]]
+            Pairs of DataSet ids and Table column names (None for Values)
+            written by the Formula.
+        """
+
+        # Get every insert's DataSet id and column
+        reads = {(insert['pointers']['table'], insert['pointers']['key'])
+                 if 'table' in insert['pointers']
+                 else (insert['pointers']['key'], None)
+                 for insert in formula.insert_list
+                 if 'key' in insert['pointers']}
+
+        # Get the pointed DataSet id and column
+        writes = {(formula.table_pointer, formula.key_pointer)
+                  if formula.table_pointer != ''
+                  else (formula.key_pointer, None)}
+
+        return reads, writes
+
+    # Static method to get the DataSet locations a Breakdown reads and writes
+    @staticmethod
+    def _get_breakdown_dependencies(breakdown: Breakdown
+                                    ) -> tuple[set[tuple[str, str | None]],
+                                               set[tuple[str, str | None]]]:
+        """
+        Static method that returns the DataSet locations a Breakdown reads
+        according to its breakdown cache, and the Breakdown it writes.
+
+        Parameters
+        ----------
+        breakdown : Breakdown
+            A Breakdown instance.
+
+        Returns
+        -------
+        reads : set[tuple[str, str | None]]
+            Pairs of DataSet ids and Table column names (None for whole
+            DataSets) read by the Breakdown.
+        writes : set[tuple[str, str | None]]
+            The Breakdown's id paired with None.
+        """
+
+        # Get the breakdown cache arguments
+        arguments = breakdown._breakdown_cache['arguments']
+
+        # If the Breakdown merges other Breakdowns, it reads all of them
+        if 'breakdown_list' in arguments:
+            reads = {(merged.id, None)
+                     for merged in arguments['breakdown_list']}
+
+        # Otherwise, it reads the group by and summarize columns of a Table
+        else:
+            reads = {(arguments['table'].id, arguments[argument])
+                     for argument in ('group_by_column', 'group_by_col_1',
+                                      'group_by_col_2', 'summarize_column')
+                     if arguments.get(argument)}
+
+        return reads, {(breakdown.id, None)}
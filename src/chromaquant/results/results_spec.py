@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+
+This submodule contains the ResultsSpec class definition. Specs describe
+Results without live references, so they can be pickled cheaply and sent
+between processes, then built back into Results.
+
+"""
+
+from __future__ import annotations
+
+import numpy as np
+from pandas import DataFrame, RangeIndex, Series
+from typing import Any, TYPE_CHECKING
+if TYPE_CHECKING:
+    from .results import Results
+
+""" CLASS """
+
+
+# Define the ResultsSpec class
+class ResultsSpec:
+    """
+    Picklable description of Results, holding their layout (see
+    Results.layout_manifest), the columns of every Table and the data of
+    every Value, without Themes, mediators or bound methods.
+
+    Table columns with a NumPy type are kept as arrays, which pickle as
+    contiguous buffers (out-of-band with pickle protocol 5), and other
+    columns as tuples of Python objects.
+
+    Parameters
+    ----------
+    layout : dict[str, Any]
+        Layout of the Results.
+    tables : dict[str, dict[str, Any]]
+        Data of every Table by id, as dictionaries with 'columns' names,
+        'arrays' of values and an 'index' array (None for a default index).
+    values : dict[str, Any]
+        Data of every Value by id.
+
+    Examples
+    --------
+    >>> spec = results.to_spec()
+    >>> with ProcessPoolExecutor() as executor:
+    ...     future = executor.submit(build_report, spec)
+
+    """
+
+    def __init__(self,
+                 layout: dict[str, Any],
+                 tables: dict[str, dict[str, Any]],
+                 values: dict[str, Any]):
+
+        # Save the layout
+        self.layout = layout
+
+        # Save the data of every Table
+        self.tables = tables
+
+        # Save the data of every Value
+        self.values = values
+
+    """ METHODS """
+    # Method to create a spec from Results
+    @classmethod
+    def from_results(cls, results: Results) -> ResultsSpec:
+        """
+        Creates a spec describing Results.
+
+        Parameters
+        ----------
+        results : Results
+            Results to describe.
+
+        Returns
+        -------
+        ResultsSpec
+            Spec of the Results.
+
+        """
+
+        # Initialize the data of every Table
+        tables = {}
+
+        # For every Table in Results...
+        for table in results._tables:
+
+            # Get the Table's data
+            data = table.data
+
+            # Add the Table's columns, as arrays where they have a NumPy type
+            tables[table.id] = \
+                {'columns': list(data.columns),
+                 'arrays': [cls._get_column_array(data.iloc[:, position])
+                            for position in range(data.shape[1])],
+                 'index': None if data.index.equals(RangeIndex(len(data)))
+                 else data.index.to_numpy()}
+
+        return cls(results.layout_manifest(), tables,
+                   {value.id: value.data for value in results._values})
+
+    # Method to build Results from the spec
+    def build(self) -> Results:
+        """
+        Builds live Results from the spec. Formulas are added again and
+        Breakdowns are recreated from their Tables.
+
+        Returns
+        -------
+        Results
+            Built Results, with DataSets keeping their ids and the default
+            theme.
+
+        """
+
+        # Import Results
+        # NOTE: imported here, since Results imports this submodule
+        from .results import Results
+
+        # Initialize the data of every Table
+        table_data = {}
+
+        # For every Table id and Table...
+        for table_id, table in self.tables.items():
+
+            # Get a DataFrame referencing the Table's columns by position
+            # NOTE: Python objects keep their object type, since inferring
+            # one would turn None into NaN
+            data = DataFrame(
+                {position: array if isinstance(array, np.ndarray)
+                 else Series(array, dtype=object)
+                 for position, array in enumerate(table['arrays'])},
+                copy=False)
+
+            # Name the Table's columns
+            data.columns = table['columns']
+
+            # If the Table has an index, set it
+            if table['index'] is not None:
+                data.index = table['index']
+
+            # Otherwise, pass
+            else:
+                pass
+
+            # Add the Table's data
+            table_data[table_id] = data
+
+        return Results._from_layout(self.layout, table_data, self.values)
+
+    """ STATIC METHODS """
+    # Static method to get the picklable values of a column
+    @staticmethod
+    def _get_column_array(column: Any) -> np.ndarray | tuple:
+        """
+        Gets the values of a column as an array if they have a NumPy type,
+        or as a tuple of Python objects otherwise.
+
+        Parameters
+        ----------
+        column : Series
+            Column of a Table.
+
+        Returns
+        -------
+        np.ndarray | tuple
+            Values of the column.
+
+        """
+
+        # If the column has a NumPy type other than objects, get its array
+        if isinstance(column.dtype, np.dtype) and column.dtype != object:
+            return np.ascontiguousarray(column.to_numpy())
+
+        # Otherwise, get its Python objects
+        else:
+            return tuple(column.tolist())
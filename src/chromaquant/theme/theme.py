@@ -12,7 +12,7 @@ from openpyxl.styles import PatternFill, Border, Side, \
                             Alignment, Protection, Font
 import os
 from ..logging_and_handling import setup_logger, setup_error_logging
-from typing import Literal
+from typing import Any, Literal
 
 """ LOGGING AND HANDLING """
 
@@ -25,12 +25,192 @@ logger = setup_logger(logger)
 # Get an error logging decorator
 error_logging = setup_error_logging(logger)
 
+""" CONSTANTS """
+
+# Define the path of the default cqtheme
+DEFAULT_THEME_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                  'themes', 'default.cqtheme')
+
+# Define a cache of parsed cqthemes by path, with their modification times
+_THEME_FILE_CACHE: dict[str, tuple[int, dict]] = {}
+
+# Define the shared default Theme, created when first used
+_DEFAULT_THEME = None
+
+""" FUNCTIONS """
+
+
+# Function to load a cqtheme, parsing it only if it changed
+def load_theme_file(path: str | os.PathLike) -> dict:
+    """
+    Loads the style groups of a cqtheme. Parsed cqthemes are cached by
+    path and modification time, so a file is parsed again only when it
+    changes.
+
+    Parameters
+    ----------
+    path : str | os.PathLike
+        Path of the cqtheme.
+
+    Returns
+    -------
+    dict
+        Copy of the cqtheme's style groups, which may be modified.
+
+    """
+
+    # Get the absolute path of the cqtheme
+    path = os.path.abspath(path)
+
+    # Get the modification time of the cqtheme
+    modified_time = os.stat(path).st_mtime_ns
+
+    # Get the cached cqtheme, if any
+    cached_theme = _THEME_FILE_CACHE.get(path)
+
+    # If the cqtheme was not parsed since it was modified...
+    if cached_theme is None or cached_theme[0] != modified_time:
+
+        # Load the cqtheme at path
+        with open(path, 'r') as f:
+            theme_dict = json.load(f)
+
+        # Cache the parsed cqtheme
+        _THEME_FILE_CACHE[path] = (modified_time, theme_dict)
+
+    # Otherwise, get the cached cqtheme
+    else:
+        theme_dict = cached_theme[1]
+
+    # NOTE: style groups keep the dictionaries they are set to, so copy them
+    return copy_style_value(theme_dict)
+
+
+# Function to copy a style value
+def copy_style_value(value: Any) -> Any:
+    """
+    Copies a style value, copying dictionaries, lists and styles within
+    it. Faster than a deep copy for the JSON-like values of styles.
+
+    Parameters
+    ----------
+    value : Any
+        Style value to copy.
+
+    Returns
+    -------
+    Any
+        Copy of the value.
+
+    """
+
+    # If the value is a string, number, boolean or None, return it
+    # NOTE: checked first, since most style values are immutable
+    if isinstance(value, (str, int, float)) or value is None:
+        return value
+
+    # If the value is a dictionary, copy its values
+    elif isinstance(value, dict):
+        return {key: copy_style_value(item) for key, item in value.items()}
+
+    # If the value is a list, copy its items
+    elif isinstance(value, list):
+        return [copy_style_value(item) for item in value]
+
+    # If the value is a style, copy it
+    elif isinstance(value, Freezable):
+        return value.copy()
+
+    # Otherwise, return the value
+    else:
+        return value
+
+
+# Function to get the shared default Theme
+def get_default_theme() -> 'Theme':
+    """
+    Gets the default Theme shared by every DataSet that was not given its
+    own Theme. The shared Theme is frozen, so it cannot be modified (see
+    Freezable.copy).
+
+    Returns
+    -------
+    Theme
+        Shared default Theme.
+
+    """
+
+    # Get the shared default Theme
+    global _DEFAULT_THEME
+
+    # If the shared default Theme was not created, create and freeze it
+    if _DEFAULT_THEME is None:
+        _DEFAULT_THEME = Theme()
+        _DEFAULT_THEME.freeze()
+
+    # Otherwise, pass
+    else:
+        pass
+
+    return _DEFAULT_THEME
+
+
+""" FREEZABLE CLASS """
+
+
+# Define the Freezable class
+class Freezable:
+    """
+    Parent class of styles and Themes, whose attributes can no longer be
+    set once frozen.
+    """
+
+    # Define whether the object is frozen
+    _frozen = False
+
+    # Method to set an attribute unless the object is frozen
+    def __setattr__(self, name, value):
+
+        # If the object is frozen, raise an error
+        if self._frozen:
+            raise AttributeError('The shared default theme cannot be '
+                                 'modified, modify a copy instead.')
+
+        # Otherwise, pass
+        else:
+            pass
+
+        super().__setattr__(name, value)
+
+    # Method to copy the object
+    def copy(self):
+        """
+        Gets an unfrozen copy of the object, which may be modified.
+
+        Returns
+        -------
+        Freezable
+            Copy of the object.
+
+        """
+
+        # Create an object of the same class without initializing it
+        style_copy = object.__new__(type(self))
+
+        # Copy the object's attributes, unfrozen
+        # NOTE: set through the attribute dictionary, since it may be frozen
+        vars(style_copy).update(
+            {name: copy_style_value(value)
+             for name, value in vars(self).items() if name != '_frozen'})
+
+        return style_copy
+
 
 """ CELLSTYLE CLASS"""
 
 
 # Define the CellStyle class
-class CellStyle:
+class CellStyle(Freezable):
     """
     CellStyle objects contain details about how to format each
     cell style.
@@ -376,7 +556,7 @@ class CellStyle:
 
 
 # Define the ChartStyle class
-class ChartStyle:
+class ChartStyle(Freezable):
     """
     ChartStyle objects contain details about how to format charts.
 
@@ -683,7 +863,7 @@ class ChartStyle:
 
 
 # Define the Theme class
-class Theme:
+class Theme(Freezable):
     """
     Theme objects contain details about how to format reports from
     exporting Results.
@@ -715,13 +895,28 @@ class Theme:
         # Create a dictionary for custom column style groups
         self.columns = {}
 
-        # Get the current script path
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-
         # Load the default cqtheme
-        self.import_theme(
-            os.path.join(script_dir, 'themes', 'default.cqtheme')
-            )
+        self.import_theme(DEFAULT_THEME_PATH)
+
+    # Method to freeze the Theme and its style groups
+    def freeze(self):
+        """
+        Freezes the Theme and its style groups, so they can no longer be
+        modified.
+
+        Returns
+        -------
+        None
+
+        """
+
+        # For the Theme and every style group...
+        for style in (self, *(getattr(self, group) for group
+                              in self.cell_styles + self.chart_styles)):
+            # Freeze the object
+            object.__setattr__(style, '_frozen', True)
+
+        return None
 
     # Method to add a new style group for a column
     # NOTE: only used for Tables and Breakdowns
@@ -732,6 +927,15 @@ class Theme:
                                style_group: CellStyle = CellStyle(),
                                ):
 
+        # If the Theme is frozen, raise an error
+        if self._frozen:
+            raise AttributeError('The shared default theme cannot be '
+                                 'modified, modify a copy instead.')
+
+        # Otherwise, pass
+        else:
+            pass
+
         # Add the style_group as an attribute to the columns attribute
         self.columns[group_name] = style_group
 
@@ -751,8 +955,7 @@ class Theme:
     def import_theme(self, path):
 
         # Load the .cqtheme at path
-        with open(path, 'r') as f:
-            theme_dict = json.load(f)
+        theme_dict = load_theme_file(path)
 
         # For every group in the theme...
         for group, group_dict in theme_dict.items():
@@ -6,8 +6,6 @@ extract information out of chemical formulas (e.g., molecular weight).
 
 """
 
-from chemformula import ChemFormula
-
 """ FUNCTIONS """
 
 
@@ -33,6 +31,10 @@ def get_number_element_atoms(formula: str | list[str],
 
     """
 
+    # Import ChemFormula
+    # NOTE: imported when first used, so importing ChromaQuant is faster
+    from chemformula import ChemFormula
+
     # Try...
     try:
         # ...to split formula (checks if list or string)
@@ -90,6 +92,10 @@ def get_molecular_weight(formula: str | list[str]) -> float | list[float]:
 
     """
 
+    # Import ChemFormula
+    # NOTE: imported when first used, so importing ChromaQuant is faster
+    from chemformula import ChemFormula
+
     # Try...
     try:
         # ...to split formula (checks if list or string)
@@ -7,9 +7,17 @@ Pandas DataFrames like adding new columns or filtering rows by some value.
 
 """
 
+from collections.abc import Callable
 from typing import Any
+import numpy as np
 from pandas import DataFrame, Series
 
+""" CONSTANTS """
+
+# Operators permitted in a row filter specification
+ROW_FILTER_OPERATORS = ['eq', 'ne', 'isin', 'notin', 'gt', 'ge', 'lt', 'le',
+                        'between', 'isna', 'notna', 'not']
+
 """ FUNCTIONS """
 
 
@@ -93,8 +101,9 @@ def column_adjust(dataframe: DataFrame,
             new_dataframe[column] = None
 
     # Rename columns using key-value pairs in rename_dict
+    # NOTE: Renames in place to avoid copying the new dataframe again
     if rename_dict:
-        new_dataframe = new_dataframe.rename(columns=rename_dict)
+        new_dataframe.rename(columns=rename_dict, inplace=True)
 
     # Remove dataframe columns as specified in remove_col...
     if remove_col:
@@ -103,20 +112,247 @@ def column_adjust(dataframe: DataFrame,
     return new_dataframe
 
 
+# Function to evaluate one operator from a row filter specification
+def _evaluate_filter_operator(column: Series,
+                              operator: str,
+                              argument: Any) -> np.ndarray:
+    """
+    Function that evaluates one row filter operator against a column.
+
+    Parameters
+    ----------
+    column : pandas.Series
+        Column to evaluate the operator against.
+    operator : str
+        Name of the operator, one of ROW_FILTER_OPERATORS.
+    argument : Any
+        Argument passed to the operator in the filter specification.
+
+    Returns
+    -------
+    mask : numpy.ndarray
+        Boolean array that is True where a row satisfies the operator.
+
+    """
+
+    # If the operator is a negation...
+    if operator == 'not':
+        # Evaluate the nested specification and invert it
+        mask = ~_evaluate_column_spec(column, argument)
+
+    # Otherwise, if the operator is a membership test...
+    elif operator in ('isin', 'notin'):
+        # Get the membership mask
+        mask = column.isin(list(argument)).to_numpy(dtype=bool)
+        # Invert the mask for notin
+        mask = mask if operator == 'isin' else ~mask
+
+    # Otherwise, if the operator is an inclusive range...
+    elif operator == 'between':
+        # Unpack the lower and upper bounds
+        lower, upper = argument
+        # Get the range mask
+        mask = column.between(lower, upper).to_numpy(dtype=bool,
+                                                     na_value=False)
+
+    # Otherwise, if the operator is a null check...
+    elif operator in ('isna', 'notna'):
+        # Get the null mask
+        mask = column.isna().to_numpy(dtype=bool)
+        # Invert the mask when checking for non-null values, or when
+        # the argument asks for the opposite of the operator
+        mask = mask if (operator == 'isna') == bool(argument) else ~mask
+
+    # Otherwise, the operator is a comparison...
+    else:
+        # Get the comparison as a Series method (e.g., Series.ge)
+        mask = getattr(column, operator)(argument).to_numpy(dtype=bool,
+                                                            na_value=False)
+
+    return mask
+
+
+# Function to evaluate a row filter specification for a single column
+def _evaluate_column_spec(column: Series, spec: Any) -> np.ndarray:
+    """
+    Function that evaluates a single column's filter specification.
+
+    Parameters
+    ----------
+    column : pandas.Series
+        Column to evaluate the specification against.
+    spec : Any
+        Either a dictionary of operators and arguments or a plain value,
+        which is treated as an equality test.
+
+    Returns
+    -------
+    mask : numpy.ndarray
+        Boolean array that is True where a row satisfies every operator.
+
+    """
+
+    # If the specification is not a dictionary, treat it as equality
+    if not isinstance(spec, dict):
+        spec = {'eq': spec}
+
+    # Otherwise, pass
+    else:
+        pass
+
+    # Initialize a mask that keeps every row
+    mask = np.ones(len(column), dtype=bool)
+
+    # For every operator in the specification...
+    for operator, argument in spec.items():
+        # Combine the operator's mask with the current mask
+        mask &= _evaluate_filter_operator(column, operator, argument)
+
+    return mask
+
+
+# Function to validate a column's row filter specification
+def _check_column_spec(spec: Any):
+    """
+    Function that checks every operator in a column's filter specification,
+    including nested negations.
+
+    Parameters
+    ----------
+    spec : Any
+        Either a dictionary of operators and arguments or a plain value.
+
+    Returns
+    -------
+    None
+
+    Raises
+    ------
+    ValueError
+        If the specification contains an unknown operator.
+    ValueError
+        If a membership operator is passed a string or bytes.
+
+    """
+
+    # If the specification is a dictionary...
+    if isinstance(spec, dict):
+
+        # Check that every operator is permitted
+        check_dict_keys(spec, ROW_FILTER_OPERATORS)
+
+        # For every membership operator in the specification...
+        for operator in ('isin', 'notin'):
+
+            # If the operator is passed a string, raise an error
+            # NOTE: a string would otherwise be split into characters
+            if isinstance(spec.get(operator), (str, bytes)):
+                raise ValueError(f'The "{operator}" operator expects a '
+                                 'list of values, not a string.')
+
+            # Otherwise, pass
+            else:
+                pass
+
+        # If the specification contains a negation, check it as well
+        if 'not' in spec:
+            _check_column_spec(spec['not'])
+
+        # Otherwise, pass
+        else:
+            pass
+
+    # Otherwise, pass
+    else:
+        pass
+
+    return None
+
+
+# Function to compile a row filter specification into a mask function
+def compile_row_filter(filter_dict: dict[str, Any]
+                       ) -> Callable[[DataFrame], np.ndarray]:
+    """
+    Function that validates a row filter specification once and returns
+    a function computing the specification's boolean row mask.
+
+    Parameters
+    ----------
+    filter_dict : dict[str, Any]
+        Dictionary containing column names as keys and either a desired
+        cell value or a dictionary of operators as values (See Notes).
+
+    Returns
+    -------
+    get_mask : Callable[[DataFrame], numpy.ndarray]
+        Function that accepts a DataFrame and returns a boolean array that
+        is True for every row satisfying all column specifications.
+
+    Raises
+    ------
+    ValueError
+        If the specification contains an unknown operator.
+    ValueError
+        If a membership operator is passed a string or bytes.
+
+    Notes
+    -----
+    Each column specification may be a plain value, which keeps rows equal
+    to that value, or a dictionary combining any of the following
+    operators, all of which must be satisfied::
+
+        {'eq': Any, 'ne': Any,
+         'isin': list[Any], 'notin': list[Any],
+         'gt': Any, 'ge': Any, 'lt': Any, 'le': Any,
+         'between': (lower, upper),
+         'isna': bool, 'notna': bool,
+         'not': Any}
+
+    The 'between' operator is inclusive, and 'not' inverts a nested column
+    specification. Every column is read once and the per-column masks are
+    combined into a single mask.
+
+    """
+
+    # Check every column specification
+    for spec in filter_dict.values():
+        _check_column_spec(spec)
+
+    # Get a shallow copy of the specification so later edits do not
+    # change the compiled filter
+    compiled_spec = dict(filter_dict)
+
+    # Define the mask function
+    def get_mask(dataframe: DataFrame) -> np.ndarray:
+
+        # Initialize a mask that keeps every row
+        mask = np.ones(len(dataframe), dtype=bool)
+
+        # For every column specification...
+        for column_name, spec in compiled_spec.items():
+            # Combine the column's mask with the current mask
+            mask &= _evaluate_column_spec(dataframe[column_name], spec)
+
+        return mask
+
+    return get_mask
+
+
 # Function to filter a DataFrame based on certain values in rows
 def row_filter(dataframe: DataFrame, filter_dict: dict) -> DataFrame:
     """
     Function used to filter a passed DataFrame
-    such that it only contains certain values
-    in specific columns.
+    such that it only contains rows meeting a
+    row filter specification.
 
     Parameters
     ----------
     dataframe : pandas.DataFrame
         DataFrame to have rows filtered.
     filter_dict : dict
-        Dictionary containing column names as keys and desired cell values
-        as values.
+        Dictionary containing column names as keys and either desired cell
+        values or dictionaries of operators as values (see
+        compile_row_filter).
 
     Returns
     -------
@@ -125,14 +361,18 @@ def row_filter(dataframe: DataFrame, filter_dict: dict) -> DataFrame:
 
     """
 
-    # Define a new dataframe
-    new_dataframe = dataframe.copy()
+    # If there is nothing to filter by...
+    if not filter_dict:
+        # Define a new dataframe
+        new_dataframe = dataframe.copy()
+
+    # Otherwise...
+    else:
+        # Compute a single mask for every column specification
+        mask = compile_row_filter(filter_dict)(dataframe)
 
-    # Filter the new dataframe to only include rows where the value
-    # in some column is equal to the value associated with the key
-    # in filter_dict that matches that column's header
-    for key, value in filter_dict.items():
-        new_dataframe = new_dataframe.loc[new_dataframe[key] == value]
+        # Take the rows where the mask is True
+        new_dataframe = dataframe.take(np.flatnonzero(mask))
 
     return new_dataframe
 
@@ -21,6 +21,8 @@ Started 1-22-2026
 """
 
 import chromaquant as cq
+import copy
+import pickle
 
 """ TEST CLASS """
 
@@ -236,3 +238,96 @@ class TestFormula:
             pass
 
         assert test_result
+
+    # Test compiled formula templates
+    def test_formula_template(self):
+
+        # Create table and value references
+        dataset_references = {'Some Table':
+                              {'Column 1': {
+                                'column_letter': 'B',
+                                'start_row': 3,
+                                'end_row': 5,
+                                'sheet': 'Some Sheet',
+                                'length': 3,
+                                'range': "'Some Sheet'!$B$3:$B$5"},
+                               'Column 2': {
+                                'column_letter': 'C',
+                                'start_row': 3,
+                                'end_row': 5,
+                                'sheet': 'Some Sheet',
+                                'length': 3,
+                                'range': "'Some Sheet'!$C$3:$C$5"}},
+                              'Value 1':
+                              {'column_letter': 'G',
+                               'row': 1,
+                               'sheet': 'Some Sheet',
+                               'name_cell': "'Some Sheet'!$G$1",
+                               'data_cell': "'Some Sheet'!$G$2"}}
+
+        # Create a formula with repeated per-row and shared inserts
+        formula = cq.Formula('=|table: Some Table, key: Column 1|*'
+                             '|key: Value 1|+|table: Some Table, '
+                             'key: Column 1|', 'Column 2', 'Some Table')
+
+        # Insert references for formula
+        formula.insert_references(dataset_references)
+
+        # Check that every row refers to its own cells
+        assert formula.referenced_formulas == \
+            [f"='Some Sheet'!$B${row}*'Some Sheet'!$G$2+'Some Sheet'!$B${row}"
+             for row in range(3, 6)]
+
+        # Create a formula with only a value insert, output to the table
+        formula = cq.Formula('=|key: Value 1|', 'Column 2', 'Some Table')
+
+        # Insert references for formula
+        formula.insert_references(dataset_references)
+
+        # Check that the formula is repeated for every row of the table
+        assert formula.referenced_formulas == ["='Some Sheet'!$G$2"] * 3
+
+    # Test caching parsed formula strings
+    def test_parse_cache(self):
+
+        # Clear the parse cache
+        cq.Formula.clear_parse_cache()
+
+        # Create two Formulas with the same formula string
+        formula_string = '=|table: Some Table, key: Column 1|*2'
+        first_formula = cq.Formula(formula_string)
+        second_formula = cq.Formula(formula_string)
+
+        # Check that the second Formula reused the first parse
+        cache_info = cq.Formula.parse_cache_info()
+        assert (cache_info.hits, cache_info.misses) == (1, 1)
+        assert first_formula.insert_list is second_formula.insert_list
+
+        # Check that the shared parse results cannot be changed
+        try:
+            first_formula.insert_list[0]['pointers']['key'] = 'Column 2'
+            test_result = False
+        except TypeError:
+            test_result = True
+
+        assert test_result
+
+    # Test pickling and copying Formulas
+    def test_formula_pickle(self):
+
+        # Create a Formula with an insert
+        formula = cq.Formula('=|key: abc| + 1', key_pointer='Some Value')
+
+        # For a pickled and a deep copied Formula...
+        for other in (pickle.loads(pickle.dumps(formula)),
+                      copy.deepcopy(formula)):
+
+            # Check that the Formula and its parsed inserts were restored
+            assert other.formula_string == formula.formula_string
+            assert other.key_pointer == 'Some Value'
+            assert other.insert_list == formula.insert_list
+            assert other._segments == formula._segments
+
+        # Check that a Formula without a formula string is restored
+        assert pickle.loads(pickle.dumps(cq.Formula())).formula_string \
+            is None
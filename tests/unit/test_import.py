@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+
+UNIT TESTING FOR IMPORTING CHROMAQUANT
+
+"""
+
+import json
+import os
+import pytest
+import subprocess
+import sys
+
+""" CONSTANTS """
+
+# Define the time budget of importing ChromaQuant, in seconds
+# NOTE: importing pandas and openpyxl alone takes far longer, the budget
+# leaves room for slow or shared machines
+IMPORT_TIME_BUDGET = 0.5
+
+# Define the environment variable enabling the import timing test
+# NOTE: timings vary too much across machines to check them by default
+TIMING_VARIABLE = 'CHROMAQUANT_TEST_IMPORT_TIME'
+
+# Define the dependencies that must only be imported when first used
+LAZY_DEPENDENCIES = ('pandas', 'openpyxl', 'xlsxwriter', 'chemformula')
+
+# Define a script timing the import of ChromaQuant in a new interpreter
+IMPORT_SCRIPT = '''
+import json, sys, time
+start = time.perf_counter()
+import chromaquant
+elapsed = time.perf_counter() - start
+print(json.dumps({'elapsed': elapsed, 'modules': sorted(sys.modules)}))
+'''
+
+""" FUNCTIONS """
+
+
+# Function to run a script in a new interpreter and get its JSON output
+def run_script(script: str) -> dict:
+
+    # Run the script
+    output = subprocess.run([sys.executable, '-c', script],
+                            capture_output=True, text=True, check=True)
+
+    return json.loads(output.stdout)
+
+
+""" TEST CLASS """
+
+
+class TestImport:
+
+    # Test that importing ChromaQuant imports no dependencies
+    def test_import_modules(self):
+
+        # Get the imported modules
+        run = run_script(IMPORT_SCRIPT)
+
+        # Check that no dependency was imported
+        assert not [module for module in run['modules']
+                    if module.split('.')[0] in LAZY_DEPENDENCIES]
+
+    # Test that importing ChromaQuant is fast
+    @pytest.mark.skipif(not os.environ.get(TIMING_VARIABLE),
+                        reason=f'set {TIMING_VARIABLE} to time the import')
+    def test_import_time(self):
+
+        # Get the best of three import times
+        elapsed = min(run_script(IMPORT_SCRIPT)['elapsed']
+                      for _ in range(3))
+
+        # Check that importing stays within the budget
+        assert elapsed < IMPORT_TIME_BUDGET
+
+    # Test that classes are imported when first used
+    def test_lazy_attributes(self):
+
+        # Use some classes and check that reporting dependencies were not
+        # imported
+        run = run_script('import json, sys\n'
+                         'import chromaquant as cq\n'
+                         'cq.Table, cq.Results, cq.formula.Formula\n'
+                         'print(json.dumps({"modules": '
+                         'sorted(sys.modules)}))')
+        assert 'pandas' in run['modules']
+        assert 'xlsxwriter' not in run['modules']
+        assert 'chemformula' not in run['modules']
@@ -21,6 +21,20 @@ Started 1-23-2026
 """
 
 import chromaquant as cq
+from io import BytesIO
+import json
+import numpy as np
+import openpyxl
+import os
+import pickle
+import pytest
+from openpyxl.chart import BarChart
+from pandas import DataFrame, read_csv
+import xlsxwriter
+import zipfile
+from chromaquant.results import exporting_tools, parallel_writer
+from chromaquant.results.reporting_tools import get_cached_value, \
+    get_col_widths, report_table
 
 """ TEST CLASS """
 
@@ -188,3 +202,1053 @@ class TestResults:
             raise Exception(f'A test report could not be generated: {e}')
 
         assert test_result
+
+    # Test deferring updates with a batch block
+    def test_batch(self):
+
+        # Create an instance of Results
+        SomeResults = cq.Results()
+
+        # Create a Table and Value
+        SomeTable = cq.Table(sheet='Some Sheet', start_cell='B4')
+        SomeTable.data['A'] = [1, 2, 3]
+        SomeValue = cq.Value(20, sheet='Some Sheet', start_cell='B2')
+
+        # Add the Table and Value to Results
+        SomeResults.add_table(SomeTable)
+        SomeResults.add_value(SomeValue)
+
+        # Add a Formula to the Table
+        SomeFormula = cq.Formula(f'=|table: {SomeTable.id}, key: A|'
+                                 f'*|key: {SomeValue.id}|')
+        SomeFormula.point_to('B', SomeTable.id)
+        SomeResults.add_formula(SomeFormula)
+
+        # Count the number of recomputations
+        recompute_count = []
+        recompute = SomeResults._recompute_datasets
+        SomeResults._recompute_datasets = \
+            lambda *args: recompute_count.append(1) or recompute(*args)
+
+        # Move the Table and Value within nested batches
+        with SomeResults.batch():
+            SomeTable.sheet = 'Other Sheet'
+            with SomeResults.batch():
+                SomeValue.start_cell = 'C2'
+            SomeTable.start_cell = 'B5'
+
+            # Check that nothing was recomputed inside the batch
+            assert not recompute_count
+
+        # Check that formulas were recomputed once, using the new locations
+        assert len(recompute_count) == 1
+        assert SomeTable.data.at[0, 'B'] == \
+            "='Other Sheet'!$B$6*'Some Sheet'!$C$2"
+
+        # Check that flushing without pending updates does nothing
+        SomeResults.flush()
+        assert len(recompute_count) == 1
+
+    # Test recomputing only formulas and breakdowns depending on a change
+    def test_dependency_order(self):
+
+        # Create an instance of Results
+        SomeResults = cq.Results()
+
+        # Create a Table and three Values
+        SomeTable = cq.Table(sheet='Some Sheet', start_cell='B4')
+        SomeTable.data['A'] = [1, 2, 3]
+        SomeTable.data['G'] = ['x', 'y', 'x']
+        FirstValue = cq.Value(20, sheet='Some Sheet', start_cell='B2')
+        SecondValue = cq.Value(30, sheet='Some Sheet', start_cell='C2')
+        ThirdValue = cq.Value(sheet='Some Sheet', start_cell='D2')
+        for dataset in (SomeTable, FirstValue, SecondValue, ThirdValue):
+            dataset.mediator = SomeResults
+
+        # Add a chain of Formulas: A -> B -> C, and one on the second Value
+        FormulaB = cq.Formula(f'=|table: {SomeTable.id}, key: A|'
+                              f'*|key: {FirstValue.id}|', 'B', SomeTable.id)
+        FormulaC = cq.Formula(f'=|table: {SomeTable.id}, key: B|*2',
+                              'C', SomeTable.id)
+        FormulaD = cq.Formula(f'=|key: {SecondValue.id}|*2', ThirdValue.id)
+        SomeResults.add_formula(FormulaB)
+        SomeResults.add_formula(FormulaC)
+        SomeResults.add_formula(FormulaD)
+
+        # Add a Breakdown summarizing column C
+        SomeBreakdown = cq.Breakdown(start_cell='H4', sheet='Some Sheet',
+                                     results=SomeResults)
+        SomeBreakdown.create_1D(SomeTable, 'G', 'C')
+
+        # Check that a change to the first Value only affects its dependents
+        assert SomeResults._get_recompute_order({FirstValue.id}) == \
+            [FormulaB, FormulaC, SomeBreakdown]
+
+        # Check that a change to the second Value only affects its formula
+        assert SomeResults._get_recompute_order({SecondValue.id}) == \
+            [FormulaD]
+
+        # Check that moving the Breakdown only reconstructs the Breakdown
+        assert SomeResults._get_recompute_order({SomeBreakdown.id}) == \
+            [SomeBreakdown]
+
+        # Check that formulas depending on each other in a cycle raise
+        SomeResults._formula_cache.append(
+            cq.Formula(f'=|table: {SomeTable.id}, key: C|', 'A',
+                       SomeTable.id))
+        try:
+            SomeResults._get_recompute_order({FirstValue.id})
+            test_result = False
+        except ValueError:
+            test_result = True
+
+        assert test_result
+
+    # Test writing a Table column as one array formula
+    def test_array_formula(self):
+
+        # Create an instance of Results
+        SomeResults = cq.Results()
+
+        # Create a Table and Value
+        SomeTable = cq.Table(sheet='Some Sheet', start_cell='B4')
+        SomeTable.data['A'] = [1, 2, 3]
+        SomeValue = cq.Value(20, sheet='Some Sheet', start_cell='F2')
+
+        # Add the Table and Value to Results
+        SomeResults.add_table(SomeTable)
+        SomeResults.add_value(SomeValue)
+
+        # Add an array Formula to the Table
+        SomeResults.add_formula(
+            cq.Formula(f'=|table: {SomeTable.id}, key: A|'
+                       f'*|key: {SomeValue.id}|', 'B', SomeTable.id,
+                       array=True))
+
+        # Check that one formula over the column range is stored in every row
+        assert SomeTable.data['B'].tolist() == \
+            ["='Some Sheet'!$B$5:$B$7*'Some Sheet'!$F$2"] * 3
+
+        # Report Results
+        SomeResults.report_results('./tests/unit/report.xlsx')
+
+        # Check that the column was written as one array formula
+        workbook = openpyxl.load_workbook('./tests/unit/report.xlsx')
+        sheet = workbook['Some Sheet']
+        assert sheet['C5'].value.ref == 'C5:C7'
+        assert sheet['C5'].value.text == \
+            "='Some Sheet'!$B$5:$B$7*'Some Sheet'!$F$2"
+
+    # Test computing the values of formulas without Excel
+    def test_evaluate(self):
+
+        # Create an instance of Results
+        SomeResults = cq.Results()
+
+        # Create a Table and Value
+        SomeTable = cq.Table(sheet='Some Sheet', start_cell='B4')
+        SomeTable.data['Name'] = ['a', 'b', 'a', 'c']
+        SomeTable.data['A'] = [1.0, 2.0, 3.0, 0.0]
+        SomeValue = cq.Value(2, sheet='Some Sheet', start_cell='H2')
+
+        # Add the Table and Value to Results
+        SomeResults.add_table(SomeTable)
+        SomeResults.add_value(SomeValue)
+
+        # Add a Formula dividing the Value by every row, with errors blank
+        SomeResults.add_formula(cq.formula.FORMULA_IF_ERROR(
+            cq.formula.FORMULA_DIVISION(SomeValue.insert(),
+                                        SomeTable.insert('A'),
+                                        'B', SomeTable.id)))
+
+        # Add a Formula summing A over rows with the same name
+        SomeResults.add_formula(
+            cq.Formula(f"=SUMIFS({SomeTable.insert('A', True)}, "
+                       f"{SomeTable.insert('Name', True)}, "
+                       f"{SomeTable.insert('Name')})", 'C', SomeTable.id))
+
+        # Add a Formula looking up the value of A for name "c"
+        OtherValue = cq.Value(sheet='Some Sheet', start_cell='I2')
+        SomeResults.add_value(OtherValue)
+        SomeResults.add_formula(
+            cq.Formula(f"=INDEX({SomeTable.insert('A', True)}, MATCH(\"C\", "
+                       f"{SomeTable.insert('Name', True)}, 0))^2+1",
+                       OtherValue.id))
+
+        # Add a Breakdown counting rows by name
+        SomeBreakdown = cq.Breakdown(start_cell='B12', sheet='Some Sheet',
+                                     results=SomeResults,
+                                     conditional_aggregate='COUNTIFS')
+        SomeBreakdown.create_1D(SomeTable, 'Name', 'A')
+        SomeResults.add_breakdown(SomeBreakdown)
+
+        # Evaluate Results
+        values = SomeResults.evaluate()
+
+        # Check the computed Table, Values and Breakdown
+        assert values[SomeTable.id]['B'].tolist() == [2.0, 1.0, 2 / 3, '']
+        assert values[SomeTable.id]['C'].tolist() == [4.0, 2.0, 4.0, 0.0]
+        assert values[OtherValue.id] == 1.0
+        assert values[SomeBreakdown.id].iloc[0].tolist() == [2.0, 1.0, 1.0]
+
+    # Test writing computed values as cached formula results
+    def test_cached_values(self):
+
+        # Create an instance of Results
+        SomeResults = cq.Results()
+
+        # Create a Table and Value
+        SomeTable = cq.Table(sheet='Some Sheet', start_cell='B4')
+        SomeTable.data['A'] = [1.0, 2.0, 0.0]
+        SomeValue = cq.Value(2, sheet='Some Sheet', start_cell='H2')
+
+        # Add the Table and Value to Results
+        SomeResults.add_table(SomeTable)
+        SomeResults.add_value(SomeValue)
+
+        # Add a Formula dividing the Value by every row
+        SomeResults.add_formula(
+            cq.formula.FORMULA_DIVISION(SomeValue.insert(),
+                                        SomeTable.insert('A'),
+                                        'B', SomeTable.id))
+
+        # Write the Table with its computed values using xlsxwriter
+        workbook = xlsxwriter.Workbook('./tests/unit/report.xlsx')
+        report_table(SomeTable, workbook,
+                     cached_values=SomeResults.evaluate()[SomeTable.id])
+        workbook.close()
+
+        # Check that the formulas and their cached results were written
+        sheet = openpyxl.load_workbook('./tests/unit/report.xlsx')[
+            'Some Sheet']
+        cached_sheet = openpyxl.load_workbook('./tests/unit/report.xlsx',
+                                              data_only=True)['Some Sheet']
+        assert sheet['C5'].value == "=('Some Sheet'!$H$2/'Some Sheet'!$B$5)"
+        assert [cached_sheet[f'C{row}'].value for row in range(5, 8)] == \
+            [2, 1, '#DIV/0!']
+
+    # Test caching the errors of formulas as the errors Excel computes
+    def test_cached_errors(self, monkeypatch):
+
+        # Create an instance of Results
+        SomeResults = cq.Results()
+
+        # Create a Table and Value
+        SomeTable = cq.Table(sheet='Some Sheet', start_cell='B4')
+        SomeTable.data['Name'] = ['a', 'b']
+        SomeTable.data['A'] = [1.0, 0.0]
+        SomeValue = cq.Value(2, sheet='Some Sheet', start_cell='H2')
+
+        # Add the Table and Value to Results
+        SomeResults.add_table(SomeTable)
+        SomeResults.add_value(SomeValue)
+
+        # Add a Formula dividing the Value by every row of A
+        SomeResults.add_formula(
+            cq.formula.FORMULA_DIVISION(SomeValue.insert(),
+                                        SomeTable.insert('A'),
+                                        'C', SomeTable.id))
+
+        # Add Formulas matching a missing name, and looking up its A
+        MatchValue = cq.Value(sheet='Some Sheet', start_cell='H3')
+        IndexValue = cq.Value(sheet='Some Sheet', start_cell='H4')
+        SomeResults.add_value(MatchValue)
+        SomeResults.add_value(IndexValue)
+        match = f"MATCH(\"z\", {SomeTable.insert('Name', True)}, 0)"
+        SomeResults.add_formula(cq.Formula(f'={match}', MatchValue.id))
+        SomeResults.add_formula(
+            cq.Formula(f"=INDEX({SomeTable.insert('A', True)}, {match})*2",
+                       IndexValue.id))
+
+        # Add a Formula referring to a sheet with no DataSet
+        MissingValue = cq.Value(sheet='Some Sheet', start_cell='H5')
+        SomeResults.add_value(MissingValue)
+        SomeResults.add_formula(cq.Formula('=Other!A1+1', MissingValue.id))
+
+        # Report the Results
+        SomeResults.report_results('./tests/unit/report.xlsx')
+
+        # Check that the errors Excel computes were cached
+        cached_sheet = openpyxl.load_workbook('./tests/unit/report.xlsx',
+                                              data_only=True)['Some Sheet']
+        assert [cached_sheet[f'D{row}'].value for row in (5, 6)] == \
+            [2, '#DIV/0!']
+        assert cached_sheet['H3'].value == '#N/A'
+        assert cached_sheet['H4'].value == '#N/A'
+        assert cached_sheet['H5'].value == '#REF!'
+
+        # Check that errors of unknown kind, like NaN in data, are not
+        # cached
+        assert get_cached_value(np.nan) == ''
+
+        # Make evaluation fail with an unexpected error
+        def evaluate(self):
+            raise RuntimeError('Some error')
+        monkeypatch.setattr(cq.formula.evaluation.FormulaEvaluator,
+                            'evaluate', evaluate)
+
+        # Report the Results, checking that formulas are written with
+        # xlsxwriter's default cached value
+        SomeResults.report_results('./tests/unit/report.xlsx')
+        sheet = openpyxl.load_workbook('./tests/unit/report.xlsx')[
+            'Some Sheet']
+        cached_sheet = openpyxl.load_workbook('./tests/unit/report.xlsx',
+                                              data_only=True)['Some Sheet']
+        assert sheet['H5'].value == '=Other!A1+1'
+        assert cached_sheet['H5'].value == 0
+
+    # Test reporting Results in one xlsxwriter pass
+    def test_single_pass(self):
+
+        # Create an instance of Results
+        SomeResults = cq.Results()
+
+        # Create a Table with a header and a Value
+        SomeTable = cq.Table(sheet='Some Sheet', start_cell='B4',
+                             header='Some Header')
+        SomeTable.data['A'] = [1.0, 2.0, 4.0]
+        SomeTable.data['B'] = [3.0, 2.0, 1.0]
+        SomeValue = cq.Value(2, sheet='Some Sheet', start_cell='H2',
+                             header='Some Value')
+
+        # Add the Table and Value to Results
+        SomeResults.add_table(SomeTable)
+        SomeResults.add_value(SomeValue)
+
+        # Add a Formula multiplying the Value by every row
+        SomeResults.add_formula(
+            cq.formula.FORMULA_MULTIPLICATION(SomeValue.insert(),
+                                              SomeTable.insert('A'),
+                                              'C', SomeTable.id))
+
+        # Add a Chart of the Table
+        SomeChart = cq.Chart(chart=BarChart(), theme=cq.Theme(),
+                             sheet='Some Sheet', anchor='$B$12')
+        SomeChart.indep_column = SomeTable.column_id('A')
+        SomeChart.data_columns = [SomeTable.column_id('B')]
+        SomeResults.add_chart(SomeChart)
+
+        # Report the Results
+        SomeResults.report_results('./tests/unit/report.xlsx')
+
+        # Check that the header is merged and formatted like the theme
+        sheet = openpyxl.load_workbook('./tests/unit/report.xlsx')[
+            'Some Sheet']
+        assert sheet['B4'].value == 'Some Header'
+        assert 'B4:D4' in sheet.merged_cells
+        assert sheet['B4'].font.b == SomeTable.theme.header.font.b
+        assert sheet['B4'].fill.fgColor.rgb[-6:] == \
+            SomeTable.theme.header.fill.fgColor.rgb[-6:]
+        assert sheet['C6'].alignment.horizontal == \
+            SomeTable.theme.body.alignment.horizontal
+
+        # Check that the Value, formulas and Chart were written
+        assert sheet['H2'].value == 'Some Value'
+        assert sheet['H3'].value == 2
+        assert sheet['D6'].value == "=('Some Sheet'!$H$3*'Some Sheet'!$B$6)"
+        assert len(sheet._charts) == 1
+
+        # Check that the formula results were cached
+        cached_sheet = openpyxl.load_workbook('./tests/unit/report.xlsx',
+                                              data_only=True)['Some Sheet']
+        assert [cached_sheet[f'D{row}'].value for row in range(6, 9)] == \
+            [2, 4, 8]
+
+    # Test formatting Tables with more than 10000 cells
+    def test_format_large_table(self):
+
+        # Create an instance of Results
+        SomeResults = cq.Results()
+
+        # Create a Table with 10000 rows
+        SomeTable = cq.Table(sheet='Some Sheet', start_cell='B4')
+        SomeTable.data['A'] = range(10000)
+
+        # Add the Table to Results
+        SomeResults.add_table(SomeTable)
+
+        # For each way of reporting Results...
+        for single_pass in (True, False):
+
+            # Report the Results
+            SomeResults.report_results('./tests/unit/report.xlsx',
+                                       single_pass=single_pass)
+
+            # Check that the last row was formatted using the body style
+            sheet = openpyxl.load_workbook('./tests/unit/report.xlsx')[
+                'Some Sheet']
+            assert sheet['B10004'].alignment.horizontal == \
+                SomeTable.theme.body.alignment.horizontal
+
+        # Check that the body cells share one named style, registered once
+        assert sheet['B6'].style == sheet['B10004'].style
+        assert sheet.parent.named_styles.count(sheet['B6'].style) == 1
+
+    # Test getting column widths from DataSets
+    def test_col_widths(self):
+
+        # Create a Table with a header and a Value on the same sheet
+        SomeTable = cq.Table(sheet='Some Sheet', start_cell='B4',
+                             header='A Header Longer Than Ten')
+        SomeTable.data['A'] = [1.5, 22.25]
+        SomeTable.data['Some Column'] = ['x', 'A value longer than 25 chars']
+        SomeValue = cq.Value(123456789.5, sheet='Some Sheet',
+                             start_cell='E2')
+
+        # Check that widths fit the longest value, between 8 and 25
+        assert get_col_widths([SomeTable, SomeValue]) == \
+            {'Some Sheet': {0: 8, 1: 24, 2: 25, 3: 8, 4: 11}}
+
+    # Test reporting Results in constant memory mode
+    def test_constant_memory(self):
+
+        # Create an instance of Results
+        SomeResults = cq.Results()
+
+        # Create a Table, a Value above it and a Value beside its rows
+        SomeTable = cq.Table(sheet='Some Sheet', start_cell='B4')
+        SomeTable.data['A'] = [1.0, 2.0, 4.0]
+        SomeValue = cq.Value(2, sheet='Some Sheet', start_cell='E2',
+                             header='Some Value')
+        OtherValue = cq.Value(3, sheet='Some Sheet', start_cell='D6')
+
+        # Add the DataSets to Results
+        SomeResults.add_table(SomeTable)
+        SomeResults.add_value(SomeValue)
+        SomeResults.add_value(OtherValue)
+
+        # Report the Results in constant memory mode
+        SomeResults.report_results('./tests/unit/report.xlsx',
+                                   constant_memory=True)
+
+        # Check that every DataSet was written despite sharing rows
+        sheet = openpyxl.load_workbook('./tests/unit/report.xlsx')[
+            'Some Sheet']
+        assert [sheet[f'B{row}'].value for row in range(4, 8)] == \
+            ['A', 1, 2, 4]
+        assert sheet['E2'].value == 'Some Value'
+        assert sheet['E3'].value == 2
+        assert sheet['D6'].value == 3
+
+    # Test splitting Tables over the worksheet limits across sheets
+    def test_sharded_table(self, monkeypatch):
+
+        # Lower the worksheet row limit, leaving four data rows per sheet
+        monkeypatch.setattr(cq.data.table, 'EXCEL_MAX_ROWS', 8)
+
+        # Create an instance of Results
+        SomeResults = cq.Results()
+
+        # Create a Table with six rows and Values on another sheet
+        SomeTable = cq.Table(sheet='Some Sheet', start_cell='B4')
+        SomeTable.data['Name'] = ['a', 'b', 'a', 'c', 'a', 'b']
+        SomeTable.data['A'] = [1.0, 2.0, 3.0, 4.0, 5.0, 6.0]
+        SomeValue = cq.Value(sheet='Other Sheet', start_cell='B2')
+
+        # Add the Table and Value to Results
+        SomeResults.add_table(SomeTable)
+        SomeResults.add_value(SomeValue)
+
+        # Add an array Formula doubling every row and a Formula summing A
+        SomeResults.add_formula(
+            cq.Formula(f"=2*{SomeTable.insert('A')}", 'B', SomeTable.id,
+                       array=True))
+        SomeResults.add_formula(
+            cq.Formula(f"=SUM({SomeTable.insert('A', True)})",
+                       SomeValue.id))
+
+        # Add a Breakdown summing A by name
+        SomeBreakdown = cq.Breakdown(start_cell='B6', sheet='Other Sheet',
+                                     results=SomeResults)
+        SomeBreakdown.create_1D(SomeTable, 'Name', 'A')
+        SomeResults.add_breakdown(SomeBreakdown)
+
+        # Check that the Table was split in two shards
+        assert [(shard['sheet'], shard['rows'])
+                for shard in SomeTable.shard_layout] == \
+            [('Some Sheet', (0, 4)), ('Some Sheet (2)', (4, 6))]
+
+        # Check that formulas refer to every shard
+        assert SomeValue.data == \
+            ("=SUM(_xlfn.VSTACK('Some Sheet'!$C$5:$C$8, "
+             "'Some Sheet (2)'!$C$5:$C$6))")
+        assert SomeTable.data['B'].iloc[4] == "=2*'Some Sheet (2)'!$C$5"
+        assert SomeBreakdown.data['a'].iloc[0] == \
+            ("=SUMIFS('Some Sheet'!$C$5:$C$8, 'Some Sheet'!$B$5:$B$8, B$6)"
+             "+SUMIFS('Some Sheet (2)'!$C$5:$C$6, "
+             "'Some Sheet (2)'!$B$5:$B$6, B$6)")
+
+        # Report the Results
+        SomeResults.report_results('./tests/unit/report.xlsx')
+
+        # Check that every shard and its cached values were written
+        workbook = openpyxl.load_workbook('./tests/unit/report.xlsx',
+                                          data_only=True)
+        assert [workbook['Some Sheet (2)'][f'C{row}'].value
+                for row in range(4, 7)] == ['A', 5, 6]
+        assert [workbook['Some Sheet (2)'][f'D{row}'].value
+                for row in range(5, 7)] == [10, 12]
+        assert workbook['Other Sheet']['B2'].value == 21
+        assert [workbook['Other Sheet'][f'{column}7'].value
+                for column in 'BCD'] == [9, 8, 4]
+
+        # Check that the manifest lists the shards
+        with open('./tests/unit/report.shards.json') as manifest_file:
+            manifest = json.load(manifest_file)
+        assert manifest == SomeResults.shard_manifest()
+        assert [shard['sheet'] for shard in manifest['tables'][0]['shards']] \
+            == ['Some Sheet', 'Some Sheet (2)']
+
+    # Test naming continuation sheets and replacing stale manifests
+    def test_sharded_table_sheets(self, monkeypatch):
+
+        # Lower the worksheet row limit, leaving four data rows per sheet
+        monkeypatch.setattr(cq.data.table, 'EXCEL_MAX_ROWS', 8)
+
+        # Create an instance of Results
+        SomeResults = cq.Results()
+
+        # Create a Table with ten rows and a Value on its second shard's
+        # default sheet
+        SomeTable = cq.Table(sheet='Some Sheet', start_cell='B4')
+        SomeTable.data['A'] = [float(row) for row in range(10)]
+        SomeValue = cq.Value(1, sheet='Some Sheet (2)', start_cell='B2')
+
+        # Add the Table and Value to Results
+        SomeResults.add_table(SomeTable)
+        SomeResults.add_value(SomeValue)
+
+        # Check that the continuation sheets skip the Value's sheet
+        assert [shard['sheet'] for shard in SomeTable.shard_layout] == \
+            ['Some Sheet', 'Some Sheet (3)', 'Some Sheet (4)']
+
+        # Report the Results, checking that the Value was not overwritten
+        SomeResults.report_results('./tests/unit/report.xlsx')
+        workbook = openpyxl.load_workbook('./tests/unit/report.xlsx')
+        assert workbook['Some Sheet (2)']['B2'].value == 1
+        assert workbook['Some Sheet (3)']['B5'].value == 4
+        assert os.path.exists('./tests/unit/report.shards.json')
+
+        # Move the Value, checking that the layout is updated
+        SomeValue.sheet = 'Other Sheet'
+        assert [shard['sheet'] for shard in SomeTable.shard_layout] == \
+            ['Some Sheet', 'Some Sheet (2)', 'Some Sheet (3)']
+
+        # Shrink the Table to fit one sheet and report to the same path
+        SomeTable.data = SomeTable.data.iloc[:2]
+        SomeResults.report_results('./tests/unit/report.xlsx')
+
+        # Check that the stale manifest was deleted
+        assert not os.path.exists('./tests/unit/report.shards.json')
+
+    # Test conditional aggregates of Tables split across sheets
+    def test_sharded_conditional_aggregate(self, monkeypatch):
+
+        # Lower the worksheet row limit, leaving four data rows per sheet
+        monkeypatch.setattr(cq.data.table, 'EXCEL_MAX_ROWS', 8)
+
+        # Create an instance of Results
+        SomeResults = cq.Results()
+
+        # Create a Table with six rows
+        SomeTable = cq.Table(sheet='Some Sheet', start_cell='B4')
+        SomeTable.data['Name'] = ['a', 'b', 'a', 'c', 'a', 'b']
+        SomeTable.data['A'] = [1.0, 2.0, 3.0, 4.0, 5.0, 6.0]
+
+        # Add the Table to Results
+        SomeResults.add_table(SomeTable)
+
+        # Add a Formula summing A over rows with the same name
+        SomeResults.add_formula(
+            cq.Formula(f"=SUMIFS({SomeTable.insert('A', True)}, "
+                       f"{SomeTable.insert('Name', True)}, "
+                       f"{SomeTable.insert('Name')})", 'B', SomeTable.id))
+
+        # Check that the formula sums a SUMIFS over every shard
+        assert SomeTable.data['B'].iloc[4] == \
+            ("=(SUMIFS('Some Sheet'!$C$5:$C$8, 'Some Sheet'!$B$5:$B$8, "
+             "'Some Sheet (2)'!$B$5)+SUMIFS('Some Sheet (2)'!$C$5:$C$6, "
+             "'Some Sheet (2)'!$B$5:$B$6, 'Some Sheet (2)'!$B$5))")
+
+        # Report the Results and check the cached sums
+        SomeResults.report_results('./tests/unit/report.xlsx')
+        workbook = openpyxl.load_workbook('./tests/unit/report.xlsx',
+                                          data_only=True)
+        assert [workbook['Some Sheet'][f'D{row}'].value
+                for row in range(5, 9)] + \
+            [workbook['Some Sheet (2)'][f'D{row}'].value
+             for row in range(5, 7)] == [9, 8, 9, 4, 9, 8]
+
+        # Check that a range split differently from the others is rejected
+        with pytest.raises(ValueError):
+            SomeResults.add_formula(
+                cq.Formula(f"=SUMIFS({SomeTable.insert('A', True)}, "
+                           "'Some Sheet'!$B$5:$B$10, \"a\")",
+                           'C', SomeTable.id))
+
+    # Test reporting new data with a compiled report template
+    def test_report_template(self):
+
+        # Create an instance of Results
+        SomeResults = cq.Results()
+
+        # Create a Table with a header and a Value
+        SomeTable = cq.Table(sheet='Some Sheet', start_cell='B4',
+                             header='Some Header')
+        SomeTable.data['A'] = [1.0, 2.0]
+        SomeValue = cq.Value(2, sheet='Some Sheet', start_cell='H2')
+
+        # Add the Table and Value to Results
+        SomeResults.add_table(SomeTable)
+        SomeResults.add_value(SomeValue)
+
+        # Add a Formula multiplying the Value by every row
+        SomeResults.add_formula(
+            cq.formula.FORMULA_MULTIPLICATION(SomeValue.insert(),
+                                              SomeTable.insert('A'),
+                                              'B', SomeTable.id))
+
+        # Add a Chart of the Table
+        SomeChart = cq.Chart(chart=BarChart(), theme=cq.Theme(),
+                             sheet='Some Sheet', anchor='$B$12')
+        SomeChart.indep_column = SomeTable.column_id('A')
+        SomeChart.data_columns = [SomeTable.column_id('B')]
+        SomeResults.add_chart(SomeChart)
+
+        # Compile the layout of the Results
+        template = SomeResults.compile_template()
+
+        # Report the Results with new data for the Table
+        template.report('./tests/unit/report.xlsx',
+                        {SomeTable.id: DataFrame({'A': [1.0, 2.0, 4.0]})})
+
+        # Check that the new data, formulas and cached values were written
+        sheet = openpyxl.load_workbook('./tests/unit/report.xlsx')[
+            'Some Sheet']
+        cached_sheet = openpyxl.load_workbook('./tests/unit/report.xlsx',
+                                              data_only=True)['Some Sheet']
+        assert sheet['B8'].value == 4
+        assert sheet['C8'].value == "=('Some Sheet'!$H$2*'Some Sheet'!$B$8)"
+        assert [cached_sheet[f'C{row}'].value for row in range(6, 9)] == \
+            [2, 4, 8]
+
+        # Check that the header was formatted and the Chart was written
+        assert 'B4:C4' in sheet.merged_cells
+        assert sheet['B4'].font.b == SomeTable.theme.header.font.b
+        assert len(sheet._charts) == 1
+
+    def test_report_file_like(self):
+
+        # Create an instance of Results
+        SomeResults = cq.Results()
+
+        # Create a Table and a Value
+        SomeTable = cq.Table(sheet='Some Sheet', start_cell='B2')
+        SomeTable.data['A'] = [1.0, 2.0]
+        SomeValue = cq.Value(3, sheet='Some Sheet', start_cell='F2')
+
+        # Add the Table and Value to Results
+        SomeResults.add_table(SomeTable)
+        SomeResults.add_value(SomeValue)
+
+        # For every reporting mode...
+        for single_pass in (True, False):
+
+            # Report the Results to a buffer
+            output = BytesIO()
+            SomeResults.report_results(output, single_pass=single_pass)
+
+            # Check that the buffer was left open and holds the report
+            assert not output.closed
+            output.seek(0)
+            sheet = openpyxl.load_workbook(output)['Some Sheet']
+            assert [sheet[f'B{row}'].value for row in range(3, 5)] == \
+                [1, 2]
+            assert sheet['F2'].value == 3
+
+    def test_report_processes(self):
+
+        # Create an instance of Results
+        SomeResults = cq.Results()
+
+        # For every sheet...
+        for sheet in ('Sheet A', 'Sheet B', 'Sheet C'):
+
+            # Create a Table with a header
+            SomeTable = cq.Table(sheet=sheet, start_cell='B2',
+                                 header=f'{sheet} Header')
+            SomeTable.data['A'] = [1.0, 2.0, 3.0]
+            SomeTable.data['B'] = ['x', 'y', sheet]
+
+            # Add the Table to Results
+            SomeResults.add_table(SomeTable)
+
+        # Add a Chart of the last Table
+        SomeChart = cq.Chart(chart=BarChart(), theme=cq.Theme(),
+                             sheet='Sheet C', anchor='$B$12')
+        SomeChart.indep_column = SomeTable.column_id('B')
+        SomeChart.data_columns = [SomeTable.column_id('A')]
+        SomeResults.add_chart(SomeChart)
+
+        # Report the Results in one process, then with worksheets
+        # rendered in two processes to a path and to a buffer
+        SomeResults.report_results('./tests/unit/report.xlsx')
+        expected = openpyxl.load_workbook('./tests/unit/report.xlsx')
+        output = BytesIO()
+        SomeResults.report_results(output, processes=2)
+        SomeResults.report_results('./tests/unit/report.xlsx',
+                                   processes=2)
+
+        # For every report rendered in two processes...
+        for report in (output, './tests/unit/report.xlsx'):
+
+            # Load the report
+            workbook = openpyxl.load_workbook(report)
+
+            # Check that every sheet matches the one process report
+            assert workbook.sheetnames == expected.sheetnames
+            for sheet in workbook:
+                expected_sheet = expected[sheet.title]
+                assert [[(cell.value, cell.font.b) for cell in row]
+                        for row in sheet.iter_rows()] == \
+                    [[(cell.value, cell.font.b) for cell in row]
+                     for row in expected_sheet.iter_rows()]
+                assert sheet.merged_cells.ranges == \
+                    expected_sheet.merged_cells.ranges
+                assert len(sheet._charts) == len(expected_sheet._charts)
+
+    # Test that rendering worksheets in processes matches one process
+    def test_report_processes_match(self):
+
+        # Create Results with two sheets, headers and a Chart
+        SomeResults = self._get_two_sheet_results()
+
+        # Report the Results in one and in two processes
+        expected_output = BytesIO()
+        SomeResults.report_results(expected_output)
+        output = BytesIO()
+        SomeResults.report_results(output, processes=2)
+
+        # Open both reports as packages
+        expected_package = zipfile.ZipFile(expected_output)
+        package = zipfile.ZipFile(output)
+
+        # Check that both have the same parts
+        assert package.namelist() == expected_package.namelist()
+
+        # Check that every part is identical, except the creation time and
+        # the style indices
+        # NOTE: formats are indexed before forking, so in another order
+        for part in package.namelist():
+            if part != 'docProps/core.xml' and part != 'xl/styles.xml' \
+               and not part.startswith('xl/worksheets/sheet'):
+                assert package.read(part) == expected_package.read(part)
+
+        # Load both reports
+        expected = openpyxl.load_workbook(expected_output)
+        workbook = openpyxl.load_workbook(output)
+
+        # For every sheet, check that every cell has the same value and
+        # style, and that merged cells and column widths match
+        assert workbook.sheetnames == expected.sheetnames
+        for sheet in workbook:
+            expected_sheet = expected[sheet.title]
+            assert [[self._get_cell_state(cell) for cell in row]
+                    for row in sheet.iter_rows()] == \
+                [[self._get_cell_state(cell) for cell in row]
+                 for row in expected_sheet.iter_rows()]
+            assert sheet.merged_cells.ranges == \
+                expected_sheet.merged_cells.ranges
+            assert {column: dimension.width for column, dimension
+                    in sheet.column_dimensions.items()} == \
+                {column: dimension.width for column, dimension
+                 in expected_sheet.column_dimensions.items()}
+
+    # Test rendering in one process if xlsxwriter internals are missing
+    def test_report_processes_fallback(self, monkeypatch):
+
+        # Create Results with two sheets, headers and a Chart
+        SomeResults = self._get_two_sheet_results()
+
+        # Require an internal xlsxwriter does not have
+        monkeypatch.setitem(parallel_writer.REQUIRED_INTERNALS,
+                            xlsxwriter.worksheet.Worksheet,
+                            ('_missing_internal',))
+
+        # Check that no process pool is used
+        def fail_pool(*args, **kwargs):
+            raise AssertionError('A process pool was used.')
+        monkeypatch.setattr(parallel_writer, 'ProcessPoolExecutor',
+                            fail_pool)
+
+        # Report the Results in one process, then asking for two
+        expected_output = BytesIO()
+        SomeResults.report_results(expected_output)
+        output = BytesIO()
+        SomeResults.report_results(output, processes=2)
+
+        # Check that every part except the creation time is identical
+        expected_package = zipfile.ZipFile(expected_output)
+        package = zipfile.ZipFile(output)
+        assert package.namelist() == expected_package.namelist()
+        for part in package.namelist():
+            if part != 'docProps/core.xml':
+                assert package.read(part) == expected_package.read(part)
+
+    # Static method to create Results on two sheets
+    @staticmethod
+    def _get_two_sheet_results() -> cq.Results:
+
+        # Create an instance of Results
+        SomeResults = cq.Results()
+
+        # For every sheet...
+        for sheet in ('Sheet A', 'Sheet B'):
+
+            # Create a Table with a header and a Value
+            SomeTable = cq.Table(sheet=sheet, start_cell='B2',
+                                 header=f'{sheet} Header')
+            SomeTable.data['A'] = [1.0, 2.0, 3.0]
+            SomeTable.data['B'] = ['x', 'y', sheet]
+            SomeValue = cq.Value(4.0, sheet=sheet, start_cell='F2',
+                                 header='Total')
+
+            # Add the Table and Value to Results
+            SomeResults.add_table(SomeTable)
+            SomeResults.add_value(SomeValue)
+
+        # Add a Chart of the last Table
+        SomeChart = cq.Chart(chart=BarChart(), theme=cq.Theme(),
+                             sheet='Sheet B', anchor='$B$12')
+        SomeChart.indep_column = SomeTable.column_id('B')
+        SomeChart.data_columns = [SomeTable.column_id('A')]
+        SomeResults.add_chart(SomeChart)
+
+        return SomeResults
+
+    # Static method to get the value and resolved style of a cell
+    @staticmethod
+    def _get_cell_state(cell) -> tuple:
+        return (cell.value, repr(cell.font), repr(cell.fill),
+                repr(cell.border), repr(cell.alignment), cell.number_format,
+                repr(cell.protection))
+
+    def test_export_results(self, tmp_path, monkeypatch):
+
+        # Create an instance of Results
+        SomeResults = cq.Results()
+
+        # Create a Table and a Value
+        SomeTable = cq.Table(sheet='Some Sheet', start_cell='B2')
+        SomeTable.data['A'] = [1.0, 2.0, 0.0]
+        SomeTable.data['Name'] = ['x', 'y', 'z']
+        SomeValue = cq.Value(2, sheet='Some Sheet', start_cell='H2')
+
+        # Add the Table and Value to Results
+        SomeResults.add_table(SomeTable)
+        SomeResults.add_value(SomeValue)
+
+        # Add a Formula dividing the Value by every row, blank on errors
+        SomeResults.add_formula(cq.formula.FORMULA_IF_ERROR(
+            cq.formula.FORMULA_DIVISION(SomeValue.insert(),
+                                        SomeTable.insert('A'),
+                                        'B', SomeTable.id)))
+
+        # Add a Breakdown summing A by name
+        SomeBreakdown = cq.Breakdown(start_cell='B8', sheet='Some Sheet')
+        SomeResults.add_breakdown(SomeBreakdown)
+        SomeBreakdown.create_1D(SomeTable, 'Name', 'A')
+
+        # Export the Results to CSV files
+        manifest = SomeResults.export_results(tmp_path, 'csv')
+
+        # Check that the manifest was written and describes the Table
+        assert json.loads((tmp_path / 'manifest.json').read_text()) == \
+            manifest
+        assert manifest['tables'][0]['start_cell'] == 'B2'
+        assert [column['formula'] is not None
+                for column in manifest['tables'][0]['columns']] == \
+            [False, False, True]
+
+        # Check that formulas were resolved to their computed values
+        table_data = read_csv(tmp_path / manifest['tables'][0]['file'])
+        assert list(table_data['B'][:2]) == [2.0, 1.0]
+        assert table_data['B'].isna()[2]
+        assert list(table_data['Name']) == ['x', 'y', 'z']
+        value_data = read_csv(tmp_path / manifest['values_file'])
+        assert list(value_data['value']) == [2]
+
+        # Check that the manifest lists the formula of Breakdown columns
+        assert [column['formula']
+                for column in manifest['breakdowns'][0]['columns']] == \
+            SomeBreakdown.data.iloc[0].tolist()
+
+        # Check that formats needing pyarrow fail clearly without it
+        monkeypatch.setattr(exporting_tools, 'find_spec', lambda name: None)
+        with pytest.raises(ImportError, match='chromaquant\\[export\\]'):
+            SomeResults.export_results(tmp_path / 'parquet')
+        assert not (tmp_path / 'parquet').exists()
+
+    def test_from_report(self, monkeypatch):
+
+        # Lower the worksheet row limit, leaving four data rows per sheet
+        monkeypatch.setattr(cq.data.table, 'EXCEL_MAX_ROWS', 8)
+
+        # Create an instance of Results
+        SomeResults = cq.Results()
+
+        # Create a Table with six rows, one name missing, some empty types
+        # and a Value
+        SomeTable = cq.Table(sheet='Some Sheet', start_cell='B4',
+                             header='Some Header')
+        SomeTable.data['Name'] = ['a', 'b', 'a', None, 'a', 'b']
+        SomeTable.data['A'] = [1.0, 2.0, 3.0, 4.0, 5.0, 6.0]
+        SomeTable.data['Type'] = ['x', '', 'y', '', 'x', '']
+        SomeValue = cq.Value(2, sheet='Other Sheet', start_cell='B2')
+
+        # Add the Table and Value to Results
+        SomeResults.add_table(SomeTable)
+        SomeResults.add_value(SomeValue)
+
+        # Add a Formula multiplying the Value by every row
+        SomeResults.add_formula(
+            cq.formula.FORMULA_MULTIPLICATION(SomeValue.insert(),
+                                              SomeTable.insert('A'),
+                                              'B', SomeTable.id))
+
+        # Add a Breakdown summing B by name
+        SomeBreakdown = cq.Breakdown(start_cell='B6', sheet='Other Sheet')
+        SomeResults.add_breakdown(SomeBreakdown)
+        SomeBreakdown.create_1D(SomeTable, 'Name', 'B')
+
+        # Report the Results, then read them back
+        output = BytesIO()
+        SomeResults.report_results(output)
+        output.seek(0)
+        ReadResults = cq.Results.from_report(output)
+
+        # Check that the DataSets were recreated with their ids and layout
+        ReadTable = ReadResults._datasets[SomeTable.id]
+        assert ReadTable.header == 'Some Header'
+        assert ReadTable.shard_layout == SomeTable.shard_layout
+        assert list(ReadTable.data['Name']) == \
+            ['a', 'b', 'a', None, 'a', 'b']
+        assert list(ReadTable.data['A']) == [1, 2, 3, 4, 5, 6]
+        assert list(ReadTable.data['Type']) == ['x', '', 'y', '', 'x', '']
+        assert ReadTable.data['B'].equals(SomeTable.data['B'])
+        assert ReadResults._datasets[SomeValue.id].data == 2
+        assert ReadResults._datasets[SomeBreakdown.id].data.equals(
+            SomeBreakdown.data)
+
+        # Check that formulas are recomputed from the read data
+        ReadResults._datasets[SomeValue.id].data = 3
+        assert list(ReadResults.evaluate()[SomeBreakdown.id].iloc[0]) == \
+            [27, 24]
+
+        # Check that reports without an embedded layout are rejected
+        workbook = openpyxl.Workbook()
+        workbook.save('./tests/unit/report.xlsx')
+        with pytest.raises(ValueError):
+            cq.Results.from_report('./tests/unit/report.xlsx')
+
+    def test_snapshot(self, tmp_path, monkeypatch):
+
+        # Create an instance of Results
+        SomeResults = cq.Results()
+
+        # Create a Table with one name missing and a Value
+        SomeTable = cq.Table(sheet='Some Sheet', start_cell='B4')
+        SomeTable.data['Name'] = ['a', None, 'b']
+        SomeTable.data['A'] = [1.0, 2.0, 4.0]
+        SomeValue = cq.Value(2, sheet='Some Sheet', start_cell='H2')
+
+        # Add the Table and Value to Results
+        SomeResults.add_table(SomeTable)
+        SomeResults.add_value(SomeValue)
+
+        # Add a Formula multiplying the Value by every row
+        SomeResults.add_formula(
+            cq.formula.FORMULA_MULTIPLICATION(SomeValue.insert(),
+                                              SomeTable.insert('A'),
+                                              'B', SomeTable.id))
+
+        # Add a Breakdown summing B by name
+        SomeBreakdown = cq.Breakdown(start_cell='B10', sheet='Some Sheet')
+        SomeResults.add_breakdown(SomeBreakdown)
+        SomeBreakdown.create_1D(SomeTable, 'Name', 'B')
+
+        # Save a snapshot of the Results, then load it
+        SomeResults.save_snapshot(tmp_path, 'pickle')
+        LoadedResults = cq.Results.load_snapshot(tmp_path)
+
+        # Check that the DataSets were loaded with their ids and data
+        assert LoadedResults._datasets[SomeTable.id].data.equals(
+            SomeTable.data)
+        assert LoadedResults._datasets[SomeValue.id].data == 2
+        assert LoadedResults._datasets[SomeBreakdown.id].data.equals(
+            SomeBreakdown.data)
+
+        # Check that the loaded Results are wired to recompute formulas
+        LoadedResults._datasets[SomeValue.id].data = 3
+        assert list(LoadedResults.evaluate()[SomeBreakdown.id].iloc[0]) == \
+            [3, 12]
+
+        # Check that unsupported formats are rejected
+        with pytest.raises(ValueError):
+            SomeResults.save_snapshot(tmp_path, 'csv')
+
+        # Check that formats needing pyarrow fail clearly without it
+        monkeypatch.setattr(exporting_tools, 'find_spec', lambda name: None)
+        with pytest.raises(ImportError, match='chromaquant\\[export\\]'):
+            SomeResults.save_snapshot(tmp_path / 'parquet')
+        assert not (tmp_path / 'parquet').exists()
+
+    # Test getting a picklable spec of Results and building it
+    def test_spec(self):
+
+        # Create an instance of Results
+        SomeResults = cq.Results()
+
+        # Create a Table with one name missing and a Value
+        SomeTable = cq.Table(sheet='Some Sheet', start_cell='B4')
+        SomeTable.data['Name'] = ['a', None, 'b']
+        SomeTable.data['A'] = [1.0, 2.0, 4.0]
+        SomeValue = cq.Value(2, sheet='Some Sheet', start_cell='H2')
+
+        # Add the Table and Value to Results
+        SomeResults.add_table(SomeTable)
+        SomeResults.add_value(SomeValue)
+
+        # Add a Formula multiplying the Value by every row
+        SomeResults.add_formula(
+            cq.formula.FORMULA_MULTIPLICATION(SomeValue.insert(),
+                                              SomeTable.insert('A'),
+                                              'B', SomeTable.id))
+
+        # Add a Breakdown summing B by name
+        SomeBreakdown = cq.Breakdown(start_cell='B10', sheet='Some Sheet')
+        SomeResults.add_breakdown(SomeBreakdown)
+        SomeBreakdown.create_1D(SomeTable, 'Name', 'B')
+
+        # Get a spec of the Results and send it through pickle
+        SomeSpec = pickle.loads(pickle.dumps(SomeResults.to_spec(),
+                                             protocol=5))
+
+        # Check that numeric columns are kept as arrays
+        assert isinstance(SomeSpec.tables[SomeTable.id]['arrays'][1],
+                          np.ndarray)
+
+        # Build the spec
+        BuiltResults = SomeSpec.build()
+
+        # Check that the DataSets were built with their ids and data
+        assert BuiltResults._datasets[SomeTable.id].data.equals(
+            SomeTable.data)
+        assert BuiltResults._datasets[SomeValue.id].data == 2
+        assert BuiltResults._datasets[SomeBreakdown.id].data.equals(
+            SomeBreakdown.data)
+
+        # Check that the built Results are wired to recompute formulas
+        BuiltResults._datasets[SomeValue.id].data = 3
+        assert list(BuiltResults.evaluate()[SomeBreakdown.id].iloc[0]) == \
+            [3, 12]
@@ -22,6 +22,7 @@ Started 1-22-2026
 
 import chromaquant as cq
 import pandas as pd
+import pytest
 
 """ TEST CLASS """
 
@@ -205,3 +206,91 @@ class TestTable:
 
         # Assert that test_result is true
         assert test_result
+
+    # Test filtering method
+    def test_filter(self):
+
+        # Create a table
+        SomeTable = cq.Table(pd.DataFrame({'A': [1, 2, 3, 4, 5],
+                                           'B': ['x', 'y', 'x', None, 'z'],
+                                           'C': [1.0, None, 3.0, 4.0, 5.0]}))
+
+        # Filter using equality, membership, ranges, nulls and negation
+        filter_DF = SomeTable.filter({'A': {'between': (2, 5)},
+                                      'B': {'isin': ['x', 'z', None],
+                                            'not': 'z'},
+                                      'C': {'notna': True}})
+
+        # Check that only the expected rows were kept, in order
+        assert filter_DF['A'].tolist() == [3, 4]
+
+        # Check that plain values are treated as equality
+        assert SomeTable.filter({'B': 'x'})['A'].tolist() == [1, 3]
+
+        # Check that the Table's data is unchanged
+        assert len(SomeTable.data) == 5
+
+    # Test that membership filters reject strings
+    def test_filter_isin_string(self):
+
+        # Create a table
+        SomeTable = cq.Table(pd.DataFrame({'N': ['a', 'b', 'abc']}))
+
+        # Check that a string is not split into characters
+        for operator in ('isin', 'notin'):
+            with pytest.raises(ValueError):
+                SomeTable.filter({'N': {operator: 'abc'}})
+
+        # Check that a list holding the string keeps its row
+        assert SomeTable.filter({'N': {'isin': ['abc']}})['N'].tolist() == \
+            ['abc']
+
+    # Test matching method with a row filter and output columns
+    def test_match_filter(self):
+
+        # Create a table
+        SomeTable = cq.Table(pd.DataFrame({'A': [1, 2, 3, 4],
+                                           'B': ['x', 'y', 'x', 'x']}))
+        # Create data for matching
+        data_to_match = pd.DataFrame({'A': [1, 3, 4], 'C': [7, 9, 10]})
+        # Create match configuration
+        match_config = cq.MatchConfig(
+            local_filter_row={'B': 'x', 'A': {'lt': 4}},
+            output_cols_dict={'C': 'New C', 'A': 'New A', 'D': 'New D'})
+        # Add match condition
+        match_config.add_match_condition(match_config.IS_EQUAL, 'A')
+        # Run match function
+        match_data = SomeTable.match(data_to_match, match_config)
+
+        # Check the columns, rows and matched values
+        assert match_data.columns.tolist() == ['New C', 'New A', 'New D']
+        assert match_data['New A'].tolist() == [1, 3]
+        assert match_data['New C'].tolist() == [7, 9]
+        assert match_data['New D'].isna().all()
+
+        # Check that the Table's data is unchanged
+        assert SomeTable.data.columns.tolist() == ['A', 'B']
+
+    # Test that the cached reference follows changes to the Table
+    def test_reference_cache(self):
+
+        # Create a table
+        SomeTable = cq.Table(pd.DataFrame({'A': [1, 2, 3], 'B': [4, 5, 6]}),
+                             sheet='Some Sheet',
+                             start_cell='B2')
+
+        # Check that repeated reads return the cached reference
+        assert SomeTable.reference is SomeTable.reference
+        assert SomeTable.reference['B']['range'] == "'Some Sheet'!$C$3:$C$5"
+
+        # Check that in-place edits to the data are detected
+        SomeTable.data['C'] = [7, 8, 9]
+        assert SomeTable.reference['C']['column_letter'] == 'D'
+
+        # Check that header, start cell and sheet changes are detected
+        SomeTable.header = 'Some Header'
+        assert SomeTable.reference['A']['start_row'] == 4
+        SomeTable.start_cell = 'C3'
+        assert SomeTable.reference['A']['range'] == "'Some Sheet'!$C$5:$C$7"
+        SomeTable.sheet = 'Other Sheet'
+        assert SomeTable.reference['A']['sheet'] == 'Other Sheet'
@@ -21,6 +21,9 @@ Started 6-16-2026
 """
 
 import chromaquant as cq
+import json
+import os
+import pytest
 
 """ TEST CLASS """
 
@@ -34,3 +37,51 @@ class TestTheme:
         new_theme = cq.Theme()
 
         assert new_theme.header._alignment['horizontal'] == 'center'
+
+    # Test sharing the frozen default theme until a DataSet's theme is got
+    def test_default_theme_shared(self):
+
+        # Create two Values
+        SomeValue = cq.Value(1)
+        OtherValue = cq.Value(2)
+
+        # Check that both Values share the default theme when reporting
+        assert SomeValue.active_theme is OtherValue.active_theme
+
+        # Check that the shared default theme cannot be modified
+        with pytest.raises(AttributeError):
+            SomeValue.active_theme.header.font = {'bold': False}
+
+        # Modify one Value's theme
+        SomeValue.theme.header.font = {'bold': False}
+
+        # Check that only that Value got its own, modified theme
+        assert SomeValue.active_theme is not OtherValue.active_theme
+        assert SomeValue.active_theme.header._font == {'bold': False}
+        assert OtherValue.active_theme.header._font['bold']
+
+    # Test caching imported themes by path and modification time
+    def test_theme_import_cache(self, tmp_path):
+
+        # Write a theme
+        theme_path = tmp_path / 'some.cqtheme'
+        theme_path.write_text(json.dumps(
+            {'body': {'number_format': '0.00'}}))
+
+        # Import the theme and check it is applied
+        new_theme = cq.Theme()
+        new_theme.import_theme(theme_path)
+        assert new_theme.body.number_format == '0.00'
+
+        # Check that modifying the theme does not modify the cached theme
+        new_theme.body._font['bold'] = True
+        assert not cq.Theme().body._font['bold']
+
+        # Rewrite the theme with a later modification time
+        theme_path.write_text(json.dumps(
+            {'body': {'number_format': '0.000'}}))
+        os.utime(theme_path, ns=(0, os.stat(theme_path).st_mtime_ns + 1))
+
+        # Check that the rewritten theme is imported
+        new_theme.import_theme(theme_path)
+        assert new_theme.body.number_format == '0.000'
@@ -98,3 +98,15 @@ class TestValue:
 
         # Assert that test_result is true
         assert test_result
+
+    # Test that Values have no per-instance dictionary
+    def test_slots(self):
+
+        # Create a Value
+        SomeValue = cq.Value(1, start_cell='C3')
+
+        # Check that the Value has no dictionary and its reference is built
+        # when got
+        assert not hasattr(SomeValue, '__dict__')
+        assert SomeValue._reference is None
+        assert SomeValue.reference['data_cell'] == "'Sheet1'!$C$3"
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+
+UNIT TESTING FOR VALUEBLOCK
+
+"""
+
+import chromaquant as cq
+from io import BytesIO
+import numpy as np
+import openpyxl
+import pytest
+
+""" TEST CLASS """
+
+
+class TestValueBlock:
+
+    # Test storing values in one array
+    def test_value_block_init(self):
+
+        # Create a ValueBlock
+        SomeBlock = cq.ValueBlock([1, 2, 4], names=['a', 'b', 'c'])
+
+        # Check the values, names and positional access
+        assert isinstance(SomeBlock.values, np.ndarray)
+        assert SomeBlock.values.dtype == float
+        assert SomeBlock.names == ['a', 'b', 'c']
+        assert len(SomeBlock) == 3 and SomeBlock[2] == 4
+
+        # Set a value and check it is stored
+        SomeBlock[1] = 3
+        assert list(SomeBlock.values) == [1, 3, 4]
+
+        # Check that mismatched names and values are rejected
+        with pytest.raises(ValueError):
+            cq.ValueBlock([1, 2], names=['a'])
+
+    # Test reporting a ValueBlock as a contiguous range
+    def test_value_block_report(self):
+
+        # Create an instance of Results
+        SomeResults = cq.Results()
+
+        # Create a ValueBlock and a Value doubling its second value
+        SomeBlock = cq.ValueBlock([1.5, 2.5], names=['a', 'b'],
+                                  sheet='Some Sheet', start_cell='B2',
+                                  header='Areas')
+        SomeValue = cq.Value(sheet='Some Sheet', start_cell='F2')
+
+        # Add the ValueBlock and Value to Results
+        SomeResults.add_table(SomeBlock)
+        SomeResults.add_value(SomeValue)
+
+        # Check that the second value's cell is inserted
+        assert SomeBlock.cell(1) == \
+            f'|table: {SomeBlock.id}, key: Value, row: 1|'
+        with pytest.raises(IndexError):
+            SomeBlock.cell(2)
+
+        # Add a Formula doubling the second value
+        SomeResults.add_formula(cq.Formula(f'={SomeBlock.cell(1)}*2',
+                                           key_pointer=SomeValue.id))
+
+        # Check that the formula refers to the second value's cell and is
+        # evaluated from the ValueBlock
+        assert SomeValue.data == "='Some Sheet'!$C$5*2"
+        assert SomeResults.evaluate()[SomeValue.id] == 5
+
+        # Move the ValueBlock and check that the formula follows it
+        SomeBlock.sheet = 'Other Sheet'
+        assert SomeValue.data == "='Other Sheet'!$C$5*2"
+
+        # Report the Results and check the values are contiguous and the
+        # formula's cached result
+        output = BytesIO()
+        SomeResults.report_results(output)
+        workbook = openpyxl.load_workbook(output, data_only=True)
+        assert [[cell.value for cell in row]
+                for row in workbook['Other Sheet']['B4:C5']] == \
+            [['a', 1.5], ['b', 2.5]]
+        assert workbook['Some Sheet']['F2'].value == 5